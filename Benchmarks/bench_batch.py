@@ -0,0 +1,85 @@
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SubmissionDirectory = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission')
+sys.path.insert(0, SubmissionDirectory)
+
+import batch_ as batch
+import generators_ as generators
+
+
+def write_programs(directory, count, size):
+    """
+    Write small generated programs to a directory, every one different
+    :param directory: String
+    :param count: Integer
+    :param size: Integer, bytes per program
+    :return: List[String]
+    """
+    paths = []
+    for idx in range(count):
+        path = os.path.join(directory, f"program_{idx:06}.txt")
+        with open(path, 'w') as file:
+            file.write(f"first = {idx}\n" + generators.mixed_program(size))
+        paths.append(path)
+    return paths
+
+
+def time_processes(paths):
+    """
+    Time running each program in a fresh 'python main.py' process, per program
+    :param paths: List[String]
+    :return: Float
+    """
+    start = time.perf_counter()
+    for path in paths:
+        subprocess.run([sys.executable, os.path.join(SubmissionDirectory, 'main.py'), '--no-cache', path],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) / len(paths)
+
+
+def time_batch(paths, jobs):
+    """
+    Time running every program with a BatchRunner once its workers are started, per program
+    :param paths: List[String]
+    :param jobs: Integer
+    :return: Float
+    """
+    runner = batch.BatchRunner(jobs, use_cache=False)
+    try:
+        runner.start()
+        start = time.perf_counter()
+        for _ in runner.run(paths):
+            pass
+        return (time.perf_counter() - start) / len(paths)
+    finally:
+        runner.close()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare programs per second of a process per program "
+                                                     "with the BatchRunner per number of workers")
+    arg_parser.add_argument('--programs', type=int, default=2000, help="Number of programs")
+    arg_parser.add_argument('--size', type=int, default=2000, help="Bytes per program")
+    arg_parser.add_argument('--workers', type=int, action='append',
+                            help="Worker processes, may be repeated (default: 1 and powers of 2 up to the CPU count)")
+    args = arg_parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        program_paths = write_programs(directory, args.programs, args.size)
+        workers_counts = args.workers or [2 ** power for power in range((os.cpu_count() or 1).bit_length())]
+
+        print(f"CPUs: {os.cpu_count()}, programs: {args.programs} of {args.size} bytes")
+        print(f"{'runner':>12} {'programs/s':>12}")
+        # Fresh processes are slow, a sample is enough
+        print(f"{'main.py':>12} {1 / time_processes(program_paths[:50]):>12.1f}")
+        for workers in workers_counts:
+            print(f"{f'batch x{workers}':>12} {1 / time_batch(program_paths, workers):>12.1f}")
+    finally:
+        shutil.rmtree(directory)
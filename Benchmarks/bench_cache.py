@@ -0,0 +1,79 @@
+import argparse
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import cache_ as cache
+import interpreter_ as interpreter
+import generators_ as generators
+
+
+def time_parse(prog_interpreter, program):
+    """
+    Time parsing a program through the Interpreter
+    :param prog_interpreter: Interpreter
+    :param program: String
+    :return: Float
+    """
+    prog_interpreter.variables = dict()
+    start = time.perf_counter()
+    prog_interpreter.parse(program)
+    return time.perf_counter() - start
+
+
+def time_execute(prog_interpreter, program, repeat):
+    """
+    Time executing a program repeatedly without its printed output, per execute
+    :param prog_interpreter: Interpreter
+    :param program: String
+    :param repeat: Integer
+    :return: Float
+    """
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            prog_interpreter.execute(program)
+        return (time.perf_counter() - start) / repeat
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare parsing a program with loading it from the ProgramCache, "
+                                                     "and executing a recurring program with the ParseCache")
+    arg_parser.add_argument('--lines', type=int, action='append', help="Number of statements, may be repeated "
+                                                                       "(default: 1000, 10000 and 50000)")
+    arg_parser.add_argument('--repeat', type=int, default=1000, help="Executions of the recurring program")
+    args = arg_parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        print(f"{'lines':>8} {'parse s':>10} {'store s':>10} {'load s':>10} {'KB':>8} {'speedup':>8}")
+        for lines in args.lines or [1000, 10000, 50000]:
+            program = generators.arithmetic_program(lines)
+            prog_cache = cache.ProgramCache(directory)
+            parse_seconds = time_parse(interpreter.Interpreter(), program)
+
+            # First cached parse is a miss that stores the program, the second loads it
+            prog_interpreter = interpreter.Interpreter(cache=prog_cache)
+            store_seconds = time_parse(prog_interpreter, program) - parse_seconds
+            load_seconds = time_parse(prog_interpreter, program)
+
+            size = os.path.getsize(prog_cache.get_path(prog_cache.get_key(program, (False,))))
+            print(f"{lines:>8} {parse_seconds:>10.3f} {store_seconds:>10.3f} {load_seconds:>10.3f} "
+                  f"{size / 1024:>8.0f} {parse_seconds / load_seconds:>7.1f}x")
+    finally:
+        shutil.rmtree(directory)
+
+    # Small program executed again and again, as by a service
+    program = generators.mixed_program(1000)
+    print(f"\n{'engine':>8} {'us/execute':>12} {'cached':>12} {'speedup':>8}")
+    for engine in interpreter.Engines:
+        seconds = time_execute(interpreter.Interpreter(engine=engine), program, args.repeat)
+        parse_cache = cache.ParseCache()
+        cached_seconds = time_execute(interpreter.Interpreter(engine=engine, parse_cache=parse_cache), program,
+                                      args.repeat)
+        print(f"{engine:>8} {seconds * 1e6:>12.1f} {cached_seconds * 1e6:>12.1f} {seconds / cached_seconds:>7.1f}x")
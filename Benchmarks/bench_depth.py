@@ -0,0 +1,89 @@
+import argparse
+import contextlib
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import lexer_ as lexer
+import parser_ as parser
+import generators_ as generators
+
+# AST depths from 10 to 1 million
+DEPTHS = [10, 100, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+# Tree walking engines, recursive and with an explicit work stack
+WalkEngines = ['tree', 'stack']
+
+# Single expression generators by shape, each operator is one level deeper
+Shapes = {
+    'chain': generators.operator_chain,
+    'parens': generators.nested_parens,
+}
+
+
+def parse_program(program):
+    """
+    Parse a program into its AST, without timing it
+    :param program: String
+    :return: List[Node]
+    """
+    return parser.Parser().parse(program, lexer.Lexer().tokenize(program))
+
+
+def time_walk(engine, ast, repeat):
+    """
+    Time walking an AST with an engine, per run
+    :param engine: String
+    :param ast: List[Node]
+    :param repeat: Integer
+    :return: Float, or None if the recursion limit is reached
+    """
+    prog_interpreter = interpreter.Interpreter(engine=engine)
+    program = prog_interpreter.compile(ast)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        try:
+            for _ in range(repeat):
+                prog_interpreter.run(program)
+        except RecursionError:
+            return None
+        return (time.perf_counter() - start) / repeat
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare the recursive and work stack tree walkers "
+                                                     "over expressions from 10 to 1 million levels deep")
+    arg_parser.add_argument('--max-depth', type=int, default=DEPTHS[-1], help="Deepest expression")
+    arg_parser.add_argument('--recursion-limit', type=int, help="Raise the recursion limit of the recursive walker, "
+                                                                "may crash the process on deep expressions")
+    args = arg_parser.parse_args()
+
+    if args.recursion_limit:
+        sys.setrecursionlimit(args.recursion_limit)
+
+    # The recursion limit applies as configured, the work stack walker does not depend on it
+    print(f"Recursion limit: {sys.getrecursionlimit()}")
+    print(f"{'shape':>8} {'depth':>10} " + " ".join(f"{engine + ' ns/node':>16}" for engine in WalkEngines))
+    for shape, generator in Shapes.items():
+        for depth in DEPTHS:
+            if depth > args.max_depth:
+                break
+            ast = parse_program(generator(depth))
+            nodes = 2 * depth + 1
+            # Repeat shallow walks so every depth runs for a similar time
+            repeat = max(10 ** 6 // nodes, 1)
+
+            # The AST is only freed at the end, pause the cyclic GC rescanning it
+            gc.disable()
+            try:
+                seconds = [time_walk(engine, ast, repeat) for engine in WalkEngines]
+            finally:
+                gc.enable()
+
+            columns = [f"{'RecursionError':>16}" if walk_seconds is None else f"{walk_seconds / nodes * 1e9:>16.1f}"
+                       for walk_seconds in seconds]
+            print(f"{shape:>8} {depth:>10} " + " ".join(columns))
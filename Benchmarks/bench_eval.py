@@ -0,0 +1,63 @@
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import generators_ as generators
+
+# Generated programs to time
+Programs = {
+    'arithmetic': generators.arithmetic_program,
+    'temporaries': generators.temporaries_program,
+}
+
+
+def time_eval(prog_interpreter, ast, repeat):
+    """
+    Time compiling a parsed program once, then running it without its printed output, best of repeat runs
+    :param prog_interpreter: Interpreter
+    :param ast: List[Node]
+    :param repeat: Integer
+    :return: (Float, Float)
+    """
+    start = time.perf_counter()
+    program = prog_interpreter.compile(ast)
+    compile_seconds = time.perf_counter() - start
+
+    best = None
+    for _ in range(repeat):
+        prog_interpreter.variables = dict()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            prog_interpreter.run(program)
+            seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return compile_seconds, best
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Time Interpreter evaluation of an arithmetic-heavy program")
+    arg_parser.add_argument('--program', default='arithmetic', choices=list(Programs),
+                            help="Generated program (default: arithmetic)")
+    arg_parser.add_argument('--lines', type=int, default=100000, help="Number of statements in the program")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement, the best is kept")
+    arg_parser.add_argument('--engine', action='append', choices=interpreter.Engines,
+                            help="Engine to time, may be repeated (default: every engine)")
+    arg_parser.add_argument('--optimize', action='store_true', help="Optimize the AST before compiling it")
+    args = arg_parser.parse_args()
+
+    program = Programs[args.program](args.lines)
+    lines = program.count('\n')
+    baseline = None
+    for engine in args.engine or interpreter.Engines:
+        prog_interpreter = interpreter.Interpreter(engine=engine, optimize=args.optimize)
+        ast = prog_interpreter.parse(program)
+
+        compile_seconds, seconds = time_eval(prog_interpreter, ast, args.repeat)
+        baseline = baseline or seconds
+        print(f"{engine:>10}: {len(ast)} statements, compile {compile_seconds:.3f} s, run {seconds:.3f} s, "
+              f"{seconds / lines * 1e6:.2f} us/line, {baseline / seconds:.2f}x")
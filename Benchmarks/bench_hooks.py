@@ -0,0 +1,87 @@
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import generators_ as generators
+import hooks_ as hooks
+import sink_ as sink
+
+
+def ignore_event(*_):
+    """
+    Hook callback doing nothing, so a hooked run only measures emitting events
+    :return: Nothing
+    """
+
+
+def create_interpreter(engine, mode):
+    """
+    Create an Interpreter in one of the measured hook modes
+    :param engine: String
+    :param mode: String, 'no hooks', 'hooks removed' (every event registered then removed) or 'no-op hooks'
+    :return: Interpreter
+    """
+    prog_interpreter = interpreter.Interpreter(engine=engine, output=sink.MemorySink())
+    if mode != 'no hooks':
+        for event in hooks.Events:
+            prog_interpreter.add_hook(event, ignore_event)
+    if mode == 'hooks removed':
+        for event in hooks.Events:
+            prog_interpreter.remove_hook(event, ignore_event)
+    return prog_interpreter
+
+
+def time_execute(engine, mode, source, repeat):
+    """
+    Time executing a program, every run in a new Interpreter
+    :param engine: String
+    :param mode: String, see create_interpreter
+    :param source: String
+    :param repeat: Integer
+    :return: List[Float], seconds of each run sorted
+    """
+    times = []
+    for _ in range(repeat):
+        prog_interpreter = create_interpreter(engine, mode)
+        # Garbage of earlier runs is collected outside of the timed run
+        gc.collect()
+        start = time.perf_counter()
+        prog_interpreter.execute(source)
+        times.append(time.perf_counter() - start)
+    return sorted(times)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Execute time without hooks, after every hook was removed, "
+                                                     "and with a no-op hook on every event. The disabled cost is "
+                                                     "the difference between the first two, against the noise "
+                                                     "between runs without hooks")
+    arg_parser.add_argument('--lines', type=int, default=20000, help="Number of statements in the program")
+    arg_parser.add_argument('--repeat', type=int, default=9, help="Runs per measurement, the best is kept")
+    arg_parser.add_argument('--engine', action='append', choices=interpreter.Engines,
+                            help="Engine to time, may be repeated (default: every engine)")
+    args = arg_parser.parse_args()
+
+    source = generators.arithmetic_program(args.lines)
+
+    print(f"{'engine':>10} {'no hooks s':>11} {'noise':>7} {'removed s':>10} {'disabled':>9} {'no-op hooks s':>14}")
+    for engine in args.engine or interpreter.Engines:
+        # Runs of each mode alternate, in a rotating order, so drift in the machine's speed affects them alike
+        modes = ['no hooks', 'hooks removed', 'no-op hooks']
+        times = {mode: [] for mode in modes}
+        for run in range(args.repeat):
+            for mode in modes[run % len(modes):] + modes[:run % len(modes)]:
+                times[mode] += time_execute(engine, mode, source, 1)
+        best = {mode: min(seconds) for mode, seconds in times.items()}
+
+        # Noise is how much slower the median run without hooks is than the best
+        plain = sorted(times['no hooks'])
+        noise = plain[len(plain) // 2] / plain[0] - 1
+        disabled = best['hooks removed'] / best['no hooks'] - 1
+        print(f"{engine:>10} {best['no hooks']:>11.4f} {noise:>7.1%} {best['hooks removed']:>10.4f} "
+              f"{disabled:>+9.1%} {best['no-op hooks']:>14.4f}")
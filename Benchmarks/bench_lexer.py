@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import lexer_ as lexer
+import generators_ as generators
+
+# Input sizes from 1 KB to 100 MB
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8]
+
+
+def time_scan(text):
+    """
+    Time a full cursor pass of the Lexer over text without storing Tokens
+    :param text: String
+    :return: (Float, Integer)
+    """
+    lex = lexer.Lexer()
+    lex.text = text
+    lex.idx = 0
+    text_len = len(text)
+    count = 0
+
+    start = time.perf_counter()
+    while lex.idx < text_len:
+        if lex.get_next_identifier():
+            count += 1
+    return time.perf_counter() - start, count
+
+
+def time_tokenize(text):
+    """
+    Time Lexer.tokenize over text
+    :param text: String
+    :return: (Float, Integer)
+    """
+    start = time.perf_counter()
+    tokens = lexer.Lexer().tokenize(text)
+    return time.perf_counter() - start, len(tokens)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Show how Lexer time scales with program size")
+    arg_parser.add_argument('--max-size', type=int, default=SIZES[-1], help="Largest program size in bytes")
+    arg_parser.add_argument('--tokenize', action='store_true',
+                            help="Time Lexer.tokenize, including Token objects (needs memory for every Token)")
+    args = arg_parser.parse_args()
+
+    bench = time_tokenize if args.tokenize else time_scan
+    print(f"{'bytes':>12} {'tokens':>12} {'seconds':>10} {'ns/byte':>10}")
+    for size in SIZES:
+        if size > args.max_size:
+            break
+        program = generators.mixed_program(size)
+        seconds, tokens = bench(program)
+        # Linear scaling keeps ns/byte flat as size grows
+        print(f"{len(program):>12} {tokens:>12} {seconds:>10.3f} {seconds / len(program) * 1e9:>10.1f}")
@@ -0,0 +1,121 @@
+import argparse
+import json
+import mmap
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import generators_ as generators
+import interpreter_ as interpreter
+import sink_ as sink
+
+# Ways of reading and executing a program file, each measured in a process of its own
+MODES = {
+    'readlines + join': "the whole file read into a String, as main.py did, then executed statement by statement",
+    'line stream': "the file read line by line and executed statement by statement",
+    'mmap stream': "the file memory-mapped and executed statement by statement, Tokens scanned from the mapping",
+    'readlines, parsed': "the whole file read into a String, tokenized into a List of Tokens and parsed into an AST",
+    'mmap, parsed': "the file memory-mapped, tokenized into a TokenBuffer of offsets into it and parsed into an AST",
+}
+
+
+def run_mode(mode, path):
+    """
+    Execute a program file in one of MODES, printing nothing
+    :param mode: String
+    :param path: String
+    :return: Nothing
+    """
+    prog_interpreter = interpreter.Interpreter(output=sink.FileSink(os.devnull))
+
+    if mode in ('readlines + join', 'readlines, parsed'):
+        with open(path, 'r') as file:
+            text = "".join(file.readlines())
+        if mode == 'readlines, parsed':
+            prog_interpreter.execute(text)
+        else:
+            prog_interpreter.execute_stream([text])
+
+    elif mode == 'line stream':
+        with open(path, 'r') as file:
+            prog_interpreter.execute_stream(file)
+
+    else:
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            prog_interpreter.execute_mapped(source, stream=mode == 'mmap stream')
+
+
+def get_peak_rss():
+    """
+    Peak resident memory of this process in MB. VmHWM starts again at exec, unlike ru_maxrss which keeps
+    the peak of the process it was forked from
+    :return: Float
+    """
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Reported in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure_mode(mode, path):
+    """
+    Execute a program file in a new process, so its peak resident memory is its own
+    :param mode: String, one of MODES, or None for an Interpreter that executes nothing
+    :param path: String
+    :return: (Float, Float), seconds and peak RSS in MB
+    """
+    command = [sys.executable, os.path.abspath(__file__), '--child', path]
+    if mode is not None:
+        command += ['--mode', mode]
+    result = json.loads(subprocess.run(command, capture_output=True, check=True, text=True).stdout)
+    return result['seconds'], result['max_rss_mb']
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare peak resident memory of reading a program file into "
+                                                     "Strings against memory-mapping it")
+    arg_parser.add_argument('--size', type=int, default=20 * 10 ** 6, help="Program size in bytes (default: 20 MB)")
+    arg_parser.add_argument('--parsed-size', type=int, default=2 * 10 ** 6,
+                            help="Program size in bytes of the modes keeping the whole AST (default: 2 MB)")
+    arg_parser.add_argument('--child', help=argparse.SUPPRESS)
+    arg_parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    # Measured process
+    if args.child:
+        start = time.perf_counter()
+        if args.mode is not None:
+            run_mode(args.mode, args.child)
+        seconds = time.perf_counter() - start
+        print(json.dumps({'seconds': seconds, 'max_rss_mb': get_peak_rss()}))
+        sys.exit()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = dict()
+        for size in (args.size, args.parsed_size):
+            paths[size] = os.path.join(temp_dir, f"program_{size}.txt")
+            with open(paths[size], 'w') as file:
+                file.write(generators.mixed_program(size))
+
+        # Memory of the Python process and the imported modules alone
+        _, base_mb = measure_mode(None, paths[args.size])
+        print(f"Interpreter process without a program: {base_mb:.1f} MB peak RSS")
+        for mode, description in MODES.items():
+            print(f"  {mode}: {description}")
+
+        print(f"{'mode':>20} {'file MB':>10} {'seconds':>10} {'peak RSS MB':>12} {'above base MB':>14}")
+        for mode in MODES:
+            path = paths[args.parsed_size if mode.endswith('parsed') else args.size]
+            seconds, rss_mb = measure_mode(mode, path)
+            file_mb = os.path.getsize(path) / 2 ** 20
+            print(f"{mode:>20} {file_mb:>10.1f} {seconds:>10.2f} {rss_mb:>12.1f} {rss_mb - base_mb:>14.1f}")
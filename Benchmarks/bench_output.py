@@ -0,0 +1,84 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import sink_ as sink
+import generators_ as generators
+
+
+class PrintSink(sink.OutputSink):
+    """
+    Sink calling the builtin print() once per line, as the Interpreter printed before OutputSinks
+    """
+
+    def write_line(self, line):
+        print(line)
+
+
+def create_sinks(directory):
+    """
+    Create the sinks to time, by name
+    :param directory: String, where file sinks write
+    :return: Dict[String, Function() -> OutputSink]
+    """
+    return {
+        'print()': PrintSink,
+        'stdout, every line': lambda: sink.StdoutSink(0),
+        'stdout, buffered': sink.StdoutSink,
+        'file, buffered': lambda: sink.FileSink(os.path.join(directory, 'output.txt')),
+        'memory, List': sink.MemorySink,
+        'memory, StringIO': lambda: sink.MemorySink(io.StringIO()),
+    }
+
+
+def time_sink(create_sink, prog_interpreter, compiled, repeat):
+    """
+    Time running a compiled program printing to a new sink, with the standard output sent to the null device
+    and flushed on every line break like a terminal, best of repeat runs
+    :param create_sink: Function() -> OutputSink
+    :param prog_interpreter: Interpreter
+    :param compiled: List, Bytecode, ClosureProgram or PythonProgram
+    :param repeat: Integer
+    :return: Float
+    """
+    best = None
+    for _ in range(repeat):
+        prog_interpreter.output = output = create_sink()
+        prog_interpreter.variables = dict()
+        with open(os.devnull, 'w', buffering=1) as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            prog_interpreter.run(compiled)
+            output.close()
+            seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Time the print throughput of a print-heavy program per sink")
+    arg_parser.add_argument('--lines', type=int, default=200000, help="Number of statements in the program")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Runs per measurement, the best is kept")
+    arg_parser.add_argument('--engine', default='vm', choices=interpreter.Engines,
+                            help="Engine running the program (default: vm)")
+    args = arg_parser.parse_args()
+
+    program = generators.print_program(args.lines)
+    printed = sum(1 for line in program.splitlines() if line.startswith('print'))
+    # Compiled programs write to the sink of the Interpreter running them
+    bench_interpreter = interpreter.Interpreter(engine=args.engine)
+    bench_program = bench_interpreter.compile(bench_interpreter.parse(program))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"{'sink':>20} {'seconds':>10} {'lines/s':>12} {'speedup':>10}")
+        baseline = None
+        for name, sink_factory in create_sinks(temp_dir).items():
+            sink_seconds = time_sink(sink_factory, bench_interpreter, bench_program, args.repeat)
+            baseline = baseline or sink_seconds
+            print(f"{name:>20} {sink_seconds:>10.3f} {printed / sink_seconds:>12.0f} {baseline / sink_seconds:>9.2f}x")
@@ -0,0 +1,63 @@
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import lexer_ as lexer
+import parallel_ as parallel
+import parser_ as parser
+import generators_ as generators
+
+
+def time_sequential(program):
+    """
+    Time tokenizing and parsing a program in this process
+    :param program: String
+    :return: (Float, Integer), seconds and number of statements
+    """
+    start = time.perf_counter()
+    ast = parser.Parser().parse(program, lexer.Lexer().tokenize(program))
+    return time.perf_counter() - start, len(ast)
+
+
+def time_parallel(program, workers):
+    """
+    Time tokenizing and parsing a program with a ParallelParser, once its worker processes are started
+    :param program: String
+    :param workers: Integer
+    :return: (Float, Integer), seconds and number of statements
+    """
+    prog_parallel = parallel.ParallelParser(workers)
+    try:
+        # Start the workers on a small program first, so only parsing is timed
+        prog_parallel.parse(program[:program.find('\n', 2 * workers * parallel.MinChunkSize) + 1])
+        start = time.perf_counter()
+        ast = prog_parallel.parse(program)
+        return time.perf_counter() - start, len(ast)
+    finally:
+        prog_parallel.close()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Show how tokenizing and parsing a large program scales "
+                                                     "with the number of worker processes")
+    arg_parser.add_argument('--size', type=int, default=10 ** 7, help="Program size in bytes (default: 10 MB)")
+    arg_parser.add_argument('--workers', type=int, action='append',
+                            help="Worker processes, may be repeated (default: powers of 2 up to the CPU count)")
+    args = arg_parser.parse_args()
+
+    program = generators.mixed_program(args.size)
+    workers_counts = args.workers or [2 ** power for power in range(1, (os.cpu_count() or 1).bit_length())]
+
+    # The AST is only freed at the end, pause the cyclic GC rescanning it
+    gc.disable()
+    print(f"CPUs: {os.cpu_count()}, program: {len(program)} bytes")
+    print(f"{'workers':>8} {'seconds':>10} {'statements':>12} {'speedup':>8}")
+    sequential_seconds, statements = time_sequential(program)
+    print(f"{1:>8} {sequential_seconds:>10.3f} {statements:>12} {1:>7.1f}x")
+    for workers in workers_counts:
+        seconds, statements = time_parallel(program, workers)
+        print(f"{workers:>8} {seconds:>10.3f} {statements:>12} {sequential_seconds / seconds:>7.1f}x")
@@ -0,0 +1,52 @@
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import lexer_ as lexer
+import parser_ as parser
+import generators_ as generators
+
+# Operators per expression from 1 thousand to 1 million
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+# Single expression generators by shape
+Shapes = {
+    'chain': generators.operator_chain,
+    'parens': generators.nested_parens,
+}
+
+
+def time_parse(program):
+    """
+    Time Parser.parse over the Tokens of a program, the cyclic GC is paused so only parsing is timed
+    :param program: String
+    :return: (Float, Integer), seconds and number of Tokens
+    """
+    tokens = lexer.Lexer().tokenize(program)
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        parser.Parser().parse(program, tokens)
+        return time.perf_counter() - start, len(tokens)
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Show how Parser time scales with the length and nesting "
+                                                     "of a single expression")
+    arg_parser.add_argument('--max-size', type=int, default=SIZES[-1], help="Most operators per expression")
+    args = arg_parser.parse_args()
+
+    print(f"{'shape':>8} {'operators':>10} {'tokens':>10} {'seconds':>10} {'ns/token':>10}")
+    for shape, generator in Shapes.items():
+        for size in SIZES:
+            if size > args.max_size:
+                break
+            seconds, tokens = time_parse(generator(size))
+            # Linear scaling keeps ns/token flat as size grows, whatever the nesting
+            print(f"{shape:>8} {size:>10} {tokens:>10} {seconds:>10.3f} {seconds / tokens * 1e9:>10.1f}")
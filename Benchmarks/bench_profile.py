@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import generators_ as generators
+import sink_ as sink
+
+
+def time_execute(engine, source, profile, repeat):
+    """
+    Time executing a program, best of repeat runs
+    :param engine: String
+    :param source: String
+    :param profile: Boolean
+    :param repeat: Integer
+    :return: (Float, Interpreter), seconds and the Interpreter of the last run
+    """
+    best = None
+    for _ in range(repeat):
+        prog_interpreter = interpreter.Interpreter(engine=engine, output=sink.MemorySink(), profile=profile)
+        start = time.perf_counter()
+        prog_interpreter.execute(source)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, prog_interpreter
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Time executing a program with and without profiling, "
+                                                     "and show the profile of the last run")
+    arg_parser.add_argument('--lines', type=int, default=50000, help="Number of statements in the program")
+    arg_parser.add_argument('--variables', type=int, default=20, help="Number of Variables in the program")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement, the best is kept")
+    arg_parser.add_argument('--engine', action='append', choices=interpreter.Engines,
+                            help="Engine to time, may be repeated (default: every engine)")
+    args = arg_parser.parse_args()
+
+    source = generators.variables_program(args.lines, args.variables)
+    profiled = None
+
+    print(f"{'engine':>10} {'execute s':>10} {'profiled s':>11} {'overhead':>9}")
+    for engine in args.engine or interpreter.Engines:
+        seconds, _ = time_execute(engine, source, False, args.repeat)
+        profiled_seconds, profiled = time_execute(engine, source, True, args.repeat)
+        print(f"{engine:>10} {seconds:>10.3f} {profiled_seconds:>11.3f} {profiled_seconds / seconds:>8.2f}x")
+
+    print()
+    print(profiled.profiler.format_report(hot_lines=10))
@@ -0,0 +1,130 @@
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+SUBMISSION = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission')
+sys.path.insert(0, SUBMISSION)
+
+import generators_ as generators
+
+# Distinct programs requested in turn, small like most programs sent to a server
+PROGRAMS = [generators.arithmetic_program(lines) for lines in (10, 20, 40, 80)]
+
+
+def summarize(latencies):
+    """
+    Requests per second and latency percentiles of sequential requests
+    :param latencies: List[Float], seconds of each request
+    :return: (Float, Float, Float), requests/s, p50 and p99 milliseconds
+    """
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[min(len(ordered) - 1, len(ordered) * 99 // 100)]
+    return len(latencies) / sum(latencies), p50 * 1e3, p99 * 1e3
+
+
+def time_processes(requests, directory):
+    """
+    Time running main.py in a new process per program
+    :param requests: Integer
+    :param directory: String, where program files are written
+    :return: List[Float]
+    """
+    paths = []
+    for idx, program in enumerate(PROGRAMS):
+        paths.append(os.path.join(directory, f"program_{idx}.txt"))
+        with open(paths[-1], 'w') as file:
+            file.write(program)
+
+    latencies = []
+    for idx in range(requests):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(SUBMISSION, 'main.py'), paths[idx % len(paths)], '--no-cache'],
+                       stdout=subprocess.DEVNULL, check=True)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def time_requests(send_line, receive_line, requests):
+    """
+    Time sequential requests to a running server, each sent once the previous response is read
+    :param send_line: Function(String) -> None
+    :param receive_line: Function() -> String
+    :param requests: Integer
+    :return: List[Float]
+    """
+    latencies = []
+    for idx in range(requests):
+        line = json.dumps({'id': idx, 'source': PROGRAMS[idx % len(PROGRAMS)]}) + "\n"
+        start = time.perf_counter()
+        send_line(line)
+        response = json.loads(receive_line())
+        latencies.append(time.perf_counter() - start)
+        if response['status'] != 'ok':
+            raise SystemExit(f"Request failed: {response['error']}")
+    return latencies
+
+
+def time_stdin_server(requests):
+    """
+    Time requests to a server reading stdin and writing stdout
+    :param requests: Integer
+    :return: List[Float]
+    """
+    server = subprocess.Popen([sys.executable, os.path.join(SUBMISSION, 'server_.py')], stdin=subprocess.PIPE,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        def send_line(line):
+            server.stdin.write(line)
+            server.stdin.flush()
+        return time_requests(send_line, server.stdout.readline, requests)
+    finally:
+        server.stdin.close()
+        server.wait()
+
+
+def time_socket_server(requests, directory):
+    """
+    Time requests to a server on a Unix domain socket, over one connection
+    :param requests: Integer
+    :param directory: String, where the socket is created
+    :return: List[Float]
+    """
+    path = os.path.join(directory, 'server.sock')
+    server = subprocess.Popen([sys.executable, os.path.join(SUBMISSION, 'server_.py'), '--socket', path],
+                              stderr=subprocess.DEVNULL)
+    try:
+        while not os.path.exists(path):
+            time.sleep(0.01)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(path)
+            reader = connection.makefile('r')
+            return time_requests(lambda line: connection.sendall(line.encode()), reader.readline, requests)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare a process per program against requests to a server "
+                                                     "over stdin or a Unix domain socket")
+    arg_parser.add_argument('--requests', type=int, default=5000, help="Requests sent to each server")
+    arg_parser.add_argument('--processes', type=int, default=50, help="Programs run in a process each")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = {
+            'process per program': time_processes(args.processes, temp_dir),
+            'server, stdin': time_stdin_server(args.requests),
+            'server, socket': time_socket_server(args.requests, temp_dir),
+        }
+
+    print(f"{'mode':>20} {'requests':>10} {'requests/s':>12} {'p50 ms':>10} {'p99 ms':>10}")
+    for mode, mode_latencies in results.items():
+        per_second, p50_ms, p99_ms = summarize(mode_latencies)
+        print(f"{mode:>20} {len(mode_latencies):>10} {per_second:>12.1f} {p50_ms:>10.3f} {p99_ms:>10.3f}")
@@ -0,0 +1,172 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import generators_ as generators
+import lexer_ as lexer
+import parser_ as parser
+import sink_ as sink
+
+# Generated programs of the suite, each a Function(Integer) -> String of that many lines
+Workloads = {
+    'arithmetic chains': generators.chain_program,
+    'deep parentheses': generators.parens_program,
+    'del churn': generators.del_churn_program,
+    'string concatenation': generators.string_program,
+    'boolean logic': generators.boolean_program,
+    'print output': generators.print_program,
+}
+
+# Stages timed separately, evaluation includes compiling for the engine
+Stages = ['lex', 'parse', 'eval']
+
+# Relative slowdown of a stage flagged as a regression by compare
+DefaultThreshold = 0.1
+
+
+def time_best(function, repeat):
+    """
+    Time a function, best of repeat runs
+    :param function: Function() -> Any
+    :param repeat: Integer
+    :return: (Float, Any), seconds and the result of the last run
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def time_stages(engine, source, repeat):
+    """
+    Time lexing, parsing and evaluating a program separately, each stage from the result of the one before
+    :param engine: String
+    :param source: String
+    :param repeat: Integer
+    :return: Dict[String, Float], seconds of each stage
+    """
+    prog_lexer = lexer.Lexer()
+    prog_parser = parser.Parser()
+    lex_seconds, tokens = time_best(lambda: prog_lexer.tokenize(source), repeat)
+    parse_seconds, ast = time_best(lambda: prog_parser.parse(source, tokens), repeat)
+
+    def evaluate():
+        # Printed lines are kept in memory, so output is timed without the terminal
+        prog_interpreter = interpreter.Interpreter(engine=engine, output=sink.MemorySink())
+        prog_interpreter.evaluate(ast)
+
+    eval_seconds, _ = time_best(evaluate, repeat)
+    return {'lex': lex_seconds, 'parse': parse_seconds, 'eval': eval_seconds}
+
+
+def run_suite(engine, sizes, workloads, repeat):
+    """
+    Time every stage of every workload at every size
+    :param engine: String
+    :param sizes: List[Integer], program sizes in lines
+    :param workloads: List[String], keys of Workloads
+    :param repeat: Integer
+    :return: Dict, the suite's parameters and a result per workload, size and stage
+    """
+    results = []
+    for workload in workloads:
+        for lines in sizes:
+            stages = time_stages(engine, Workloads[workload](lines), repeat)
+            for stage in Stages:
+                results.append({'workload': workload, 'lines': lines, 'stage': stage, 'seconds': stages[stage]})
+                print(f"{workload:>22} {lines:>8} {stage:>6} {stages[stage]:>10.4f}", file=sys.stderr)
+
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'engine': engine,
+        'sizes': sizes,
+        'workloads': workloads,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold):
+    """
+    Compare the results of two runs of the suite, stage by stage
+    :param baseline: Dict, from run_suite
+    :param current: Dict, from run_suite
+    :param threshold: Float, relative slowdown flagged as a regression (e.g. 0.1 for 10% slower)
+    :return: List[(Dict, Float, Float, Boolean)], each baseline result timed again with its seconds,
+    the ratio of current to baseline seconds and whether it regressed
+    """
+    timed = {(result['workload'], result['lines'], result['stage']): result['seconds']
+             for result in current['results']}
+
+    rows = []
+    for result in baseline['results']:
+        seconds = timed.get((result['workload'], result['lines'], result['stage']))
+        # Results only in the baseline were not run again
+        if seconds is None:
+            continue
+        ratio = seconds / result['seconds'] if result['seconds'] else 1.0
+        rows.append((result, seconds, ratio, ratio > 1 + threshold))
+    return rows
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Time lexing, parsing and evaluating generated workloads over "
+                                                     "increasing sizes, save the results as a JSON baseline, and "
+                                                     "compare a later run against it")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Run the suite and write the results as JSON")
+    run_parser.add_argument('--output', default='baseline.json', help="Results file (default: baseline.json)")
+    run_parser.add_argument('--lines', type=int, nargs='+', default=[1000, 10000, 50000],
+                            help="Program sizes in lines")
+    run_parser.add_argument('--workload', action='append', choices=list(Workloads),
+                            help="Workload to time, may be repeated (default: every workload)")
+    run_parser.add_argument('--engine', default='tree', choices=interpreter.Engines, help="Engine (default: tree)")
+    run_parser.add_argument('--repeat', type=int, default=3, help="Runs per measurement, the best is kept")
+
+    compare_parser = commands.add_parser('compare', help="Compare results against a baseline, exiting with status 1 "
+                                                         "if any stage regressed")
+    compare_parser.add_argument('baseline', help="Baseline results file")
+    compare_parser.add_argument('current', nargs='?',
+                                help="Results file to compare (default: run the suite again with the baseline's "
+                                     "sizes, workloads, engine and repeat)")
+    compare_parser.add_argument('--threshold', type=float, default=DefaultThreshold,
+                                help=f"Relative slowdown flagged as a regression (default: {DefaultThreshold})")
+    args = arg_parser.parse_args()
+
+    if args.command == 'run':
+        suite = run_suite(args.engine, args.lines, args.workload or list(Workloads), args.repeat)
+        with open(args.output, 'w') as file:
+            json.dump(suite, file, indent=2)
+        print(f"Suite: {len(suite['results'])} results written to '{args.output}'", file=sys.stderr)
+        sys.exit()
+
+    with open(args.baseline) as file:
+        baseline_suite = json.load(file)
+    if args.current is not None:
+        with open(args.current) as file:
+            current_suite = json.load(file)
+    else:
+        current_suite = run_suite(baseline_suite['engine'], baseline_suite['sizes'], baseline_suite['workloads'],
+                                  baseline_suite['repeat'])
+
+    rows = compare(baseline_suite, current_suite, args.threshold)
+    print(f"{'workload':>22} {'lines':>8} {'stage':>6} {'baseline s':>11} {'current s':>10} {'ratio':>7}")
+    for result, seconds, ratio, regressed in rows:
+        print(f"{result['workload']:>22} {result['lines']:>8} {result['stage']:>6} {result['seconds']:>11.4f} "
+              f"{seconds:>10.4f} {ratio:>6.2f}x{'  REGRESSION' if regressed else ''}")
+
+    regressions = sum(regressed for _, _, _, regressed in rows)
+    print(f"Compare: {regressions} of {len(rows)} results regressed by more than {args.threshold:.0%}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,40 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import lexer_ as lexer
+import generators_ as generators
+
+
+def measure(tokenize, program):
+    """
+    Measure time and memory held by the Tokens of program
+    :param tokenize: Function
+    :param program: String
+    :return: (Float, Integer, Integer)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    tokens = tokenize(program)
+    seconds = time.perf_counter() - start
+    # Memory still held once tokenizing is done, i.e. the Tokens themselves
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, held, len(tokens)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare Token List and TokenBuffer time and bytes per Token")
+    arg_parser.add_argument('--size', type=int, default=10 ** 6, help="Program size in bytes")
+    args = arg_parser.parse_args()
+
+    program = generators.mixed_program(args.size)
+    print(f"{'tokens':>14} {'count':>10} {'seconds':>10} {'bytes/token':>12}")
+    for name, tokenize in [('List[Token]', lambda text: lexer.Lexer().tokenize(text)),
+                           ('TokenBuffer', lambda text: lexer.Lexer().tokenize_buffer(text))]:
+        seconds, held, count = measure(tokenize, program)
+        print(f"{name:>14} {count:>10} {seconds:>10.3f} {held / count:>12.1f}")
@@ -0,0 +1,101 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import generators_ as generators
+import parser_ as parser
+import resolver_ as resolver
+import sink_ as sink
+import token_ as token
+import value_ as value
+
+# Variables read by each generated assignment
+ReadsPerLine = 4
+
+
+def time_run(engine, program, repeat):
+    """
+    Time running a compiled program, best of repeat runs
+    :param engine: String
+    :param program: String
+    :param repeat: Integer
+    :return: Float
+    """
+    prog_interpreter = interpreter.Interpreter(engine=engine, output=sink.MemorySink())
+    compiled = prog_interpreter.compile(prog_interpreter.parse(program))
+
+    best = None
+    for _ in range(repeat):
+        prog_interpreter.variables = dict()
+        start = time.perf_counter()
+        prog_interpreter.run(compiled)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def time_reads(operands, reads, repeat):
+    """
+    Time evaluating 'a + b' from the Values of its operands, as the tree and stack engines do, best of repeat runs
+    :param operands: (Value, Value)
+    :param reads: Integer, evaluations per run
+    :param repeat: Integer
+    :return: Float, seconds per evaluation
+    """
+    prog_interpreter = interpreter.Interpreter(output=sink.MemorySink())
+    # Slots of a program which assigned a and b, a is slot 0 and b is slot 1
+    prog_interpreter.slots = [value.Value(1, token.TokenType.Integer), value.Value(2, token.TokenType.Integer)]
+    prog_interpreter.slot_table = {'a': 0, 'b': 1}
+    node = parser.BinaryNode(None, token.Token('+', token.TokenType.BinaryOperation), None)
+    eval_binary_values = prog_interpreter.eval_binary_values
+    left, right = operands
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(reads):
+            eval_binary_values(node, left, right)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best / reads
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Time Variable reads, by themselves and per engine as the "
+                                                     "difference between a program reading Variables and the same "
+                                                     "program reading Integer literals")
+    arg_parser.add_argument('--lines', type=int, default=100000, help="Number of statements in the program")
+    arg_parser.add_argument('--variables', type=int, default=20, help="Number of Variables in the program")
+    arg_parser.add_argument('--reads', type=int, default=10 ** 6, help="Evaluations timed per run of a single read")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement, the best is kept")
+    arg_parser.add_argument('--engine', action='append', choices=interpreter.Engines,
+                            help="Engine to time, may be repeated (default: every engine)")
+    args = arg_parser.parse_args()
+
+    # A single read, of a Variable resolved to its slot, or found by its name as a Variable Value without a slot
+    literal = (value.Value(1, token.TokenType.Integer), value.Value(2, token.TokenType.Integer))
+    by_name = (value.Value('a', token.TokenType.Variable), value.Value('b', token.TokenType.Variable))
+    by_slot = (resolver.SlotValue(by_name[0], 0), resolver.SlotValue(by_name[1], 1))
+    literal_seconds = time_reads(literal, args.reads, args.repeat)
+
+    print(f"{'read':>10} {'ns/a + b':>12} {'ns/read':>10}")
+    print(f"{'literal':>10} {literal_seconds * 1e9:>12.1f} {0:>10.1f}")
+    for name, operands in (('by slot', by_slot), ('by name', by_name)):
+        seconds = time_reads(operands, args.reads, args.repeat)
+        print(f"{name:>10} {seconds * 1e9:>12.1f} {(seconds - literal_seconds) / 2 * 1e9:>10.1f}")
+    print()
+
+    variables_program = generators.variables_program(args.lines, args.variables)
+    literals_program = generators.variables_program(args.lines, args.variables, literals=True)
+    reads = (args.lines - args.variables) * ReadsPerLine
+
+    print(f"{'engine':>10} {'variables s':>12} {'literals s':>12} {'ns/read':>10}")
+    for engine in args.engine or interpreter.Engines:
+        variables_seconds = time_run(engine, variables_program, args.repeat)
+        literals_seconds = time_run(engine, literals_program, args.repeat)
+        print(f"{engine:>10} {variables_seconds:>12.3f} {literals_seconds:>12.3f} "
+              f"{(variables_seconds - literals_seconds) / reads * 1e9:>10.1f}")
@@ -0,0 +1,91 @@
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import token_ as token
+import value_ as value
+import vector_ as vector
+
+# Rows of input Variables from 1 thousand to 1 million
+ROWS = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+# Rows executed one at a time, the time per row of more rows is the same
+ScalarRows = 1000
+
+# Arithmetic and comparison program over the input Variables x (Integer), y (Float) and b (Boolean)
+PROGRAM = ("z = x * 3 + 7 % x - y / (x - 2)\n"
+           "w = z > 0 and b or x == 5\n"
+           "v = -x ** 2 + (y ** 2) % 3\n"
+           "print z\n"
+           "print w\n")
+
+
+def create_columns(rows):
+    """
+    Create random input Variable columns
+    :param rows: Integer
+    :return: Dict[String, numpy.ndarray]
+    """
+    generator = vector.numpy.random.default_rng(0)
+    return {'x': generator.integers(-1000, 1000, rows),
+            'y': generator.random(rows) * 10 - 5,
+            'b': generator.random(rows) < 0.5}
+
+
+def time_scalar(columns, rows):
+    """
+    Time executing the program once per row, per row
+    :param columns: Dict[String, numpy.ndarray]
+    :param rows: Integer
+    :return: Float
+    """
+    prog_interpreter = interpreter.Interpreter()
+    ast = prog_interpreter.parse(PROGRAM)
+    x_values = columns['x'][:rows].tolist()
+    y_values = columns['y'][:rows].tolist()
+    b_values = columns['b'][:rows].tolist()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for x_value, y_value, b_value in zip(x_values, y_values, b_values):
+            prog_interpreter.variables = {'x': value.Value(x_value, token.TokenType.Integer),
+                                          'y': value.Value(y_value, token.TokenType.Float),
+                                          'b': value.Value(b_value, token.TokenType.Boolean)}
+            prog_interpreter.evaluate(ast)
+        return (time.perf_counter() - start) / rows
+
+
+def time_batch(columns):
+    """
+    Time evaluating the program over every row at once
+    :param columns: Dict[String, numpy.ndarray]
+    :return: Float
+    """
+    prog_interpreter = interpreter.Interpreter()
+    start = time.perf_counter()
+    prog_interpreter.evaluate_batch(PROGRAM, columns)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare executing a program once per row of input Variables "
+                                                     "against evaluating it over every row at once with NumPy")
+    arg_parser.add_argument('--max-rows', type=int, default=ROWS[-1], help="Most rows")
+    args = arg_parser.parse_args()
+
+    if vector.numpy is None:
+        raise SystemExit("NumPy is required to evaluate batches")
+
+    scalar_seconds = time_scalar(create_columns(ScalarRows), ScalarRows)
+    print(f"{'rows':>10} {'scalar rows/s':>16} {'batch rows/s':>16} {'speedup':>10}")
+    for rows in ROWS:
+        if rows > args.max_rows:
+            break
+        batch_seconds = time_batch(create_columns(rows))
+        print(f"{rows:>10} {1 / scalar_seconds:>16.0f} {rows / batch_seconds:>16.0f} "
+              f"{scalar_seconds * rows / batch_seconds:>9.1f}x")
@@ -0,0 +1,79 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import generators_ as generators
+import sink_ as sink
+import watch_ as watch
+
+# Edits of a generated print-heavy program, by name, each a Function(List[String]) -> List[String] of its lines
+EDITS = {
+    'start, same Variables': lambda lines: lines[:2] + ['print "edited text"'] + lines[2:],
+    'middle, same Variables': lambda lines: lines[:len(lines) // 2] + ['print "edited text"'] + lines[len(lines) // 2:],
+    'middle, Variables changed': lambda lines: lines[:len(lines) // 2] + ['a = 3'] + lines[len(lines) // 2:],
+    'end, appended line': lambda lines: lines + ['print a * 2'],
+}
+
+
+def time_execute(engine, source, repeat):
+    """
+    Time executing a whole program as main.py does without watching, best of repeat runs
+    :param engine: String
+    :param source: String
+    :param repeat: Integer
+    :return: Float
+    """
+    best = None
+    for _ in range(repeat):
+        prog_interpreter = interpreter.Interpreter(engine=engine, output=sink.MemorySink())
+        start = time.perf_counter()
+        prog_interpreter.execute(source)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def time_update(engine, source, edited, repeat):
+    """
+    Time a ProgramWatcher executing a program again after an edit, best of repeat runs
+    :param engine: String
+    :param source: String, the program before the edit
+    :param edited: String
+    :param repeat: Integer
+    :return: (Float, Integer), seconds and statements run
+    """
+    best = None
+    for _ in range(repeat):
+        watcher = watch.ProgramWatcher(interpreter.Interpreter(engine=engine, output=sink.MemorySink()))
+        watcher.update(source)
+        start = time.perf_counter()
+        watcher.update(edited)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, watcher.statements_run
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Edit-to-output time of executing a program again after an edit, "
+                                                     "whole against the ProgramWatcher of watch mode")
+    arg_parser.add_argument('--lines', type=int, nargs='+', default=[1000, 10000, 100000],
+                            help="Program sizes in lines")
+    arg_parser.add_argument('--engine', default='tree', choices=interpreter.Engines, help="Engine (default: tree)")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Runs per measurement, the best is kept")
+    args = arg_parser.parse_args()
+
+    print(f"{'lines':>8} {'edit':>26} {'execute s':>10} {'watch s':>10} {'speedup':>8} {'statements run':>15}")
+    for lines in args.lines:
+        program_lines = generators.print_program(lines).splitlines()
+        source = "\n".join(program_lines) + "\n"
+
+        for edit_name, edit in EDITS.items():
+            edited = "\n".join(edit(program_lines)) + "\n"
+            execute_seconds = time_execute(args.engine, edited, args.repeat)
+            watch_seconds, statements_run = time_update(args.engine, source, edited, args.repeat)
+            print(f"{lines:>8} {edit_name:>26} {execute_seconds:>10.4f} {watch_seconds:>10.4f} "
+                  f"{execute_seconds / watch_seconds:>7.1f}x {statements_run:>15}")
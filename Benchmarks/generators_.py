@@ -0,0 +1,214 @@
+# Synthetic program generators for benchmarking the Lexer, Parser and Interpreter
+
+# Mixed statement lines covering every TokenType the Lexer produces
+MIXED_LINES = [
+    'var1 = 5\n',
+    'var2 = 10.25\n',
+    'var3 = "some string with \\t escapes\\n"\n',
+    'print var1 + var2 / (var1 * 2) - -3\n',
+    'print !(5 - 4 > 3 * 2 == !false) and true\n',
+    'print "foo" + "bar" == "foobar"\n',
+    'del var1\n',
+]
+
+
+def mixed_program(size):
+    """
+    Generate a program of roughly size characters by repeating MIXED_LINES
+    :param size: Integer
+    :return: String
+    """
+    block = "".join(MIXED_LINES)
+    # Repeat whole blocks, then trim to the last complete line under size
+    text = block * (size // len(block) + 1)
+    return text[:text.rfind('\n', 0, size) + 1]
+
+
+def arithmetic_program(lines):
+    """
+    Generate a program of arithmetic, comparison and logic assignments over a few variables
+    :param lines: Integer
+    :return: String
+    """
+    statements = ['a = 7\n', 'b = 2.5\n', 'c = 3\n']
+    body = [
+        'c = (a * b + a / b - a % c) % 100\n',
+        'd = c ** 2 >= a and b < c or !true\n',
+        'a = (a + 1) % 50 + 1\n',
+        'b = ((a - b) * (c + 1.5)) % 97\n',
+    ]
+    # Cycle through the body until the program has enough lines
+    for i in range(max(lines - len(statements), 0)):
+        statements.append(body[i % len(body)])
+    return "".join(statements)
+
+
+def temporaries_program(lines):
+    """
+    Generate a program of arithmetic through temporaries, many of them never read or deleted straight away,
+    printing the result at the end
+    :param lines: Integer
+    :return: String
+    """
+    statements = ['a = 7\n', 'b = 3\n']
+    body = [
+        't1 = a * b + 1\n',
+        't2 = (a - b) * t1\n',
+        't1 = a + b\n',
+        'tmp = a * 2 + b\n',
+        'del tmp\n',
+        'a = (a + t2) % 50 + 1\n',
+        't2 = b * b - a\n',
+        'b = (b + a) % 20 + 1\n',
+    ]
+    # Cycle through the body until the program has enough lines
+    for i in range(max(lines - len(statements) - 1, 0)):
+        statements.append(body[i % len(body)])
+    statements.append('print a + b\n')
+    return "".join(statements)
+
+
+def operator_chain(operators):
+    """
+    Generate a single expression statement of a long chain of additions, e.g. '1 + 1 + 1'
+    :param operators: Integer
+    :return: String
+    """
+    return '1' + ' + 1' * operators + '\n'
+
+
+def nested_parens(depth):
+    """
+    Generate a single expression statement of deeply nested parentheses, e.g. '(1 + (1 + (1)))'
+    :param depth: Integer
+    :return: String
+    """
+    return '(1 + ' * depth + '1' + ')' * depth + '\n'
+
+
+def print_program(lines):
+    """
+    Generate a program printing on nearly every line, Variables, literals and short expressions
+    :param lines: Integer
+    :return: String
+    """
+    statements = ['a = 7\n', 's = "line"\n']
+    body = [
+        'print a\n',
+        'print s\n',
+        'print a * 3 + 1\n',
+        'print "some printed text"\n',
+        'print a > 3\n',
+        'a = (a + 1) % 1000\n',
+    ]
+    # Cycle through the body until the program has enough lines
+    for i in range(max(lines - len(statements), 0)):
+        statements.append(body[i % len(body)])
+    return "".join(statements)
+
+
+def variables_program(lines, variables=20, literals=False):
+    """
+    Generate a program of assignments reading 4 Variables each, e.g. 'v3 = v0 + v1 * v2 - v0', over a set of
+    Variables assigned first. With literals, every Variable read is an Integer literal instead, so the difference
+    in time between the two is the time of the Variable reads
+    :param lines: Integer
+    :param variables: Integer, number of Variables
+    :param literals: Boolean
+    :return: String
+    """
+    statements = [f'v{idx} = {idx + 1}\n' for idx in range(variables)]
+    for i in range(max(lines - len(statements), 0)):
+        # Read Variables spread over the set, the result stays small
+        reads = [(i * 7 + offset * 3) % variables for offset in range(4)]
+        operands = [str(read + 1) if literals else f'v{read}' for read in reads]
+        statements.append(f'v{i % variables} = ({operands[0]} + {operands[1]} * {operands[2]} - {operands[3]}) % 97\n')
+    return "".join(statements)
+
+
+def chain_program(lines, operators=16):
+    """
+    Generate a program of assignments of long arithmetic chains cycling through the operators,
+    e.g. 'a = (a + 3 * 2 - 7 % 5 ...) % 1000'
+    :param lines: Integer
+    :param operators: Integer, operators per chain
+    :return: String
+    """
+    statements = ['a = 7\n']
+    cycle = ['+', '*', '-', '%']
+    for i in range(max(lines - len(statements), 0)):
+        # Operands never divide by zero, the result stays small
+        chain = " ".join(f"{cycle[(i + op) % len(cycle)]} {(i + op) % 9 + 1}" for op in range(operators - 1))
+        statements.append(f'a = (a {chain}) % 1000\n')
+    return "".join(statements)
+
+
+def parens_program(lines, depth=40):
+    """
+    Generate a program of assignments of deeply nested parentheses, e.g. 'a = (a + (1 + (1)))'
+    :param lines: Integer
+    :param depth: Integer, nesting of each statement
+    :return: String
+    """
+    statements = ['a = 1\n']
+    body = 'a = (a % 100 + ' + '(1 + ' * depth + '1' + ')' * (depth + 1) + '\n'
+    statements.extend([body] * max(lines - len(statements), 0))
+    return "".join(statements)
+
+
+def del_churn_program(lines, variables=20):
+    """
+    Generate a program creating and deleting Variables, each temporary is read and deleted once the next
+    variables - 1 temporaries are created, so the set of Variables keeps changing
+    :param lines: Integer
+    :param variables: Integer, temporaries alive at once
+    :return: String
+    """
+    statements = ['a = 1\n'] + [f't{idx} = {idx % 7}\n' for idx in range(variables - 1)]
+    idx = variables - 1
+    while len(statements) < lines:
+        # Create a temporary in the slot deleted last, then read and delete the oldest one
+        oldest = (idx + 1) % variables
+        statements.append(f't{idx % variables} = a + {idx % 7}\n')
+        statements.append(f'a = (a + t{oldest}) % 100\n')
+        statements.append(f'del t{oldest}\n')
+        idx += 1
+    return "".join(statements[:lines])
+
+
+def string_program(lines, restart=100):
+    """
+    Generate a program concatenating Strings onto a growing String, started again every restart lines
+    so the time stays linear in lines, and comparing them
+    :param lines: Integer
+    :param restart: Integer
+    :return: String
+    """
+    statements = ['s = "start"\n', 'w = "word"\n']
+    body = [
+        's = s + " " + w + "s"\n',
+        'u = "(" + w + ")" + "," + "tail"\n',
+        'e = s == u or s + u != u + s\n',
+    ]
+    for i in range(max(lines - len(statements), 0)):
+        statements.append('s = "start"\n' if i % restart == restart - 1 else body[i % len(body)])
+    return "".join(statements)
+
+
+def boolean_program(lines):
+    """
+    Generate a program of boolean logic: comparisons joined by 'and', 'or' and negation
+    :param lines: Integer
+    :return: String
+    """
+    statements = ['a = 7\n', 'b = 3\n', 'p = true\n', 'q = false\n']
+    body = [
+        'p = a > b and !q or a == b\n',
+        'q = !(p and q) and (a <= b or p != q)\n',
+        'r = (p or q) and !(a >= b and false) or true == p\n',
+        'a = (a + 1) % 10\n',
+        'q = not p or r and a < 5\n',
+    ]
+    for i in range(max(lines - len(statements), 0)):
+        statements.append(body[i % len(body)])
+    return "".join(statements)
@@ -0,0 +1,246 @@
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import cache_ as cache
+import errors_ as errors
+import interpreter_ as interpreter
+import sink_ as sink
+
+# File extension of programs found in directories
+ProgramExtension = '.txt'
+
+# Extensions of the per-program output files
+OutputExtension = '.out'
+ErrorExtension = '.err'
+
+# Interpreter options of the current process, set by init_worker
+WorkerOptions = dict()
+
+# ProgramCache of each program directory in the current process
+WorkerCaches = dict()
+
+
+def find_programs(paths):
+    """
+    Find the program files of paths, in a stable order. Files are kept in the order given,
+    directories contribute every program file below them, sorted by path
+    :param paths: List[String]
+    :return: List[String]
+    """
+    programs = []
+    for path in paths:
+        if not os.path.isdir(path):
+            programs.append(path)
+            continue
+
+        found = []
+        for directory, dir_names, file_names in os.walk(path):
+            # Cached programs are not programs
+            dir_names[:] = [dir_name for dir_name in dir_names if dir_name != cache.CacheDirectory]
+            found.extend(os.path.join(directory, file_name) for file_name in file_names
+                         if file_name.endswith(ProgramExtension))
+        programs.extend(sorted(found))
+    return programs
+
+
+def init_worker(options):
+    """
+    Prepare a worker process to run programs, with every module imported before the first program
+    :param options: Dict[String, Any], Interpreter options and 'cache' to load and store parsed programs
+    :return: Nothing
+    """
+    WorkerOptions.clear()
+    WorkerOptions.update(options)
+    WorkerCaches.clear()
+
+
+def get_worker_cache(path):
+    """
+    Get the ProgramCache next to a program in the current process, if programs are cached
+    :param path: String
+    :return: ProgramCache or None
+    """
+    if not WorkerOptions.get('cache'):
+        return None
+
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), cache.CacheDirectory)
+    if directory not in WorkerCaches:
+        WorkerCaches[directory] = cache.ProgramCache(directory)
+    return WorkerCaches[directory]
+
+
+def run_program(path):
+    """
+    Run a program file in a new Interpreter, capturing what it prints and the error that stopped it.
+    Errors never propagate, so one program cannot stop the batch
+    :param path: String
+    :return: Dict[String, Any], the program's result
+    """
+    output = sink.MemorySink()
+    status = 'ok'
+    error = None
+    start = time.perf_counter()
+
+    try:
+        with open(path, 'r') as file:
+            source = file.read()
+        prog_interpreter = interpreter.Interpreter(engine=WorkerOptions.get('engine', 'tree'),
+                                                   optimize=WorkerOptions.get('optimize', False),
+                                                   cache=get_worker_cache(path), output=output)
+        prog_interpreter.execute(source)
+
+    # Interpreter errors
+    except SystemExit as exit_error:
+        status = 'error'
+        error = "" if exit_error.code is None else str(exit_error.code)
+
+    # Unreadable program file
+    except OSError as os_error:
+        status = 'error'
+        error = (f"--- PROGRAM ERROR ---\n"
+                 f"FileError: {os_error.strerror}\n"
+                 f"in File: '{path}'\n"
+                 f"--- PROGRAM ERROR ---")
+
+    # Any other exception, as a traceback
+    except Exception:
+        status = 'exception'
+        error = traceback.format_exc()
+
+    return {'program': path, 'status': status, 'stdout': output.getvalue(), 'error': error,
+            'seconds': time.perf_counter() - start}
+
+
+class BatchRunner:
+    def __init__(self, jobs=1, engine="tree", optimize=False, use_cache=True):
+        """
+        Create a new BatchRunner, running many programs, each in its own Interpreter, on a pool of worker processes
+        that stay warm for every program. Results keep the order of the programs
+        :param jobs: Integer, worker processes, 1 runs programs in this process
+        :param engine: String, Interpreter engine
+        :param optimize: Boolean, optimize programs before executing them
+        :param use_cache: Boolean, load and store parsed programs in the cache next to each program
+        """
+        if engine not in interpreter.Engines:
+            raise errors.engine_error(engine, interpreter.Engines)
+
+        self.jobs = jobs
+        self.options = {'engine': engine, 'optimize': optimize, 'cache': use_cache}
+        self.executor = None
+
+    def start(self):
+        """
+        Start the worker processes, each importing every module and reading its options once
+        :return: Nothing
+        """
+        if self.jobs > 1 and self.executor is None:
+            self.executor = ProcessPoolExecutor(self.jobs, initializer=init_worker, initargs=(self.options,))
+            # Every worker is started before the first program, one per task submitted while none is idle
+            for future in [self.executor.submit(time.sleep, 0) for _ in range(self.jobs)]:
+                future.result()
+
+    def close(self):
+        """
+        Shut down the worker processes
+        :return: Nothing
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def run(self, programs):
+        """
+        Run program files, yielding the result of each program in the order given as soon as it is known
+        :param programs: List[String]
+        :return: Iterator[Dict[String, Any]]
+        """
+        if self.jobs <= 1:
+            init_worker(self.options)
+            yield from map(run_program, programs)
+            return
+
+        self.start()
+        # Small batches of programs per task, so workers are not idle while results are sent back
+        chunk_size = max(1, min(16, len(programs) // (self.jobs * 8)))
+        yield from self.executor.map(run_program, programs, chunksize=chunk_size)
+
+
+def write_output_files(result, output_dir, root):
+    """
+    Write the printed output of a program, and its error if any, to files named after the program
+    :param result: Dict[String, Any]
+    :param output_dir: String
+    :param root: String, common directory of every program
+    :return: Nothing
+    """
+    base_path = os.path.join(output_dir, os.path.relpath(os.path.abspath(result['program']), root))
+    os.makedirs(os.path.dirname(base_path), exist_ok=True)
+
+    with open(base_path + OutputExtension, 'w') as file:
+        file.write(result['stdout'])
+
+    # Error files only exist for failed programs
+    if result['error'] is not None:
+        with open(base_path + ErrorExtension, 'w') as file:
+            file.write(result['error'])
+    elif os.path.exists(base_path + ErrorExtension):
+        os.remove(base_path + ErrorExtension)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Execute many program files, each in its own Interpreter, "
+                                                     "writing every program's output and error in a stable order")
+    arg_parser.add_argument('programs', nargs='+',
+                            help=f"Program files, or directories of '{ProgramExtension}' program files")
+    arg_parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                            help="Worker processes (default: number of CPUs)")
+    arg_parser.add_argument('--engine', default='tree', choices=interpreter.Engines,
+                            help="Execution engine (default: tree)")
+    arg_parser.add_argument('--optimize', action='store_true',
+                            help="Fold constants, simplify identities and eliminate dead statements before executing")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help=f"Always parse programs, without loading or storing them in '{cache.CacheDirectory}'")
+    arg_parser.add_argument('--output', help="JSON lines file of results, one per program (default: stdout)")
+    arg_parser.add_argument('--output-dir', help=f"Write each program's output to '{OutputExtension}' and error to "
+                                                 f"'{ErrorExtension}' files in this directory instead of JSON lines")
+    args = arg_parser.parse_args()
+
+    program_paths = find_programs(args.programs)
+    if not program_paths:
+        raise SystemExit(f"--- PROGRAM ERROR ---\n"
+                         f"FileError: No program files found\n"
+                         f"in Paths: '{args.programs}'\n"
+                         f"--- PROGRAM ERROR ---")
+
+    runner = BatchRunner(args.jobs, args.engine, args.optimize, not args.no_cache)
+    root_dir = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in program_paths])
+    failed = 0
+    batch_start = time.perf_counter()
+
+    with contextlib.ExitStack() as stack:
+        stack.callback(runner.close)
+        results_file = None
+        if args.output_dir is None:
+            results_file = stack.enter_context(open(args.output, 'w')) if args.output else sys.stdout
+
+        for prog_result in runner.run(program_paths):
+            if prog_result['status'] != 'ok':
+                failed += 1
+
+            if results_file is not None:
+                results_file.write(json.dumps(prog_result) + '\n')
+            else:
+                write_output_files(prog_result, args.output_dir, root_dir)
+
+    batch_seconds = time.perf_counter() - batch_start
+    print(f"Batch: {len(program_paths)} programs, {failed} failed, {batch_seconds:.3f} seconds, "
+          f"{len(program_paths) / batch_seconds:.1f} programs/s", file=sys.stderr)
+
+    # Failed programs are reported in the results, and by the exit status
+    sys.exit(1 if failed else 0)
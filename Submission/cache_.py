@@ -0,0 +1,389 @@
+import gc
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import zlib
+from array import array
+from collections import OrderedDict
+
+import eliminator_ as eliminator
+import errors_ as errors
+import lexer_ as lexer
+import operators_ as operators
+import optimizer_ as optimizer
+import parser_ as parser
+import token_ as token
+import value_ as value
+
+# Directory of cached programs, next to the program file
+CacheDirectory = '__progcache__'
+
+# File signature of cached programs, and version of their encoding
+Magic = b'PROGCACHE'
+FormatVersion = 1
+
+# Modules whose code determines the parsed AST, changing any of them invalidates every cached program.
+# Every module the Lexer, Parser, Optimizer and Eliminator import, as constants are folded by operators_
+# and the errors they raise decide what is folded
+SourceModules = [token, value, lexer, parser, optimizer, eliminator, operators, errors]
+
+# Node kinds of the encoded AST
+KeywordKind = 0
+UnaryKind = 1
+BinaryKind = 2
+VariableKind = 3
+ValueKind = 4
+NodeKinds = {
+    parser.KeywordNode: KeywordKind,
+    parser.UnaryNode: UnaryKind,
+    parser.BinaryNode: BinaryKind,
+    parser.VariableNode: VariableKind,
+    parser.ValueNode: ValueKind,
+}
+
+
+def get_version():
+    """
+    Get the Interpreter version of cached programs, a hash of the encoding version,
+    the Python version and the source of every module the AST depends on
+    :return: String
+    """
+    version = hashlib.sha256(f"{FormatVersion} {sys.version} {sys.byteorder}".encode())
+    for module in SourceModules:
+        with open(module.__file__, 'rb') as file:
+            version.update(file.read())
+    return version.hexdigest()
+
+
+def count_program_nodes(ast):
+    """
+    Count the distinct Nodes of a List of statements, Nodes shared by several statements are counted once
+    :param ast: List[Node]
+    :return: Integer
+    """
+    seen = {id(None)}
+    stack = list(ast)
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+
+        if isinstance(node, parser.BinaryNode):
+            stack.append(node.left)
+            stack.append(node.right)
+        elif isinstance(node, parser.VariableNode):
+            stack.append(node.val_node)
+        elif isinstance(node, (parser.KeywordNode, parser.UnaryNode)):
+            stack.append(node.node)
+    return len(seen) - 1
+
+
+def encode_ast(ast):
+    """
+    Encode a List of statements as parallel arrays of Node kind and 3 arguments per Node, with tables of Tokens
+    and computed Values. Children are encoded before their parents and referred to by index + 1 (0 is None),
+    so Nodes shared by several statements are encoded once
+    :param ast: List[Node]
+    :return: (bytes, bytes, List[(String, Integer)], List[(Any, Integer, String)], bytes)
+    """
+    kinds = array('B')
+    args = array('i')
+    tokens = []
+    token_idx = dict()
+    values = []
+    # Node id -> index + 1 of encoded Nodes
+    node_idx = {id(None): 0}
+    statements = array('i')
+
+    def add_token(tk):
+        key = (tk.value, tk.type)
+        if key not in token_idx:
+            token_idx[key] = len(tokens)
+            tokens.append((tk.value, token.TokenTypeCodes[tk.type]))
+        return token_idx[key]
+
+    for statement in ast:
+        # A Node stays on the stack until its children are encoded
+        stack = [statement]
+        while stack:
+            node = stack[-1]
+            if id(node) in node_idx:
+                stack.pop()
+                continue
+            kind = NodeKinds[type(node)]
+
+            if kind == BinaryKind:
+                left_idx = node_idx.get(id(node.left))
+                right_idx = node_idx.get(id(node.right))
+                if left_idx is None or right_idx is None:
+                    if right_idx is None:
+                        stack.append(node.right)
+                    if left_idx is None:
+                        stack.append(node.left)
+                    continue
+                args.extend((left_idx, add_token(node.op_token), right_idx))
+
+            # Literals are converted from their Token again, computed Values are stored
+            elif kind == ValueKind:
+                val = node.value
+                if val.text is not None and val.text == node.token.value:
+                    val_idx = 0
+                else:
+                    values.append((val.value, token.TokenTypeCodes[val.type], val.text))
+                    val_idx = len(values)
+                args.extend((add_token(node.token), val_idx, 0))
+
+            # KeywordNode, UnaryNode and VariableNode have a Token and a single child
+            else:
+                if kind == VariableKind:
+                    tk, child = node.var_token, node.val_node
+                elif kind == UnaryKind:
+                    tk, child = node.op_token, node.node
+                else:
+                    tk, child = node.kw_token, node.node
+
+                child_idx = node_idx.get(id(child))
+                if child_idx is None:
+                    stack.append(child)
+                    continue
+                args.extend((add_token(tk), child_idx, 0))
+
+            kinds.append(kind)
+            node_idx[id(node)] = len(kinds)
+            stack.pop()
+
+        statements.append(node_idx[id(statement)])
+
+    return kinds.tobytes(), args.tobytes(), tokens, values, statements.tobytes()
+
+
+def decode_ast(kinds_bytes, args_bytes, tokens, values, statements_bytes):
+    """
+    Decode a List of statements encoded by encode_ast, literals of the same Token share their Value
+    :param kinds_bytes: bytes
+    :param args_bytes: bytes
+    :param tokens: List[(String, Integer)]
+    :param values: List[(Any, Integer, String)]
+    :param statements_bytes: bytes
+    :return: List[Node]
+    """
+    kinds = array('B')
+    kinds.frombytes(kinds_bytes)
+    args = array('i')
+    args.frombytes(args_bytes)
+    statements = array('i')
+    statements.frombytes(statements_bytes)
+
+    tokens = [token.Token(tk_value, token.TokenTypesByCode[code]) for tk_value, code in tokens]
+    values = [None] + [value.Value(val, token.TokenTypesByCode[code], text) for val, code, text in values]
+    # Value of each literal Token, converted when first used
+    literals = [None] * len(tokens)
+
+    # Index 0 is a missing (None) Node
+    nodes = [None]
+    for kind, first, second, third in zip(kinds, args[0::3], args[1::3], args[2::3]):
+        if kind == BinaryKind:
+            nodes.append(parser.BinaryNode(nodes[first], tokens[second], nodes[third]))
+        elif kind == ValueKind:
+            if second:
+                nodes.append(parser.ValueNode(tokens[first], values[second]))
+            else:
+                if literals[first] is None:
+                    literals[first] = value.Value.from_token(tokens[first])
+                nodes.append(parser.ValueNode(tokens[first], literals[first]))
+        elif kind == UnaryKind:
+            nodes.append(parser.UnaryNode(tokens[first], nodes[second]))
+        elif kind == VariableKind:
+            nodes.append(parser.VariableNode(tokens[first], nodes[second]))
+        else:
+            nodes.append(parser.KeywordNode(tokens[first], nodes[second]))
+
+    return [nodes[idx] for idx in statements]
+
+
+class ProgramCache:
+    def __init__(self, directory):
+        """
+        Create a new ProgramCache, storing parsed programs in directory, one file per source and Interpreter version.
+        A cached program is only loaded if its source, options and Interpreter version are the same
+        :param directory: String
+        """
+        self.directory = directory
+        self.version = get_version()
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, source, options):
+        """
+        Get the key of a program, a hash of the Interpreter version, the options it is parsed with and its source
+        :param source: String, or bytes-like UTF-8 text (e.g. a memory-mapped file) with the same key
+        :param options: Tuple, e.g. (optimize,)
+        :return: String
+        """
+        key = hashlib.sha256(f"{self.version} {options!r}\n".encode())
+        key.update(source.encode() if isinstance(source, str) else source)
+        return key.hexdigest()
+
+    def get_path(self, key):
+        """
+        Get the file of a cached program
+        :param key: String
+        :return: String
+        """
+        return os.path.join(self.directory, key + '.ast')
+
+    def load(self, key):
+        """
+        Load a cached program, missing, corrupt or mismatching files are a miss
+        :param key: String
+        :return: (List[Node], Integer, Integer) or None, the AST and the Nodes and statements removed by optimizing
+        """
+        try:
+            with open(self.get_path(key), 'rb') as file:
+                data = file.read()
+
+            if not data.startswith(Magic):
+                raise ValueError(key)
+            entry = marshal.loads(zlib.decompress(data[len(Magic):]))
+            stored_key, nodes_removed, statements_removed, encoded = entry
+            if stored_key != key:
+                raise ValueError(key)
+
+            # Decoded programs are only ever freed as a whole, pause the cyclic GC while they are created
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                ast = decode_ast(*encoded)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+
+        except (OSError, EOFError, ValueError, TypeError, IndexError, zlib.error):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return ast, nodes_removed, statements_removed
+
+    def store(self, key, ast, nodes_removed=0, statements_removed=0):
+        """
+        Store a parsed program atomically, the file is written under a temporary name and then renamed,
+        so a program is either fully cached or not at all. A cache that cannot be written is skipped
+        :param key: String
+        :param ast: List[Node]
+        :param nodes_removed: Integer
+        :param statements_removed: Integer
+        :return: Boolean, the program is cached
+        """
+        data = Magic + zlib.compress(marshal.dumps((key, nodes_removed, statements_removed, encode_ast(ast))), 1)
+        temp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=key, suffix='.tmp', dir=self.directory)
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.replace(temp_path, self.get_path(key))
+
+        except OSError:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+        return True
+
+    def clear(self):
+        """
+        Remove every cached program, including unfinished writes
+        :return: Integer, number of files removed
+        """
+        removed = 0
+        try:
+            file_names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return 0
+
+        for file_name in file_names:
+            if file_name.endswith('.ast') or file_name.endswith('.tmp'):
+                os.remove(os.path.join(self.directory, file_name))
+                removed += 1
+        return removed
+
+
+class ParseCache:
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024):
+        """
+        Create a new ParseCache, keeping the most recently used programs in memory, bounded by the number
+        of programs and their estimated size in bytes. Cached programs are shared by every run, and no engine
+        modifies a program while running it
+        :param max_entries: Integer
+        :param max_bytes: Integer
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Key -> (entry, size), least recently used first
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Get a cached entry, marking it as the most recently used
+        :param key: Hashable
+        :return: Any, or None if not cached
+        """
+        try:
+            entry, _ = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry, size):
+        """
+        Cache an entry, evicting the least recently used entries until the cache is within its bounds.
+        An entry larger than the whole cache is not cached
+        :param key: Hashable
+        :param entry: Any
+        :param size: Integer, estimated bytes of entry
+        :return: Boolean, the entry is cached
+        """
+        if size > self.max_bytes or self.max_entries <= 0:
+            return False
+
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (entry, size)
+        self.bytes += size
+
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+        return True
+
+    def clear(self):
+        """
+        Remove every cached entry, the counters are kept
+        :return: Nothing
+        """
+        self.entries.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        """
+        Get the counters of the cache
+        :return: Dict[String, Integer]
+        """
+        return {'entries': len(self.entries), 'bytes': self.bytes, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions}
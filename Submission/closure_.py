@@ -0,0 +1,247 @@
+import errors_ as errors
+import operators_ as operators
+import parser_ as parser
+import token_ as token
+
+Variable = token.TokenType.Variable
+
+
+class ClosureProgram:
+    def __init__(self, statements):
+        """
+        Create a new ClosureProgram, the compiled closures of a List of statements
+        :param statements: List[Function(Dict) -> Value]
+        """
+        self.statements = statements
+        # OutputSink the print closures write to, set before each run as programs are shared by every run
+        self.output = None
+
+
+class ClosureCompiler:
+    def __init__(self):
+        """
+        Create a new ClosureCompiler, compiling Nodes into nested Python closures.
+        Node kind and Operator are resolved once at compile time, so running a compiled
+        Node is only closure calls. Every closure takes the Variables dict and returns a Value
+        """
+        # Program of the statements being compiled
+        self.program = None
+
+    def compile_program(self, ast):
+        """
+        Compile a List of statements into a ClosureProgram
+        :param ast: List[Node]
+        :return: ClosureProgram
+        """
+        self.program = program = ClosureProgram([])
+        program.statements = [self.compile(statement) for statement in ast]
+        self.program = None
+        return program
+
+    def compile(self, ast):
+        """
+        Compile a given Abstract Syntax Tree (AST)
+        :param ast: Node
+        :return: Function(Dict) -> Value
+        """
+        # Compile KeywordNode
+        if isinstance(ast, parser.KeywordNode):
+            return self.compile_kw_node(ast)
+
+        # Compile UnaryNode
+        elif isinstance(ast, parser.UnaryNode):
+            return self.compile_unary_node(ast)
+
+        # Compile BinaryNode
+        elif isinstance(ast, parser.BinaryNode):
+            return self.compile_binary_node(ast)
+
+        elif isinstance(ast, parser.VariableNode):
+            return self.compile_variable_node(ast)
+
+        # Provide Value from ValueNode
+        elif isinstance(ast, parser.ValueNode):
+            return self.compile_value_node(ast)
+
+        # Provided AST/Node not valid, raise when evaluated
+        def none_node(variables):
+            raise errors.none_node_error()
+        return none_node
+
+    def compile_kw_node(self, kw_node):
+        """
+        Compile a given KeywordNode
+        :param kw_node: KeywordNode
+        :return: Function(Dict) -> None
+        """
+        kw_val = kw_node.kw_token.value
+
+        # Printing an expression
+        if kw_val == 'print':
+            return self.compile_print(kw_node)
+
+        # Delete a Variable from the program memory
+        elif kw_val == 'del':
+            return self.compile_del(kw_node)
+
+        # Any other keyword does nothing
+        return lambda variables: None
+
+    def compile_print(self, kw_node):
+        """
+        Compile a print KeywordNode
+        :param kw_node: KeywordNode
+        :return: Function(Dict) -> None
+        """
+        kw_val = kw_node.kw_token.value
+        node = self.compile(kw_node.node)
+        program = self.program
+
+        def print_node(variables):
+            to_print = node(variables)
+
+            # Printing a single Variable
+            if to_print.type == Variable:
+                # Does the Variable exist?
+                try:
+                    program.output.write_line(variables[to_print.value].to_string())
+
+                # Variable does not exist
+                except KeyError:
+                    raise errors.print_variable_error(to_print.value, kw_val)
+
+            # Print entire valid expression
+            else:
+                program.output.write_line(to_print.to_string())
+
+        return print_node
+
+    def compile_del(self, kw_node):
+        """
+        Compile a del KeywordNode
+        :param kw_node: KeywordNode
+        :return: Function(Dict) -> None
+        """
+        kw_val = kw_node.kw_token.value
+        node = kw_node.node
+
+        # Only ValueNodes can be deleted, by their Token value
+        if not isinstance(node, parser.ValueNode):
+            def del_node(variables):
+                raise errors.delete_node_error(node, kw_val)
+            return del_node
+
+        var_name = node.token.value
+        # Attempt to delete a non-existent Variable or a non-Variable Token
+        if node.token.type == Variable:
+            error = errors.delete_variable_error
+        else:
+            error = errors.delete_token_error
+
+        def del_value(variables):
+            # Does the Variable exist?
+            try:
+                variables.pop(var_name)
+
+            # Variable does not exist
+            except KeyError:
+                raise error(node.token, kw_val)
+
+        return del_value
+
+    def compile_unary_node(self, unary_node):
+        """
+        Compile a given UnaryNode
+        :param unary_node: UnaryNode
+        :return: Function(Dict) -> Value
+        """
+        op_val = unary_node.op_token.value
+        operation = operators.UnaryOperations[op_val]
+        node = self.compile(unary_node.node)
+
+        def unary(variables):
+            sub_value = node(variables)
+
+            # Value is Variable
+            if sub_value.type == Variable:
+                # Does the Variable exist?
+                try:
+                    sub_value = variables[sub_value.value]
+
+                # Cannot unary non-existent Variable
+                except KeyError:
+                    raise errors.unary_variable_error(sub_value, op_val)
+
+            return operation(sub_value)
+
+        return unary
+
+    def compile_binary_node(self, binary_node):
+        """
+        Compile a given BinaryNode
+        :param binary_node: BinaryNode
+        :return: Function(Dict) -> Value
+        """
+        operation = operators.BinaryOperations[binary_node.op_token.value]
+
+        # ValueNodes are read directly instead of through a closure
+        left_node, left_value = self.compile_operand(binary_node.left)
+        right_node, right_value = self.compile_operand(binary_node.right)
+
+        def binary(variables):
+            # Evaluate LeftNode and RightNode before resolving Variables
+            left = left_value if left_node is None else left_node(variables)
+            right = right_value if right_node is None else right_node(variables)
+
+            # LeftValue is Variable
+            if left.type == Variable:
+                try:
+                    left = variables[left.value]
+                except KeyError:
+                    raise errors.variable_assignment_error(left.value)
+
+            # RightValue is Variable
+            if right.type == Variable:
+                try:
+                    right = variables[right.value]
+                except KeyError:
+                    raise errors.variable_assignment_error(right.value)
+
+            return operation(left, right)
+
+        return binary
+
+    def compile_operand(self, node):
+        """
+        Compile an operand Node, ValueNodes are not compiled and provide their Value instead
+        :param node: Node
+        :return: (Function(Dict) -> Value, None) or (None, Value)
+        """
+        if isinstance(node, parser.ValueNode):
+            return None, node.value
+        return self.compile(node), None
+
+    def compile_variable_node(self, var_node):
+        """
+        Compile a given VariableNode
+        :param var_node: VariableNode
+        :return: Function(Dict) -> Value
+        """
+        var_name = var_node.var_token.value
+        val_node = self.compile(var_node.val_node)
+
+        def assign(variables):
+            val_value = val_node(variables)
+            variables[var_name] = val_value
+            return val_value
+
+        return assign
+
+    def compile_value_node(self, value_node):
+        """
+        Compile a given ValueNode
+        :param value_node: ValueNode
+        :return: Function(Dict) -> Value
+        """
+        const = value_node.value
+        return lambda variables: const
@@ -0,0 +1,260 @@
+from array import array
+
+import operators_ as operators
+import parser_ as parser
+import token_ as token
+
+# Opcodes of the stack-based VirtualMachine, each instruction is an opcode and a single argument
+LOAD_CONST = 0          # Push constants[arg]
+BINARY_OP = 1           # Pop RightValue and LeftValue, push BinaryOperators[arg] of them
+UNARY_OP = 2            # Pop Value, push UnaryOperators[arg] of it
+STORE_NAME = 3          # Assign the top Value to Variable constants[arg], leaving it on the stack
+POP_TOP = 4             # Discard the top Value
+PRINT = 5               # Pop Value and print it
+DELETE_NAME = 6         # Delete Variable by the value of Token constants[arg]
+DELETE_NODE = 7         # Raise the deletion error of Node constants[arg]
+RAISE_NONE_NODE = 8     # Raise the error of a missing (None) Node
+
+OpcodeNames = ['LOAD_CONST', 'BINARY_OP', 'UNARY_OP', 'STORE_NAME', 'POP_TOP',
+               'PRINT', 'DELETE_NAME', 'DELETE_NODE', 'RAISE_NONE_NODE']
+
+
+class Bytecode:
+    def __init__(self):
+        """
+        Create a new Bytecode, storing instructions as parallel arrays of opcode and argument,
+        with a constant pool for Values, Variable names, Tokens and Nodes
+        """
+        self.opcodes = array('B')
+        self.args = array('I')
+        self.constants = []
+        self.constant_idx = dict()
+        # Index of the first instruction of every statement
+        self.statements = array('I')
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def emit(self, opcode, arg=0):
+        """
+        Add an instruction
+        :param opcode: Integer
+        :param arg: Integer
+        :return: Nothing
+        """
+        self.opcodes.append(opcode)
+        self.args.append(arg)
+
+    def add_constant(self, const, key=None):
+        """
+        Add a constant to the constant pool, constants with the same key are only stored once
+        :param const: Value, String, Token, Node or None
+        :param key: Hashable, or None to always store const
+        :return: Integer, index of const
+        """
+        if key is not None and key in self.constant_idx:
+            return self.constant_idx[key]
+
+        self.constants.append(const)
+        if key is not None:
+            self.constant_idx[key] = len(self.constants) - 1
+        return len(self.constants) - 1
+
+    def start_statement(self):
+        """
+        Mark the next instruction as the start of a statement
+        :return: Nothing
+        """
+        self.statements.append(len(self.opcodes))
+
+
+class BytecodeCompiler:
+    def __init__(self):
+        """
+        Create a new BytecodeCompiler, lowering the AST into Bytecode for the VirtualMachine.
+        Every expression Node leaves exactly one Value on the stack
+        """
+
+    def compile(self, ast):
+        """
+        Compile a List of statements into Bytecode
+        :param ast: List[Node]
+        :return: Bytecode
+        """
+        code = Bytecode()
+        for statement in ast:
+            code.start_statement()
+            self.compile_statement(code, statement)
+        return code
+
+    def compile_statement(self, code, statement):
+        """
+        Compile a statement, leaving nothing on the stack
+        :param code: Bytecode
+        :param statement: Node
+        :return: Nothing
+        """
+        # Keywords produce no Value
+        if isinstance(statement, parser.KeywordNode):
+            self.compile_kw_node(code, statement)
+
+        # Evaluate expression and discard its Value
+        else:
+            self.compile_node(code, statement)
+            code.emit(POP_TOP)
+
+    def compile_node(self, code, ast):
+        """
+        Compile a given Abstract Syntax Tree (AST)
+        :param code: Bytecode
+        :param ast: Node
+        :return: Nothing
+        """
+        # Compile KeywordNode, an earlier statement reused as an expression has no Value (None)
+        if isinstance(ast, parser.KeywordNode):
+            self.compile_kw_node(code, ast)
+            code.emit(LOAD_CONST, code.add_constant(None, key=(None, None)))
+
+        # Compile UnaryNode
+        elif isinstance(ast, parser.UnaryNode):
+            self.compile_unary_node(code, ast)
+
+        # Compile BinaryNode
+        elif isinstance(ast, parser.BinaryNode):
+            self.compile_binary_node(code, ast)
+
+        elif isinstance(ast, parser.VariableNode):
+            self.compile_variable_node(code, ast)
+
+        # Load Value from ValueNode
+        elif isinstance(ast, parser.ValueNode):
+            self.compile_value_node(code, ast)
+
+        # Provided AST/Node not valid, raise when run
+        else:
+            code.emit(RAISE_NONE_NODE)
+
+    def compile_kw_node(self, code, kw_node):
+        """
+        Compile a given KeywordNode
+        :param code: Bytecode
+        :param kw_node: KeywordNode
+        :return: Nothing
+        """
+        # Printing an expression
+        if kw_node.kw_token.value == 'print':
+            self.compile_node(code, kw_node.node)
+            code.emit(PRINT)
+
+        # Delete a Variable from the program memory
+        elif kw_node.kw_token.value == 'del':
+            self.compile_del(code, kw_node)
+
+    def compile_del(self, code, kw_node):
+        """
+        Compile a del KeywordNode
+        :param code: Bytecode
+        :param kw_node: KeywordNode
+        :return: Nothing
+        """
+        # Only ValueNodes can be deleted, by their Token value
+        if isinstance(kw_node.node, parser.ValueNode):
+            code.emit(DELETE_NAME, code.add_constant(kw_node.node.token))
+
+        # Attempt to delete Node
+        else:
+            code.emit(DELETE_NODE, code.add_constant(kw_node.node))
+
+    def compile_unary_node(self, code, unary_node):
+        """
+        Compile a given UnaryNode
+        :param code: Bytecode
+        :param unary_node: UnaryNode
+        :return: Nothing
+        """
+        self.compile_node(code, unary_node.node)
+        code.emit(UNARY_OP, operators.UnaryOperators.index(unary_node.op_token.value))
+
+    def compile_binary_node(self, code, binary_node):
+        """
+        Compile a given BinaryNode
+        :param code: Bytecode
+        :param binary_node: BinaryNode
+        :return: Nothing
+        """
+        # LeftNode is evaluated before RightNode
+        self.compile_node(code, binary_node.left)
+        self.compile_node(code, binary_node.right)
+        code.emit(BINARY_OP, operators.BinaryOperators.index(binary_node.op_token.value))
+
+    def compile_variable_node(self, code, var_node):
+        """
+        Compile a given VariableNode
+        :param code: Bytecode
+        :param var_node: VariableNode
+        :return: Nothing
+        """
+        var_name = var_node.var_token.value
+        self.compile_node(code, var_node.val_node)
+        code.emit(STORE_NAME, code.add_constant(var_name, key=(str, var_name)))
+
+    def compile_value_node(self, code, value_node):
+        """
+        Compile a given ValueNode, literals with the same TokenType and source text share a constant
+        :param code: Bytecode
+        :param value_node: ValueNode
+        :return: Nothing
+        """
+        const = value_node.value
+        # Computed Values (e.g. folded by the Optimizer) have no source text and are never shared
+        key = (const.type, const.text) if const.text is not None else None
+        code.emit(LOAD_CONST, code.add_constant(const, key=key))
+
+
+def describe_instruction(code, opcode, arg):
+    """
+    Describe the argument of an instruction
+    :param code: Bytecode
+    :param opcode: Integer
+    :param arg: Integer
+    :return: String
+    """
+    if opcode == BINARY_OP:
+        return f"({operators.BinaryOperators[arg]})"
+
+    elif opcode == UNARY_OP:
+        return f"({operators.UnaryOperators[arg]})"
+
+    elif opcode in [LOAD_CONST, STORE_NAME, DELETE_NAME, DELETE_NODE]:
+        const = code.constants[arg]
+        if isinstance(const, token.Token):
+            return f"({const.value!r}, {const.type})"
+        elif const is None or isinstance(const, str):
+            return f"({const!r})"
+        elif opcode == DELETE_NODE:
+            return f"({const})"
+        return f"({const.to_string()!r}, {const.type})"
+
+    return ""
+
+
+def disassemble(code):
+    """
+    Get the readable instructions of Bytecode, one per line, statements separated by an empty line.
+    Used for debugging
+    :param code: Bytecode
+    :return: String
+    """
+    lines = []
+    statement_starts = set(code.statements)
+    for idx, (opcode, arg) in enumerate(zip(code.opcodes, code.args)):
+        if idx in statement_starts and idx > 0:
+            lines.append("")
+
+        name = OpcodeNames[opcode]
+        description = describe_instruction(code, opcode, arg)
+        lines.append(f"{idx:>6}  {name:<16}{arg:>6}  {description}".rstrip())
+
+    lines.append("")
+    lines.append(f"Constants: {len(code.constants)}, Instructions: {len(code)}, Statements: {len(code.statements)}")
+    return "\n".join(lines)
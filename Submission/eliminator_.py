@@ -0,0 +1,341 @@
+import optimizer_ as optimizer
+import parser_ as parser
+import token_ as token
+
+Integer = token.TokenType.Integer
+Float = token.TokenType.Float
+Boolean = token.TokenType.Boolean
+String = token.TokenType.String
+Variable = token.TokenType.Variable
+NumericTypes = (Integer, Float)
+
+# Largest Integer converted to Float without raising OverflowError, for any Integer below it
+MaxFloatInteger = 2 ** 1023
+
+# Numeric Operators besides comparisons, Power may raise
+ArithmeticOperators = ['+', '-', '*', '/', '%']
+
+# Operators that never raise for String operands
+StringOperators = ['+', '==', '!=']
+
+
+def deleted_name(statement):
+    """
+    Name of the Variable a statement deletes, Variables are deleted by any Token value
+    :param statement: Node
+    :return: String or None
+    """
+    if isinstance(statement, parser.KeywordNode) and statement.kw_token.value == 'del' and \
+            isinstance(statement.node, parser.ValueNode):
+        return statement.node.token.value
+    return None
+
+
+def statement_expression(statement):
+    """
+    Expression a statement evaluates
+    :param statement: Node
+    :return: Node
+    """
+    if isinstance(statement, parser.KeywordNode):
+        return statement.node
+    elif isinstance(statement, parser.VariableNode):
+        return statement.val_node
+    return statement
+
+
+def read_names(ast, resolve, names):
+    """
+    Add the Variables an expression resolves (operands and printing) to names
+    :param ast: Node
+    :param resolve: Boolean, a Variable ValueNode is resolved
+    :param names: Set[String]
+    :return: Nothing
+    """
+    stack = [(ast, resolve)]
+    while stack:
+        node, resolve = stack.pop()
+        if isinstance(node, parser.ValueNode):
+            if resolve and node.value.type == Variable:
+                names.add(node.value.value)
+        elif isinstance(node, parser.UnaryNode):
+            stack.append((node.node, True))
+        elif isinstance(node, parser.BinaryNode):
+            stack.append((node.left, True))
+            stack.append((node.right, True))
+
+
+def is_float_convertible(node, node_type):
+    """
+    Is a Numeric operand converted to Float without raising OverflowError?
+    Only Float Values and Integer literals are, any computed Integer may be too large
+    :param node: Node
+    :param node_type: TokenType
+    :return: Boolean
+    """
+    if node_type == Float:
+        return True
+    return optimizer.is_constant(node) and abs(node.value.value) < MaxFloatInteger
+
+
+def binary_may_raise(op_val, left, left_type, right, right_type):
+    """
+    Can a Binary Operation on operands of known TokenTypes raise?
+    :param op_val: String
+    :param left: Node
+    :param left_type: TokenType
+    :param right: Node
+    :param right_type: TokenType
+    :return: Boolean
+    """
+    # LeftValue and RightValue are Numeric
+    if left_type in NumericTypes and right_type in NumericTypes:
+        if op_val in optimizer.ComparisonOperators:
+            return False
+
+        # Power may overflow, divide by Zero or be complex
+        elif op_val == '**':
+            return True
+
+        # 'and' and 'or' are not Numeric Operators
+        elif op_val not in ArithmeticOperators:
+            return True
+
+        # Integer arithmetic never overflows, and by Zero is 0.0
+        elif left_type == right_type == Integer and op_val != '/':
+            return False
+
+        # Mixed arithmetic and division convert Integers to Float
+        return not (is_float_convertible(left, left_type) and is_float_convertible(right, right_type))
+
+    # Every Boolean operation is supported, unsupported ones are false
+    elif left_type == right_type == Boolean:
+        return False
+
+    # LeftValue and RightValue are String
+    elif left_type == right_type == String:
+        return op_val not in StringOperators
+
+    # Non-matching or unsupported TokenTypes raise
+    return True
+
+
+class Eliminator:
+    def __init__(self):
+        """
+        Create a new Eliminator, removing statements whose evaluation is never observed.
+        An assignment is dead if its Variable is assigned again before it is resolved or deleted. Variables left
+        when the program ends, or when a statement raises, are observed. A del is dead with the dead assignment
+        before it. Statements that could raise are never removed
+        """
+        self.types = dict()
+        # Statements with nested statements, statements that could raise, and every assigned or deleted Variable
+        self.barriers = set()
+        self.raising = set()
+        self.names = set()
+        self.statements_removed = 0
+
+    def eliminate(self, ast, variables=None):
+        """
+        Eliminate the dead statements of a List of statements into a new List, the given Nodes are never modified.
+        Variables left when the program ends or raises are observed, so they are the same as without eliminating
+        :param ast: List[Node]
+        :param variables: Dict[String, Value], Variables before the first statement
+        :return: List[Node]
+        """
+        removable = self.find_removable(ast, variables)
+        live = self.find_live(ast, removable)
+
+        eliminated = [statement for idx, statement in enumerate(ast) if idx in live]
+        self.statements_removed += len(ast) - len(eliminated)
+        return eliminated
+
+    def find_removable(self, ast, variables):
+        """
+        Find the statements that can be removed without changing the program, if their result is never observed:
+        assignments and expressions that cannot raise. Follows the TokenTypes of Variables forwards,
+        collecting the barriers, raising statements and names of Eliminator.find_live
+        :param ast: List[Node]
+        :param variables: Dict[String, Value], Variables before the first statement
+        :return: Set[Integer], statement indices
+        """
+        # Variables exist with a known TokenType before the first statement
+        self.types = {var_name: var_value.type for var_name, var_value in (variables or dict()).items()
+                      if var_value is not None}
+        self.barriers = set()
+        self.raising = set()
+        self.names = set()
+
+        removable = set()
+        for idx, statement in enumerate(ast):
+            del_name = deleted_name(statement)
+
+            # Statements with nested statements may assign or delete anything, forget every Variable
+            if optimizer.has_side_effects(statement_expression(statement)):
+                self.barriers.add(idx)
+                self.types = dict()
+
+            # Variable assignment, assigning a Variable stores the Variable itself
+            elif isinstance(statement, parser.VariableNode):
+                var_name = statement.var_token.value
+                self.names.add(var_name)
+                val_type, may_raise = self.get_type(statement.val_node, resolve=False)
+                if not may_raise:
+                    removable.add(idx)
+                else:
+                    self.raising.add(idx)
+
+                # Following statements only run if the assignment did not raise
+                if val_type is not None:
+                    self.types[var_name] = val_type
+                else:
+                    self.types.pop(var_name, None)
+
+            # Deleted Variable no longer exists, or the deletion raised
+            elif del_name is not None:
+                self.names.add(del_name)
+                if self.types.pop(del_name, None) is None:
+                    self.raising.add(idx)
+
+            # Printing resolves a single Variable, like an operand
+            elif isinstance(statement, parser.KeywordNode):
+                if statement.kw_token.value != 'print' or self.get_type(statement.node, resolve=True)[1]:
+                    self.raising.add(idx)
+
+            # Expression, its Value is discarded
+            elif not self.get_type(statement, resolve=False)[1]:
+                removable.add(idx)
+            else:
+                self.raising.add(idx)
+
+        return removable
+
+    def find_live(self, ast, removable):
+        """
+        Find the statements to keep, walking backwards with the Variables whose Value or existence
+        a following statement, the end of the program or a raising statement observes (live).
+        A removable assignment to a Variable that is not live is dead
+        :param ast: List[Node]
+        :param removable: Set[Integer], statement indices found by Eliminator.find_removable
+        :return: Set[Integer], statement indices
+        """
+        # The end of the program observes every Variable, only overwritten Values are dead
+        live_names = set(self.names)
+        # Variable -> index of a del only observing the assignment before it, dead if that assignment is dead
+        pending_del = dict()
+        live = set()
+        for idx in range(len(ast) - 1, -1, -1):
+            statement = ast[idx]
+
+            # Statements with nested statements may observe every Variable, only assigned and deleted ones matter
+            if idx in self.barriers:
+                live.add(idx)
+                live_names = set(self.names)
+                pending_del = dict()
+
+            # Variable assignment
+            elif isinstance(statement, parser.VariableNode):
+                var_name = statement.var_token.value
+                if var_name not in live_names and idx in removable:
+                    # Dead assignment, and the del of its Value
+                    live.discard(pending_del.pop(var_name, None))
+                    continue
+
+                # Assignment replaces the Variable, its previous Value is not observed
+                live.add(idx)
+                live_names.discard(var_name)
+                pending_del.pop(var_name, None)
+                read_names(statement.val_node, False, live_names)
+
+            # Deleting a Variable observes its existence, unless its assignment is dead.
+            # A following del of the same Variable observes that it no longer exists
+            elif deleted_name(statement) is not None:
+                del_name = deleted_name(statement)
+                live.add(idx)
+                if del_name in live_names or del_name in pending_del:
+                    pending_del.pop(del_name, None)
+                    live_names.add(del_name)
+                else:
+                    pending_del[del_name] = idx
+
+            # Dead expression
+            elif idx in removable:
+                continue
+
+            # Print and any other statement
+            else:
+                live.add(idx)
+                read_names(statement_expression(statement), isinstance(statement, parser.KeywordNode), live_names)
+
+            # Statement may raise, leaving every Variable as it was before it
+            if idx in self.raising:
+                live_names = set(self.names)
+                pending_del = dict()
+
+        return live
+
+    def get_type(self, ast, resolve):
+        """
+        Get the TokenType of an expression's Value, and whether evaluating it could raise.
+        Operations are typed after their operands with a work stack, so expressions of any depth are typed
+        :param ast: Node
+        :param resolve: Boolean, a Variable ValueNode is resolved
+        :return: (TokenType or None, Boolean)
+        """
+        if not isinstance(ast, (parser.UnaryNode, parser.BinaryNode)):
+            return self.get_leaf_type(ast, resolve)
+
+        # (TokenType, may raise) of each typed operation by id, operands are always resolved
+        results = dict()
+        stack = [ast]
+        while stack:
+            node = stack[-1]
+            if id(node) in results:
+                stack.pop()
+                continue
+
+            operands = [node.node] if isinstance(node, parser.UnaryNode) else [node.left, node.right]
+            pending = [operand for operand in operands
+                       if isinstance(operand, (parser.UnaryNode, parser.BinaryNode)) and id(operand) not in results]
+            if pending:
+                stack.extend(reversed(pending))
+                continue
+
+            stack.pop()
+            typed = [results[id(operand)] if id(operand) in results else self.get_leaf_type(operand, True)
+                     for operand in operands]
+
+            if isinstance(node, parser.UnaryNode):
+                sub_type, may_raise = typed[0]
+                if sub_type in NumericTypes or sub_type == Boolean:
+                    results[id(node)] = optimizer.unary_type(sub_type), may_raise
+                else:
+                    results[id(node)] = None, True
+
+            else:
+                (left_type, left_raises), (right_type, right_raises) = typed
+                if left_raises or right_raises:
+                    results[id(node)] = None, True
+                else:
+                    op_val = node.op_token.value
+                    may_raise = binary_may_raise(op_val, node.left, left_type, node.right, right_type)
+                    results[id(node)] = optimizer.binary_type(op_val, left_type, right_type, node.right), may_raise
+
+        return results[id(ast)]
+
+    def get_leaf_type(self, ast, resolve):
+        """
+        Get the TokenType of a Node without operands, and whether evaluating it could raise
+        :param ast: Node
+        :param resolve: Boolean, a Variable ValueNode is resolved
+        :return: (TokenType or None, Boolean)
+        """
+        if isinstance(ast, parser.ValueNode):
+            # Resolved Variable must exist
+            if resolve and ast.value.type == Variable:
+                var_type = self.types.get(ast.value.value)
+                return var_type, var_type is None
+            return ast.value.type, False
+
+        # Nested statements and None Nodes
+        return None, True
@@ -0,0 +1,198 @@
+# Interpreter errors shared by every execution engine, so each engine reports the same messages
+
+
+def engine_error(engine, engines):
+    """
+    Error for an unknown Interpreter engine
+    :param engine: String
+    :param engines: List[String]
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"ValueError: Unknown engine '{engine}'\n"
+                      f"in Engines: '{engines}'\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def hook_event_error(event, events):
+    """
+    Error for a hook registered or removed for an unknown event
+    :param event: String
+    :param events: List[String]
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"ValueError: Unknown hook event '{event}'\n"
+                      f"in Events: '{events}'\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def depth_error(engine):
+    """
+    Error for an expression nested deeper than an engine recursing once per level can compile or evaluate
+    :param engine: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"RecursionError: Expression is nested too deeply, run it with '--engine stack'\n"
+                      f"in Engine: '{engine}'\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def none_node_error():
+    """
+    Error for evaluating a missing (None) Node
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"SyntaxError: AST Node contains 'None' value\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def print_variable_error(var_name, kw_val):
+    """
+    Error for printing a non-existent Variable
+    :param var_name: String
+    :param kw_val: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR---\n"
+                      f"PrintError: Cannot Print non-existent Variable\n"
+                      f"in Variable: '{var_name}'\n"
+                      f"in Keyword: '{kw_val}'\n"
+                      f"--- INTERPRETER ERROR---")
+
+
+def delete_variable_error(tk, kw_val):
+    """
+    Error for deleting a non-existent Variable
+    :param tk: Token
+    :param kw_val: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR---\n"
+                      f"DeletionError: Cannot delete non-existent Variable\n"
+                      f"in Variable: '{tk.value, tk.type}'\n"
+                      f"in Keyword: '{kw_val}'\n"
+                      f"--- INTERPRETER ERROR---")
+
+
+def delete_token_error(tk, kw_val):
+    """
+    Error for deleting a non-Variable Token
+    :param tk: Token
+    :param kw_val: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR---\n"
+                      f"DeletionError: Cannot delete non-Variable Token\n"
+                      f"in Token: '{tk.value, tk.type}'\n"
+                      f"in Keyword: '{kw_val}'\n"
+                      f"--- INTERPRETER ERROR---")
+
+
+def delete_variable_node_error(node, kw_val):
+    """
+    Error for deleting a non-Variable Node
+    :param node: Node
+    :param kw_val: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR---\n"
+                      f"DeletionError: Cannot delete non-Variable Node\n"
+                      f"in Node: '{node}'\n"
+                      f"in Keyword: '{kw_val}'\n"
+                      f"--- INTERPRETER ERROR---")
+
+
+def delete_node_error(node, kw_val):
+    """
+    Error for deleting a Node
+    :param node: Node
+    :param kw_val: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR---\n"
+                      f"DeletionError: Cannot delete Node\n"
+                      f"in Node: '{node}'\n"
+                      f"in Keyword: '{kw_val}'\n"
+                      f"--- INTERPRETER ERROR---")
+
+
+def unary_variable_error(var_value, op_val):
+    """
+    Error for a Unary Operation on a non-existent Variable
+    :param var_value: Value
+    :param op_val: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"ValueError: Cannot perform Unary Operation on non-existent Variable\n"
+                      f"in Variable: '{var_value.to_string(), var_value.type}'\n"
+                      f"in Operation: '{op_val}'\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def unary_type_error(sub_value, op_val):
+    """
+    Error for a Unary Operation on a non-Numeric or non-Boolean Value
+    :param sub_value: Value
+    :param op_val: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"ValueError: Cannot perform Unary Operation on TokenType '{sub_value.type}'\n"
+                      f"in Token: '{sub_value.to_string(), sub_value.type}'\n"
+                      f"in Operation: '{op_val}'\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def variable_assignment_error(var_name):
+    """
+    Error for using a Variable before assignment
+    :param var_name: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"ValueError: Variable used before assignment\n"
+                      f"in Variable '{var_name}'\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def binary_type_error(left, right, op_val):
+    """
+    Error for a Binary Operation on non-matching or unsupported Value TokenTypes
+    :param left: Value
+    :param right: Value
+    :param op_val: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"ValueError: Mis-match in Binary Operation TokenType\n"
+                      f"in Left: '{left.to_string(), left.type}'\n"
+                      f"in Right: '{right.to_string(), right.type}'\n"
+                      f"in Operator: '{op_val}'\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def numpy_error():
+    """
+    Error for evaluating a batch of rows without NumPy installed
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"ImportError: Batch evaluation requires NumPy\n"
+                      f"--- INTERPRETER ERROR ---")
+
+
+def batch_column_error(var_name, reason):
+    """
+    Error for an invalid column of input Variables of a batch
+    :param var_name: String or None
+    :param reason: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- INTERPRETER ERROR ---\n"
+                      f"ValueError: {reason}\n"
+                      f"in Column: '{var_name}'\n"
+                      f"--- INTERPRETER ERROR ---")
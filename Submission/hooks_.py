@@ -0,0 +1,184 @@
+import token_ as token
+
+Variable = token.TokenType.Variable
+
+# Events hooks are registered for, and the arguments their callbacks are called with
+Events = [
+    'on_token',             # (Token) for every Token of a parsed program, before it is parsed
+    'on_statement_start',   # (Node) before each statement is evaluated
+    'on_statement_end',     # (Node) after each statement is evaluated without an error
+    'on_node_eval',         # (Node, Value) after each Node is evaluated, None for keyword statements
+    'on_variable_set',      # (String, Value) after a Variable is assigned
+    'on_variable_delete',   # (String) after a Variable is deleted
+    'on_print',             # (String) after a line is printed
+]
+
+# Interpreter evaluator wrapped for each Node level event, other events are emitted once per program or statement
+WrappedEvaluators = {
+    'on_node_eval': 'eval_ast',
+    'on_variable_set': 'eval_variable_node',
+    'on_variable_delete': 'eval_kw_node',
+    'on_print': 'print_value',
+}
+
+
+class Hooks:
+    def __init__(self, prog_interpreter):
+        """
+        Create new Hooks, the callbacks registered for each event of an Interpreter. Node level events wrap the
+        Interpreter's evaluator on the instance while they have callbacks, so an event without any costs nothing
+        :param prog_interpreter: Interpreter
+        """
+        self.interpreter = prog_interpreter
+        # Callbacks of each event, replaced on every change so they can be changed while they are called
+        self.callbacks = {event: () for event in Events}
+        # Evaluator each wrapper replaced, None if it was the class method
+        self.wrapped = dict()
+
+    def is_empty(self):
+        """
+        Check whether no event has a callback
+        :return: Boolean
+        """
+        return not any(self.callbacks.values())
+
+    def add(self, event, callback):
+        """
+        Register a callback for an event
+        :param event: String, one of Events
+        :param callback: Function
+        :return: Nothing
+        """
+        if not self.callbacks[event] and event in WrappedEvaluators:
+            self.wrap(event)
+        self.callbacks[event] += (callback,)
+
+    def remove(self, event, callback):
+        """
+        Remove a callback of an event, the evaluator of a Node level event is restored once it has none
+        :param event: String, one of Events
+        :param callback: Function
+        :return: Boolean, whether the callback was registered
+        """
+        callbacks = list(self.callbacks[event])
+        if callback not in callbacks:
+            return False
+        callbacks.remove(callback)
+        self.callbacks[event] = tuple(callbacks)
+
+        if not callbacks and event in WrappedEvaluators:
+            self.unwrap(event)
+        return True
+
+    def wrap(self, event):
+        """
+        Replace the Interpreter's evaluator of a Node level event with one emitting it
+        :param event: String, key of WrappedEvaluators
+        :return: Nothing
+        """
+        name = WrappedEvaluators[event]
+        prog_interpreter = self.interpreter
+        # Evaluators already wrapped on the instance (e.g. by a Profiler) stay wrapped inside
+        self.wrapped[event] = prog_interpreter.__dict__.get(name)
+        evaluator = getattr(prog_interpreter, name)
+        callbacks = self.callbacks
+
+        if event == 'on_node_eval':
+            def wrapper(node):
+                result = evaluator(node)
+                for callback in callbacks['on_node_eval']:
+                    callback(node, result)
+                return result
+
+        elif event == 'on_variable_set':
+            def wrapper(var_node):
+                result = evaluator(var_node)
+                for callback in callbacks['on_variable_set']:
+                    callback(var_node.var_token.value, result)
+                return result
+
+        # Keywords other than del are not Variable deletions
+        elif event == 'on_variable_delete':
+            def wrapper(kw_node):
+                evaluator(kw_node)
+                if kw_node.kw_token.value == 'del':
+                    for callback in callbacks['on_variable_delete']:
+                        callback(kw_node.node.token.value)
+
+        # The line printed for a single Variable is its Value's
+        else:
+            def wrapper(kw_node, to_print):
+                evaluator(kw_node, to_print)
+                if to_print.type == Variable:
+                    to_print = prog_interpreter.get_variable(to_print)
+                line = to_print.to_string()
+                for callback in callbacks['on_print']:
+                    callback(line)
+
+        setattr(prog_interpreter, name, wrapper)
+
+    def unwrap(self, event):
+        """
+        Restore the Interpreter's evaluator of a Node level event
+        :param event: String, key of WrappedEvaluators
+        :return: Nothing
+        """
+        name = WrappedEvaluators[event]
+        evaluator = self.wrapped.pop(event)
+        if evaluator is None:
+            delattr(self.interpreter, name)
+        else:
+            setattr(self.interpreter, name, evaluator)
+
+    def emit_tokens(self, tokens):
+        """
+        Emit on_token for every Token of a List or TokenBuffer
+        :param tokens: List[Token] or TokenBuffer
+        :return: Nothing
+        """
+        # Tokens of a TokenBuffer are only materialized for callbacks
+        callbacks = self.callbacks['on_token']
+        if not callbacks:
+            return
+
+        for tk in tokens:
+            for callback in callbacks:
+                callback(tk)
+
+    def iter_tokens(self, tokens):
+        """
+        Emit on_token for every Token of a stream as it is read
+        :param tokens: Iterator[Token]
+        :return: Iterator[Token]
+        """
+        callbacks = self.callbacks['on_token']
+        if not callbacks:
+            return tokens
+
+        def emit_each(stream):
+            for tk in stream:
+                for callback in callbacks:
+                    callback(tk)
+                yield tk
+
+        return emit_each(tokens)
+
+    def statement_evaluator(self, eval_statement):
+        """
+        Wrap a statement evaluator to emit on_statement_start and on_statement_end around each statement
+        :param eval_statement: Function(Node) -> Value
+        :return: Function(Node) -> Value
+        """
+        callbacks = self.callbacks
+        if not callbacks['on_statement_start'] and not callbacks['on_statement_end']:
+            return eval_statement
+
+        def eval_hooked(statement):
+            for callback in callbacks['on_statement_start']:
+                callback(statement)
+            result = eval_statement(statement)
+            for callback in callbacks['on_statement_end']:
+                callback(statement)
+            return result
+
+        return eval_hooked
@@ -1,451 +1,1037 @@
-import token_ as token
-import lexer_ as lexer
-import parser_ as parser
-
-
-class Interpreter:
-    def __init__(self, debug=False):
-        """
-        Create a new Interpreter
-        """
-        self.debug = debug
-        self.lexer = lexer.Lexer()
-        self.parser = parser.Parser()
-        self.variables = dict()
-
-    def eval_ast(self, ast):
-        """
-        Evaluate a given Abstract Syntax Tree (AST)
-        :param ast: Node
-        :return: Node or Token
-        """
-        # Evaluate KeywordNode
-        if isinstance(ast, parser.KeywordNode):
-            self.eval_kw_node(ast)
-
-        # Evaluate UnaryNode
-        elif isinstance(ast, parser.UnaryNode):
-            return self.eval_unary_node(ast)
-
-        # Evaluate BinaryNode
-        elif isinstance(ast, parser.BinaryNode):
-            return self.eval_binary_node(ast)
-
-        elif isinstance(ast, parser.VariableNode):
-            return self.eval_variable_node(ast)
-
-        # Provide Token from ValueNode
-        elif isinstance(ast, parser.ValueNode):
-            return ast.token
-
-        # Provided AST/Node not valid
-        # Previous Node requires current Node to have value
-        else:
-            raise SystemExit(f"--- INTERPRETER ERROR ---\n"
-                             f"SyntaxError: AST Node contains 'None' value\n"
-                             f"--- INTERPRETER ERROR ---")
-
-    def eval_kw_node(self, kw_node):
-        """
-        Evaluate a given KeywordNode
-        :param kw_node: KeywordNode
-        :return: Nothing
-        """
-        # Printing an expression
-        if kw_node.kw_token.value == 'print':
-            # Evaluate Node of print expression
-            to_print = self.eval_ast(kw_node.node)
-
-            # Printing a single Variable
-            if to_print.type == token.TokenType.Variable:
-                # Does the Variable exist?
-                try:
-                    print(self.variables[to_print.value].value)
-
-                # Variable does not exist
-                except KeyError:
-                    raise SystemExit(f"--- INTERPRETER ERROR---\n"
-                                     f"PrintError: Cannot Print non-existent Variable\n"
-                                     f"in Variable: '{to_print.value}'\n"
-                                     f"in Keyword: '{kw_node.kw_token.value}'\n"
-                                     f"--- INTERPRETER ERROR---")
-
-            # Print entire valid expression
-            else:
-                print(to_print.value)
-
-        # Delete a Variable from the program memory
-        elif kw_node.kw_token.value == 'del':
-            # Does the Variable exist?
-            try:
-                self.variables.pop(kw_node.node.token.value)
-
-            # Variable does not exist
-            except KeyError:
-                # Cannot delete
-                if isinstance(kw_node.node, parser.ValueNode):
-                    # Attempt to delete non-existent Variable
-                    if kw_node.node.token.type == token.TokenType.Variable:
-                        raise SystemExit(f"--- INTERPRETER ERROR---\n"
-                                         f"DeletionError: Cannot delete non-existent Variable\n"
-                                         f"in Variable: '{kw_node.node.token.value, kw_node.node.token.type}'\n"
-                                         f"in Keyword: '{kw_node.kw_token.value}'\n"
-                                         f"--- INTERPRETER ERROR---")
-
-                    # Attempt to delete non-Variable Token
-                    else:
-                        raise SystemExit(f"--- INTERPRETER ERROR---\n"
-                                         f"DeletionError: Cannot delete non-Variable Token\n"
-                                         f"in Token: '{kw_node.node.token.value, kw_node.node.token.type}'\n"
-                                         f"in Keyword: '{kw_node.kw_token.value}'\n"
-                                         f"--- INTERPRETER ERROR---")
-
-                # Attempt to delete non-Variable Node
-                else:
-                    raise SystemExit(f"--- INTERPRETER ERROR---\n"
-                                     f"DeletionError: Cannot delete non-Variable Node\n"
-                                     f"in Node: '{kw_node.node}'\n"
-                                     f"in Keyword: '{kw_node.kw_token.value}'\n"
-                                     f"--- INTERPRETER ERROR---")
-
-            # Attempt to delete Node
-            except AttributeError:
-                raise SystemExit(f"--- INTERPRETER ERROR---\n"
-                                 f"DeletionError: Cannot delete Node\n"
-                                 f"in Node: '{kw_node.node}'\n"
-                                 f"in Keyword: '{kw_node.kw_token.value}'\n"
-                                 f"--- INTERPRETER ERROR---")
-
-    def eval_unary_node(self, unary_node):
-        """
-        Evaluate a given UnaryNode
-        :param unary_node: UnaryNode
-        :return: Token
-        """
-        # Evaluate Node of UnaryNode (Operator, Node) to get Token
-        sub_node = self.eval_ast(unary_node.node)
-
-        # Token is Variable
-        if sub_node.type == token.TokenType.Variable:
-            # Does the Variable exist?
-            try:
-                sub_node = self.variables[sub_node.value]
-
-            # Cannot unary non-existent Variable
-            except KeyError:
-                raise SystemExit(f"--- INTERPRETER ERROR ---\n"
-                                 f"ValueError: Cannot perform Unary Operation on non-existent Variable\n"
-                                 f"in Variable: '{sub_node.value, sub_node.type}'\n"
-                                 f"in Operation: '{unary_node.op_token.value}'\n"
-                                 f"--- INTERPRETER ERROR ---")
-
-        # Token is Numeric
-        if sub_node.type in [token.TokenType.Integer, token.TokenType.Float]:
-            return self.eval_numeric_unary_expr(sub_node, unary_node.op_token.value)
-
-        # Token is Boolean
-        elif sub_node.type == token.TokenType.Boolean:
-            return self.eval_conditional_unary_expr(sub_node, unary_node.op_token.value)
-
-        # Cannot perform Unary operation on non-Numeric or non-Boolean TokenType
-        raise SystemExit(f"--- INTERPRETER ERROR ---\n"
-                         f"ValueError: Cannot perform Unary Operation on TokenType '{sub_node.type}'\n"
-                         f"in Token: '{sub_node.value, sub_node.type}'\n"
-                         f"in Operation: '{unary_node.op_token.value}'\n"
-                         f"--- INTERPRETER ERROR ---")
-
-    def eval_numeric_unary_expr(self, num_token, op_val):
-        """
-        Evaluate numeric UnaryNode expression
-        :param num_token: Token
-        :param op_val: String
-        :return: Token
-        """
-        # Invert sign
-        if op_val == '-':
-            # Convert Token from string ('10' = 10)
-            num_token.convert_from_string()
-            # Flip the number's sign
-            num_token.value = -num_token.value
-            # Convert Token back to string
-            num_token.convert_to_string()
-        return num_token
-
-    def eval_conditional_unary_expr(self, bool_token, op_val):
-        """
-        Evaluate boolean UnaryNode expression
-        :param bool_token: Token
-        :param op_val: String
-        :return: Token
-        """
-        # Operator is unary operation '!' or 'not' keyword
-        if op_val in ['!', 'not']:
-            # Convert Token from string ('true' = True, 'false' = False)
-            bool_token.convert_from_string()
-            # Flip the boolean value
-            bool_token.value = not bool_token.value
-            # Convert Token back to string
-            bool_token.convert_to_string()
-        return bool_token
-
-    def eval_binary_node(self, binary_node):
-        """
-        Evaluate a given BinaryNode
-        :param binary_node: BinaryNode
-        :return: Token
-        """
-        # Evaluate LeftNode and RightNode of BinaryNode (LeftNode, Operator, RightNode) to get Tokens
-        left = self.eval_ast(binary_node.left)
-        right = self.eval_ast(binary_node.right)
-
-        # LeftToken is Variable
-        if left.type == token.TokenType.Variable:
-            # Token.value Variable exists
-            try:
-                left = self.variables[left.value]
-
-            # Variable does not exist
-            except KeyError:
-                raise SystemExit(f"--- INTERPRETER ERROR ---\n"
-                                 f"ValueError: Variable used before assignment\n"
-                                 f"in Variable '{left.value}'\n"
-                                 f"--- INTERPRETER ERROR ---")
-
-        # RightToken is Variable
-        if right.type == token.TokenType.Variable:
-            # Token.value Variable exists
-            try:
-                right = self.variables[right.value]
-
-            # Variable does not exist
-            except KeyError:
-                raise SystemExit(f"--- INTERPRETER ERROR ---\n"
-                                 f"ValueError: Variable used before assignment\n"
-                                 f"in Variable '{right.value}'\n"
-                                 f"--- INTERPRETER ERROR ---")
-
-        # LeftToken and RightToken are Numeric
-        if (left.type in [token.TokenType.Integer, token.TokenType.Float]) and \
-                (right.type in [token.TokenType.Integer, token.TokenType.Float]):
-
-            # Operator is numeric binary operation keyword
-            if binary_node.op_token.value in ['+', '-', '*', '/', '%', '**']:
-                return self.eval_numeric_binary_expr(left, right, binary_node.op_token.value)
-
-            # Operator is boolean binary operation expression
-            elif binary_node.op_token.value in ['==', '!=', '>', '<', '>=', '<=']:
-                return self.eval_boolean_binary_expr(left, right, binary_node.op_token.value)
-
-        # LeftToken and RightToken are Boolean
-        elif (left.type == token.TokenType.Boolean) and (right.type == token.TokenType.Boolean):
-            return self.eval_conditional_binary_expr(left, right, binary_node.op_token.value)
-
-        # LeftToken and RightToken are String
-        elif (left.type == token.TokenType.String) and (right.type == token.TokenType.String):
-            return self.eval_string_binary_expr(left, right, binary_node.op_token.value)
-
-        # Cannot perform action on non-matching LeftToken and RightToken TokenType
-        raise SystemExit(f"--- INTERPRETER ERROR ---\n"
-                         f"ValueError: Mis-match in Binary Operation TokenType\n"
-                         f"in Left: '{left.value, left.type}'\n"
-                         f"in Right: '{right.value, right.type}'\n"
-                         f"in Operator: '{binary_node.op_token.value}'\n"
-                         f"--- INTERPRETER ERROR ---")
-
-    def eval_numeric_binary_expr(self, left_token, right_token, op_val):
-        """
-        Evaluate numeric BinaryNode expression
-        :param left_token: Token
-        :param right_token: Token
-        :param op_val: String
-        :return: Token
-        """
-        # Convert LeftToken and RightToken values from strings
-        left_token.convert_from_string()
-        right_token.convert_from_string()
-
-        # Obtain LeftToken and RightToken values
-        left_val = left_token.value
-        right_val = right_token.value
-        result = None
-
-        # Addition
-        if op_val == '+':
-            result = str(left_val + right_val)
-
-        # Subtraction
-        elif op_val == '-':
-            result = str(left_val - right_val)
-
-        # Multiplication
-        elif op_val == '*':
-            result = str(left_val * right_val)
-
-        # Division
-        elif op_val == '/':
-            # Division by Zero
-            if right_val == 0.0:
-                result = str(0.0)
-            else:
-                result = str(left_val / right_val)
-
-        # Modulus
-        elif op_val == '%':
-            # Modulus by Zero
-            if right_val == 0.0:
-                result = str(0.0)
-            else:
-                result = str(left_val % right_val)
-
-        # Indices
-        elif op_val == '**':
-            result = str(left_val ** right_val)
-
-        # Return new Token
-        return token.Token(result)
-
-    def eval_boolean_binary_expr(self, left_token, right_token, op_val):
-        """
-        Evaluate boolean BinaryNode expression
-        :param left_token: Token
-        :param right_token: Token
-        :param op_val: String
-        :return: Token
-        """
-        # Convert LeftToken and RightToken from strings
-        left_token.convert_from_string()
-        right_token.convert_from_string()
-
-        # Obtain LeftToken and RightToken values
-        left_val = left_token.value
-        right_val = right_token.value
-        result = None
-        # Boolean comparisons must be converted to str().lower() to identify TokenType
-
-        # Equal to
-        if op_val == '==':
-            result = str(left_val == right_val).lower()
-
-        # Not equal to
-        elif op_val == '!=':
-            result = str(left_val != right_val).lower()
-
-        # Greater than
-        elif op_val == '>':
-            result = str(left_val > right_val).lower()
-
-        # Less than
-        elif op_val == '<':
-            result = str(left_val < right_val).lower()
-
-        # Greater than or equal to
-        elif op_val == '>=':
-            result = str(left_val >= right_val).lower()
-
-        # Less than or equal to
-        elif op_val == '<=':
-            result = str(left_val <= right_val).lower()
-
-        # Return new token
-        return token.Token(result)
-
-    def eval_conditional_binary_expr(self, left_token, right_token, op_val):
-        """
-        Evaluate conditional BinaryNode expression
-        :param left_token: Token
-        :param right_token: Token
-        :param op_val: String
-        :return: Token
-        """
-        # Convert LeftToken and RightToken from strings
-        left_token.convert_from_string()
-        right_token.convert_from_string()
-
-        # Obtain LeftToken and RightToken values
-        left_val = left_token.value
-        right_val = right_token.value
-        result = None
-
-        # And
-        if op_val == 'and':
-            result = left_val and right_val
-
-        # Or
-        elif op_val == 'or':
-            result = left_val or right_val
-
-        # Equal to
-        elif op_val == '==':
-            result = left_val is right_val
-
-        # Not equal to
-        elif op_val == '!=':
-            result = left_val is not right_val
-
-        # Create new Token and manually define TokenType as Boolean
-        result_token = token.Token(result, t_type=token.TokenType.Boolean)
-        # Convert Boolean to String and return new Token
-        result_token.convert_to_string()
-        return result_token
-
-    def eval_string_binary_expr(self, left_token, right_token, op_val):
-        """
-        Evaluate string BinaryNode expression
-        :param left_token: Token
-        :param right_token: Token
-        :param op_val: String
-        :return: Token
-        """
-        # Obtain LeftToken and RightToken String values
-        left_val = left_token.value
-        right_val = right_token.value
-        result = None
-        t_type = None
-        # Concatenation generates new String whilst Comparison generates Boolean
-
-        # Concatenate
-        if op_val == '+':
-            result = left_val + right_val
-            t_type = token.TokenType.String
-
-        # Equal to
-        elif op_val == '==':
-            result = str(left_val == right_val).lower()
-            t_type = token.TokenType.Boolean
-
-        # Not equal to
-        elif op_val == '!=':
-            result = str(left_val != right_val).lower()
-            t_type = token.TokenType.Boolean
-
-        # Create new Token and manually define TokenType by Operation, then return new Token
-        return token.Token(result, t_type=t_type)
-
-    def eval_variable_node(self, var_node):
-        val_token = self.eval_ast(var_node.val_node)
-        self.variables[var_node.var_token.value] = val_token
-        return self.variables[var_node.var_token.value]
-
-    def execute(self, expr):
-        """
-        Execute a given expression for its result
-        :param expr: String
-        """
-        # Clear memory
-        self.variables = dict()
-
-        # Tokenize expression
-        tokens = self.lexer.tokenize(expr)
-
-        if self.debug:
-            self.lexer.print_tokens()
-
-        # Parse Tokens to Abstract Syntax Tree (AST)
-        ast = self.parser.parse(expr, tokens)
-
-        if self.debug:
-            self.parser.print_ast()
-
-        # Evaluate AST
-        for statement in ast:
-            self.eval_ast(statement)
+import gc
+
+import token_ as token
+import lexer_ as lexer
+import cache_ as cache
+import closure_ as closure
+import compiler_ as compiler
+import eliminator_ as eliminator
+import errors_ as errors
+import optimizer_ as optimizer
+import hooks_ as hooks
+import parser_ as parser
+import profiler_ as profiler
+import resolver_ as resolver
+import sink_ as sink
+import transpiler_ as transpiler
+import value_ as value
+import vector_ as vector
+import vm_ as vm
+
+# Execution engines for evaluating the AST
+Engines = ['tree', 'stack', 'closure', 'vm', 'python']
+
+# Approximate bytes per AST Node of a parsed and compiled program of each engine, measured with tracemalloc
+ProgramNodeBytes = {'tree': 300, 'stack': 300, 'closure': 520, 'vm': 310, 'python': 660}
+
+# Marks a Node on the work stack of Interpreter.eval_ast_stack whose children are evaluated
+ExitNode = object()
+
+# Read on every Variable access, bound once instead of looked up through their modules
+Variable = token.TokenType.Variable
+Empty = resolver.Empty
+
+
+class Interpreter:
+    def __init__(self, debug=False, token_buffer=False, engine="tree", optimize=False, cache=None,
+                 parse_cache=None, parallel=None, output=None, profile=False):
+        """
+        Create a new Interpreter
+        :param debug: Boolean, print Tokens and AST
+        :param token_buffer: Boolean, tokenize into a compact TokenBuffer instead of a List of Tokens
+        :param engine: String, 'tree' walks the AST recursively, 'stack' walks it with an explicit work stack,
+        'closure' compiles each statement to Python closures, 'vm' compiles the AST to Bytecode for a stack-based
+        VirtualMachine, 'python' transpiles the AST to Python
+        :param optimize: Boolean, fold constants, simplify identities and eliminate dead statements of the AST
+        before evaluating it
+        :param cache: ProgramCache, load parsed (and optimized) programs of the same source instead of parsing them,
+        and store the programs parsed
+        :param parse_cache: ParseCache, keep the programs compiled by Interpreter.execute in memory, so executing
+        the same source again neither parses nor compiles it
+        :param parallel: ParallelParser, tokenize and parse large programs in chunks on worker processes
+        :param output: OutputSink, receives every printed line (default: a StdoutSink buffering the standard output)
+        :param profile: Boolean, record the time of each stage, source line and Node kind, and the Operators
+        and Value TokenTypes evaluated, in Interpreter.profiler. Profiled programs are always parsed
+        in this process, neither loaded from the caches nor parsed in parallel
+        """
+        # Engine must be known
+        if engine not in Engines:
+            raise errors.engine_error(engine, Engines)
+
+        self.debug = debug
+        self.token_buffer = token_buffer
+        self.engine = engine
+        self.optimize = optimize
+        self.lexer = lexer.Lexer()
+        self.parser = parser.Parser()
+        self.closure_compiler = closure.ClosureCompiler()
+        self.bytecode_compiler = compiler.BytecodeCompiler()
+        self.vm = vm.VirtualMachine()
+        self.transpiler = transpiler.Transpiler()
+        self.optimizer = optimizer.Optimizer()
+        self.eliminator = eliminator.Eliminator()
+        self.resolver = resolver.Resolver()
+        self.cache = cache
+        self.parse_cache = parse_cache
+        self.parallel = parallel
+        self.output = output if output is not None else sink.StdoutSink()
+        self.variables = dict()
+        # Values of the Variables of the SlotProgram being walked, by slot, and the slot of each Variable
+        self.slots = []
+        self.slot_table = dict()
+
+        # Hooks registered for the events of running programs, None while there are none, so an Interpreter
+        # without hooks only checks for them once per program
+        self.hooks = None
+
+        # Profiling wraps the evaluators on the instance, an Interpreter not profiling only checks for a Profiler
+        # once per stage of each program
+        self.profiler = None
+        if profile:
+            self.profiler = profiler.Profiler()
+            self.eval_ast = self.profiler.time_nodes(self.eval_ast)
+            self.eval_binary_values = self.profiler.count_operations(self.eval_binary_values)
+            self.eval_unary_value = self.profiler.count_operations(self.eval_unary_value)
+
+    def add_hook(self, event, callback):
+        """
+        Register a callback for an event of running programs, called with the arguments listed in hooks.Events.
+        While any hook is registered, programs are compiled for the tree walker whatever the engine,
+        so every event is seen. Hooks added while a program runs take effect from the next program compiled
+        :param event: String, one of hooks.Events
+        :param callback: Function
+        :return: Nothing
+        """
+        # Event must be known
+        if event not in hooks.Events:
+            raise errors.hook_event_error(event, hooks.Events)
+
+        if self.hooks is None:
+            self.hooks = hooks.Hooks(self)
+        self.hooks.add(event, callback)
+
+    def remove_hook(self, event, callback):
+        """
+        Remove a callback registered by Interpreter.add_hook, once none are left programs run on the engine again
+        :param event: String, one of hooks.Events
+        :param callback: Function
+        :return: Boolean, whether the callback was registered
+        """
+        # Event must be known
+        if event not in hooks.Events:
+            raise errors.hook_event_error(event, hooks.Events)
+
+        if self.hooks is None:
+            return False
+        removed = self.hooks.remove(event, callback)
+        if self.hooks.is_empty():
+            self.hooks = None
+        return removed
+
+    def eval_ast(self, ast):
+        """
+        Evaluate a given Abstract Syntax Tree (AST)
+        :param ast: Node
+        :return: Value
+        """
+        # Evaluate KeywordNode
+        if isinstance(ast, parser.KeywordNode):
+            self.eval_kw_node(ast)
+
+        # Evaluate UnaryNode
+        elif isinstance(ast, parser.UnaryNode):
+            return self.eval_unary_node(ast)
+
+        # Evaluate BinaryNode
+        elif isinstance(ast, parser.BinaryNode):
+            return self.eval_binary_node(ast)
+
+        elif isinstance(ast, parser.VariableNode):
+            return self.eval_variable_node(ast)
+
+        # Provide Value from ValueNode
+        elif isinstance(ast, parser.ValueNode):
+            return ast.value
+
+        # Provided AST/Node not valid
+        # Previous Node requires current Node to have value
+        else:
+            raise errors.none_node_error()
+
+    def eval_kw_node(self, kw_node):
+        """
+        Evaluate a given KeywordNode
+        :param kw_node: KeywordNode
+        :return: Nothing
+        """
+        # Printing an expression
+        if kw_node.kw_token.value == 'print':
+            # Evaluate Node of print expression
+            self.print_value(kw_node, self.eval_ast(kw_node.node))
+
+        # Delete a Variable from the program memory, emptying its slot
+        elif kw_node.kw_token.value == 'del':
+            del_node = kw_node.node
+
+            if isinstance(del_node, parser.ValueNode):
+                # Any other Token (e.g. a String) deletes the Variable named by its value
+                if del_node.value.type == Variable:
+                    slot = del_node.value.slot
+                else:
+                    slot = self.slot_table.get(del_node.token.value)
+
+                # Does the Variable exist?
+                if slot is not None and self.slots[slot] is not Empty:
+                    self.slots[slot] = Empty
+
+                # Variable the program does not use, only in the program memory
+                elif slot is None and del_node.token.value in self.variables:
+                    del self.variables[del_node.token.value]
+
+                # Attempt to delete non-existent Variable
+                elif del_node.token.type == Variable:
+                    raise errors.delete_variable_error(del_node.token, kw_node.kw_token.value)
+
+                # Attempt to delete non-Variable Token
+                else:
+                    raise errors.delete_token_error(del_node.token, kw_node.kw_token.value)
+
+            # Attempt to delete Node
+            else:
+                raise errors.delete_node_error(del_node, kw_node.kw_token.value)
+
+    def print_value(self, kw_node, to_print):
+        """
+        Print the evaluated Value of a print KeywordNode
+        :param kw_node: KeywordNode
+        :param to_print: Value
+        :return: Nothing
+        """
+        # Printing a single Variable
+        if to_print.type == Variable:
+            var_value = self.get_variable(to_print)
+
+            # Variable does not exist
+            if var_value is Empty:
+                raise errors.print_variable_error(to_print.value, kw_node.kw_token.value)
+            self.output.write_line(var_value.to_string())
+
+        # Print entire valid expression
+        else:
+            self.output.write_line(to_print.to_string())
+
+    def eval_unary_node(self, unary_node):
+        """
+        Evaluate a given UnaryNode
+        :param unary_node: UnaryNode
+        :return: Value
+        """
+        # Evaluate Node of UnaryNode (Operator, Node) to get Value
+        return self.eval_unary_value(unary_node, self.eval_ast(unary_node.node))
+
+    def eval_unary_value(self, unary_node, sub_node):
+        """
+        Evaluate a given UnaryNode from the Value of its Node
+        :param unary_node: UnaryNode
+        :param sub_node: Value
+        :return: Value
+        """
+        # Value is Variable
+        if sub_node.type == Variable:
+            try:
+                var_value = self.slots[sub_node.slot]
+            # Variable Value created while running has no slot
+            except AttributeError:
+                var_value = self.find_variable(sub_node.value)
+
+            # Cannot unary non-existent Variable
+            if var_value is Empty:
+                raise errors.unary_variable_error(sub_node, unary_node.op_token.value)
+            sub_node = var_value
+
+        # Value is Numeric
+        if sub_node.type in [token.TokenType.Integer, token.TokenType.Float]:
+            return self.eval_numeric_unary_expr(sub_node, unary_node.op_token.value)
+
+        # Value is Boolean
+        elif sub_node.type == token.TokenType.Boolean:
+            return self.eval_conditional_unary_expr(sub_node, unary_node.op_token.value)
+
+        # Cannot perform Unary operation on non-Numeric or non-Boolean TokenType
+        raise errors.unary_type_error(sub_node, unary_node.op_token.value)
+
+    def eval_numeric_unary_expr(self, num_value, op_val):
+        """
+        Evaluate numeric UnaryNode expression
+        :param num_value: Value
+        :param op_val: String
+        :return: Value
+        """
+        # Invert sign
+        if op_val == '-':
+            # Flip the number's sign in a new Value
+            return value.Value(-num_value.value, num_value.type)
+        return num_value
+
+    def eval_conditional_unary_expr(self, bool_value, op_val):
+        """
+        Evaluate boolean UnaryNode expression
+        :param bool_value: Value
+        :param op_val: String
+        :return: Value
+        """
+        # Operator is unary operation '!' or 'not' keyword
+        if op_val in ['!', 'not']:
+            # Flip the boolean value
+            return value.Value.from_bool(not bool_value.value)
+        return bool_value
+
+    def eval_binary_node(self, binary_node):
+        """
+        Evaluate a given BinaryNode
+        :param binary_node: BinaryNode
+        :return: Value
+        """
+        # Evaluate LeftNode and RightNode of BinaryNode (LeftNode, Operator, RightNode) to get Values
+        left = self.eval_ast(binary_node.left)
+        right = self.eval_ast(binary_node.right)
+        return self.eval_binary_values(binary_node, left, right)
+
+    def eval_binary_values(self, binary_node, left, right):
+        """
+        Evaluate a given BinaryNode from the Values of its LeftNode and RightNode
+        :param binary_node: BinaryNode
+        :param left: Value
+        :param right: Value
+        :return: Value
+        """
+        result = None
+
+        # LeftValue is Variable, read from its slot
+        if left.type == Variable:
+            try:
+                var_value = self.slots[left.slot]
+            # Variable Value created while running has no slot
+            except AttributeError:
+                var_value = self.find_variable(left.value)
+
+            # Variable does not exist
+            if var_value is Empty:
+                raise errors.variable_assignment_error(left.value)
+            left = var_value
+
+        # RightValue is Variable, read from its slot
+        if right.type == Variable:
+            try:
+                var_value = self.slots[right.slot]
+            # Variable Value created while running has no slot
+            except AttributeError:
+                var_value = self.find_variable(right.value)
+
+            # Variable does not exist
+            if var_value is Empty:
+                raise errors.variable_assignment_error(right.value)
+            right = var_value
+
+        # LeftValue and RightValue are Numeric
+        if (left.type in [token.TokenType.Integer, token.TokenType.Float]) and \
+                (right.type in [token.TokenType.Integer, token.TokenType.Float]):
+
+            # Operator is numeric binary operation keyword
+            if binary_node.op_token.value in ['+', '-', '*', '/', '%', '**']:
+                return self.eval_numeric_binary_expr(left, right, binary_node.op_token.value)
+
+            # Operator is boolean binary operation expression
+            elif binary_node.op_token.value in ['==', '!=', '>', '<', '>=', '<=']:
+                return self.eval_boolean_binary_expr(left, right, binary_node.op_token.value)
+
+        # LeftValue and RightValue are Boolean
+        elif (left.type == token.TokenType.Boolean) and (right.type == token.TokenType.Boolean):
+            return self.eval_conditional_binary_expr(left, right, binary_node.op_token.value)
+
+        # LeftValue and RightValue are String
+        elif (left.type == token.TokenType.String) and (right.type == token.TokenType.String):
+            result = self.eval_string_binary_expr(left, right, binary_node.op_token.value)
+
+        # Operation is supported for the matching TokenTypes
+        if result is not None:
+            return result
+
+        # Cannot perform action on non-matching LeftValue and RightValue TokenType
+        raise errors.binary_type_error(left, right, binary_node.op_token.value)
+
+    def eval_numeric_binary_expr(self, left_value, right_value, op_val):
+        """
+        Evaluate numeric BinaryNode expression
+        :param left_value: Value
+        :param right_value: Value
+        :param op_val: String
+        :return: Value
+        """
+        # Obtain LeftValue and RightValue native values
+        left_val = left_value.value
+        right_val = right_value.value
+        result = None
+
+        # Addition
+        if op_val == '+':
+            result = left_val + right_val
+
+        # Subtraction
+        elif op_val == '-':
+            result = left_val - right_val
+
+        # Multiplication
+        elif op_val == '*':
+            result = left_val * right_val
+
+        # Division
+        elif op_val == '/':
+            # Division by Zero
+            if right_val == 0.0:
+                result = 0.0
+            else:
+                result = left_val / right_val
+
+        # Modulus
+        elif op_val == '%':
+            # Modulus by Zero
+            if right_val == 0.0:
+                result = 0.0
+            else:
+                result = left_val % right_val
+
+        # Indices
+        elif op_val == '**':
+            result = left_val ** right_val
+
+        # Return new Value
+        return value.Value.from_number(result)
+
+    def eval_boolean_binary_expr(self, left_value, right_value, op_val):
+        """
+        Evaluate boolean BinaryNode expression
+        :param left_value: Value
+        :param right_value: Value
+        :param op_val: String
+        :return: Value
+        """
+        # Obtain LeftValue and RightValue native values
+        left_val = left_value.value
+        right_val = right_value.value
+        result = None
+
+        # Equal to
+        if op_val == '==':
+            result = left_val == right_val
+
+        # Not equal to
+        elif op_val == '!=':
+            result = left_val != right_val
+
+        # Greater than
+        elif op_val == '>':
+            result = left_val > right_val
+
+        # Less than
+        elif op_val == '<':
+            result = left_val < right_val
+
+        # Greater than or equal to
+        elif op_val == '>=':
+            result = left_val >= right_val
+
+        # Less than or equal to
+        elif op_val == '<=':
+            result = left_val <= right_val
+
+        # Return new Value
+        return value.Value.from_bool(result)
+
+    def eval_conditional_binary_expr(self, left_value, right_value, op_val):
+        """
+        Evaluate conditional BinaryNode expression
+        :param left_value: Value
+        :param right_value: Value
+        :param op_val: String
+        :return: Value
+        """
+        # Obtain LeftValue and RightValue native values
+        left_val = left_value.value
+        right_val = right_value.value
+        result = None
+
+        # And
+        if op_val == 'and':
+            result = left_val and right_val
+
+        # Or
+        elif op_val == 'or':
+            result = left_val or right_val
+
+        # Equal to
+        elif op_val == '==':
+            result = left_val is right_val
+
+        # Not equal to
+        elif op_val == '!=':
+            result = left_val is not right_val
+
+        # Return new Value, any other Operator is false
+        return value.Value.from_bool(result)
+
+    def eval_string_binary_expr(self, left_value, right_value, op_val):
+        """
+        Evaluate string BinaryNode expression
+        :param left_value: Value
+        :param right_value: Value
+        :param op_val: String
+        :return: Value, or None if Operator is not supported for Strings
+        """
+        # Obtain LeftValue and RightValue String values
+        left_val = left_value.value
+        right_val = right_value.value
+        # Concatenation generates new String whilst Comparison generates Boolean
+
+        # Concatenate
+        if op_val == '+':
+            return value.Value(left_val + right_val, token.TokenType.String)
+
+        # Equal to
+        elif op_val == '==':
+            return value.Value.from_bool(left_val == right_val)
+
+        # Not equal to
+        elif op_val == '!=':
+            return value.Value.from_bool(left_val != right_val)
+
+        return None
+
+    def eval_variable_node(self, var_node):
+        val_value = self.eval_ast(var_node.val_node)
+        self.slots[var_node.slot] = val_value
+        return val_value
+
+    def get_variable(self, var_value):
+        """
+        Get the Value of a Variable from the slots of the SlotProgram being walked
+        :param var_value: Value, of TokenType Variable
+        :return: Value, or Empty if the Variable does not exist
+        """
+        try:
+            return self.slots[var_value.slot]
+        # Variable Value created while running has no slot
+        except AttributeError:
+            return self.find_variable(var_value.value)
+
+    def find_variable(self, var_name):
+        """
+        Find the Value of a Variable by its name, for Variable Values without a slot (e.g. a Complex result).
+        Variables the SlotProgram does not use are only in Interpreter.variables
+        :param var_name: String
+        :return: Value, or Empty if the Variable does not exist
+        """
+        slot = self.slot_table.get(var_name)
+        if slot is not None:
+            return self.slots[slot]
+        return self.variables.get(var_name, Empty)
+
+    def eval_ast_stack(self, ast):
+        """
+        Evaluate a given Abstract Syntax Tree (AST) like Interpreter.eval_ast, walking it with an explicit work stack
+        instead of recursion, so the depth of the AST is only limited by memory and not the recursion limit.
+        Nodes are evaluated in the same order, with the same results and errors
+        :param ast: Node
+        :return: Value
+        """
+        # Nodes to evaluate, a Node followed by ExitNode is evaluated from the Values of its children
+        stack = [ast]
+        # Values of evaluated children, the last one is the most recent
+        values = []
+
+        while stack:
+            node = stack.pop()
+
+            # Children of the Node below are evaluated
+            if node is ExitNode:
+                node = stack.pop()
+                node_type = type(node)
+
+                if node_type is parser.BinaryNode:
+                    right = values.pop()
+                    values.append(self.eval_binary_values(node, values.pop(), right))
+
+                elif node_type is parser.UnaryNode:
+                    values.append(self.eval_unary_value(node, values.pop()))
+
+                # Variable assignment evaluates to the assigned Value
+                elif node_type is parser.VariableNode:
+                    self.slots[node.slot] = values[-1]
+
+                # Printing evaluates to None
+                else:
+                    self.print_value(node, values.pop())
+                    values.append(None)
+                continue
+
+            node_type = type(node)
+
+            # Provide Value from ValueNode
+            if node_type is parser.ValueNode:
+                values.append(node.value)
+
+            # LeftNode is evaluated first, so it is pushed last
+            elif node_type is parser.BinaryNode:
+                stack.append(node)
+                stack.append(ExitNode)
+                stack.append(node.right)
+                stack.append(node.left)
+
+            elif node_type is parser.UnaryNode:
+                stack.append(node)
+                stack.append(ExitNode)
+                stack.append(node.node)
+
+            elif node_type is parser.VariableNode:
+                stack.append(node)
+                stack.append(ExitNode)
+                stack.append(node.val_node)
+
+            # Printing evaluates its Node, any other Keyword does not
+            elif node_type is parser.KeywordNode:
+                if node.kw_token.value == 'print':
+                    stack.append(node)
+                    stack.append(ExitNode)
+                    stack.append(node.node)
+                else:
+                    self.eval_kw_node(node)
+                    values.append(None)
+
+            # Provided AST/Node not valid
+            # Previous Node requires current Node to have value
+            else:
+                raise errors.none_node_error()
+
+        return values.pop()
+
+    def compile(self, ast):
+        """
+        Compile a List of statements for the Interpreter's engine, the tree and stack engines walk the AST
+        with its Variables resolved to slots
+        :param ast: List[Node]
+        :return: SlotProgram, Bytecode, ClosureProgram or PythonProgram
+        """
+        # Compiled programs are only ever freed as a whole,
+        # pause the cyclic GC rescanning the AST while they are created
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if self.profiler is None:
+                return self.compile_for_engine(ast)
+
+            self.profiler.start_stage('compile')
+            program = self.compile_for_engine(ast)
+            self.profiler.stop_stage()
+
+            # Compiled closures are timed as the statements they were compiled from
+            if self.engine == 'closure':
+                self.profiler.map_statements(ast, program.statements)
+            return program
+
+        # Compilers recurse once per level of an expression, only the stack engine's resolver does not
+        except RecursionError:
+            raise errors.depth_error(self.engine) from None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def compile_for_engine(self, ast):
+        """
+        Compile a List of statements with the Interpreter's engine
+        :param ast: List[Node]
+        :return: SlotProgram, Bytecode, ClosureProgram or PythonProgram
+        """
+        # Hooks observe the tree walker, whatever the engine
+        if self.hooks is not None:
+            return self.resolver.resolve(ast)
+
+        # Transpile the whole program into one Python function, starting from the current Variables
+        elif self.engine == 'python':
+            program = self.transpiler.transpile(ast, self.variables)
+            if self.debug:
+                print(self.transpiler.get_source(program))
+            return program
+
+        # Compile the whole program into one Bytecode
+        elif self.engine == 'vm':
+            code = self.bytecode_compiler.compile(ast)
+            if self.debug:
+                print(compiler.disassemble(code))
+            return code
+
+        # Compile every statement once to Python closures
+        elif self.engine == 'closure':
+            return self.closure_compiler.compile_program(ast)
+
+        # Resolve every Variable to a slot for the tree walkers
+        return self.resolver.resolve(ast)
+
+    def run(self, program, flush=True):
+        """
+        Run a List of statements compiled by Interpreter.compile. Printed lines are flushed once the program stops,
+        before any error it raised propagates
+        :param program: SlotProgram, Bytecode, ClosureProgram or PythonProgram
+        :param flush: Boolean, flush the printed lines, callers running many programs in a row flush once instead
+        :return: Nothing
+        """
+        if self.profiler is not None:
+            self.profiler.start_stage('eval')
+
+        try:
+            # Walk the AST, with a work stack for the stack engine. Programs compiled while hooks are registered
+            # are walked recursively for every engine, so each Node is evaluated by a method the hooks can wrap
+            if type(program) is resolver.SlotProgram:
+                if self.engine == 'stack' and self.hooks is None:
+                    self.walk(program, self.eval_ast_stack)
+                else:
+                    self.walk(program, self.eval_ast)
+
+            # Run the Python function, statements it could not run are walked from where it stopped
+            elif self.engine == 'python':
+                program.namespace['output'] = self.output
+                stopped = dict()
+                try:
+                    idx, self.variables = program.function(stopped)
+                # Program raised, its Variables are the ones the statement it stopped at started from
+                except BaseException:
+                    self.variables = stopped
+                    raise
+                if idx < len(program.statements):
+                    self.walk(self.resolver.resolve(program.statements[idx:]), self.eval_ast)
+
+            # Run the Bytecode
+            elif self.engine == 'vm':
+                self.vm.run(program, self.variables, self.output)
+
+            # Run the closures, compiled programs may be shared, so their output is set for each run
+            else:
+                program.output = self.output
+                if self.profiler is None:
+                    for statement in program.statements:
+                        statement(self.variables)
+                else:
+                    self.profiler.run_statements(program.statements, lambda statement: statement(self.variables))
+
+        # Every engine but the stack engine (without hooks) evaluates expressions recursively
+        except RecursionError:
+            raise errors.depth_error(self.engine) from None
+
+        # Output printed before an error is written out first
+        finally:
+            if flush:
+                self.output.flush()
+            if self.profiler is not None:
+                self.profiler.stop_stage()
+
+    def walk(self, program, eval_statement):
+        """
+        Walk each statement of a SlotProgram on the slots of its Variables, loaded from Interpreter.variables
+        and stored back once it stops, including by an error
+        :param program: SlotProgram
+        :param eval_statement: Function(Node) -> Value
+        :return: Nothing
+        """
+        variables = self.variables
+        self.slots = slots = [variables.get(var_name, Empty) for var_name in program.names]
+        self.slot_table = program.slot_table
+        # Statement events wrap the statement evaluator, once per program
+        if self.hooks is not None:
+            eval_statement = self.hooks.statement_evaluator(eval_statement)
+
+        try:
+            if self.profiler is None:
+                for statement in program.statements:
+                    eval_statement(statement)
+            else:
+                self.profiler.run_statements(program.statements, eval_statement)
+
+        # Deleted Variables leave the program memory
+        finally:
+            for var_name, var_value in zip(program.names, slots):
+                if var_value is Empty:
+                    variables.pop(var_name, None)
+                else:
+                    variables[var_name] = var_value
+            self.slots = []
+            self.slot_table = dict()
+
+    def evaluate(self, ast):
+        """
+        Evaluate a List of statements with the Interpreter's engine
+        :param ast: List[Node]
+        :return: Nothing
+        """
+        self.run(self.compile(ast))
+
+    def parse(self, expr):
+        """
+        Tokenize and parse a given expression into an Abstract Syntax Tree (AST), or load it from the cache
+        :param expr: String
+        :return: List[Node]
+        """
+        # Optimized programs depend on the current Variables, only programs optimized from none are cached
+        if self.cache is None or self.profiler is not None or self.hooks is not None or \
+                (self.optimize and self.variables):
+            return self.parse_source(expr)
+
+        # Load the program parsed with the same options, and count what optimizing it removed
+        key = self.cache.get_key(expr, (self.optimize,))
+        entry = self.cache.load(key)
+        if entry is not None:
+            ast, nodes_removed, statements_removed = entry
+            self.optimizer.nodes_removed += nodes_removed
+            self.eliminator.statements_removed += statements_removed
+            return ast
+
+        nodes_removed = self.optimizer.nodes_removed
+        statements_removed = self.eliminator.statements_removed
+        ast = self.parse_source(expr)
+        self.cache.store(key, ast, self.optimizer.nodes_removed - nodes_removed,
+                         self.eliminator.statements_removed - statements_removed)
+        return ast
+
+    def parse_source(self, expr):
+        """
+        Tokenize and parse a given expression into an Abstract Syntax Tree (AST)
+        :param expr: String, or bytes-like UTF-8 text
+        :return: List[Node]
+        """
+        # Tokenize and parse chunks of a large expression on worker processes
+        ast = None
+        if self.profiler is not None:
+            ast = self.profile_parse_source(expr)
+        elif self.parallel is not None and not self.debug and self.hooks is None and isinstance(expr, str):
+            ast = self.parallel.parse(expr)
+
+        if ast is None:
+            # Tokenize expression, a bytes source is always kept as offsets into it
+            if self.token_buffer or not isinstance(expr, str):
+                tokens = self.lexer.tokenize_buffer(expr)
+            else:
+                tokens = self.lexer.tokenize(expr)
+
+            if self.debug:
+                self.lexer.print_tokens()
+            if self.hooks is not None:
+                self.hooks.emit_tokens(tokens)
+
+            # Parse Tokens to Abstract Syntax Tree (AST)
+            ast = self.parser.parse(expr, tokens)
+
+            if self.debug:
+                self.parser.print_ast()
+
+        # Optimize AST from the current Variables, then remove the statements it no longer observes
+        if self.optimize:
+            if self.profiler is not None:
+                self.profiler.start_stage('optimize')
+
+            optimized = self.optimizer.optimize(ast, self.variables)
+            # Optimized statements are at the index of the statement they were optimized from
+            if self.profiler is not None:
+                self.profiler.map_statements(ast, optimized)
+            ast = self.eliminator.eliminate(optimized, self.variables)
+
+            if self.profiler is not None:
+                self.profiler.stop_stage()
+
+            if self.debug:
+                print(f"Optimizer: {self.optimizer.nodes_removed} Nodes removed, "
+                      f"{self.eliminator.statements_removed} statements eliminated")
+                for statement in ast:
+                    print(self.parser.get_ast_tree(statement))
+
+        return ast
+
+    def profile_parse_source(self, expr):
+        """
+        Tokenize and parse a given expression like Interpreter.parse_source, timing each stage and recording the
+        source line of each statement. Tokens are always kept in a TokenBuffer for their lines
+        :param expr: String, or bytes-like UTF-8 text
+        :return: List[Node]
+        """
+        self.profiler.start_stage('lex')
+        tokens = self.lexer.tokenize_buffer(expr)
+        self.profiler.stop_stage()
+
+        if self.debug:
+            self.lexer.print_tokens()
+        if self.hooks is not None:
+            self.hooks.emit_tokens(tokens)
+
+        # Parse Tokens to Abstract Syntax Tree (AST), recording the Token each statement starts at
+        self.profiler.start_stage('parse')
+        self.parser.statement_starts = []
+        try:
+            ast = self.parser.parse(expr, tokens)
+        finally:
+            starts = self.parser.statement_starts
+            self.parser.statement_starts = None
+        self.profiler.stop_stage()
+        self.profiler.record_source(tokens, ast, starts)
+
+        if self.debug:
+            self.parser.print_ast()
+        return ast
+
+    def execute(self, expr):
+        """
+        Execute a given expression for its result
+        :param expr: String
+        """
+        # Clear memory
+        self.variables = dict()
+        self.optimizer.nodes_removed = 0
+        self.eliminator.statements_removed = 0
+        if self.profiler is not None:
+            self.profiler.reset()
+
+        # Evaluate AST, compiled by an earlier execute of the same source if cached
+        if self.parse_cache is not None and not self.debug and self.profiler is None and self.hooks is None:
+            self.run(self.get_program(expr))
+        else:
+            self.evaluate(self.parse(expr))
+
+    def evaluate_batch(self, source, columns):
+        """
+        Evaluate a given expression over many rows of input Variables at once, evaluating each UnaryNode and BinaryNode
+        as one NumPy array operation over every row, with the same results as executing each row on its own
+        :param source: String
+        :param columns: Dict[String, array-like], the Variables before the first statement, one value per row
+        :return: (Dict[String, numpy.ndarray], List[String], List[String or None]), the Variables of each row,
+        what each row printed and the error that stopped each row
+        """
+        # Rows have different Variables, so the program is neither optimized nor cached
+        ast = self.parser.parse(source, self.lexer.tokenize(source))
+
+        # Rows numpy cannot compute exactly are executed one at a time, walking the AST with a work stack
+        return vector.VectorEvaluator(Interpreter(engine='stack')).evaluate(ast, columns)
+
+    def get_program(self, expr):
+        """
+        Get the compiled program of a given expression from the ParseCache, or parse, compile and cache it.
+        Programs are compiled with no Variables, as Interpreter.execute runs them
+        :param expr: String
+        :return: List, Bytecode, ClosureProgram or PythonProgram
+        """
+        key = (expr, self.engine, self.optimize)
+        entry = self.parse_cache.get(key)
+        if entry is not None:
+            program, nodes_removed, statements_removed = entry
+            self.optimizer.nodes_removed += nodes_removed
+            self.eliminator.statements_removed += statements_removed
+            return program
+
+        ast = self.parse(expr)
+        program = self.compile(ast)
+
+        # Estimated size of the source and the compiled Nodes
+        size = len(expr) + cache.count_program_nodes(ast) * ProgramNodeBytes[self.engine]
+        self.parse_cache.put(key, (program, self.optimizer.nodes_removed, self.eliminator.statements_removed), size)
+        return program
+
+    def disassemble(self, expr):
+        """
+        Get the readable Bytecode of a given expression, without executing it
+        :param expr: String
+        :return: String
+        """
+        ast = self.parse(expr)
+        try:
+            return compiler.disassemble(self.bytecode_compiler.compile(ast))
+        except RecursionError:
+            raise errors.depth_error('vm') from None
+
+    def transpile(self, expr):
+        """
+        Get the generated Python source of a given expression, without executing it
+        :param expr: String
+        :return: String
+        """
+        ast = self.parse(expr)
+        try:
+            return self.transpiler.get_source(self.transpiler.transpile(ast))
+        except RecursionError:
+            raise errors.depth_error('python') from None
+
+    def execute_stream(self, chunks, expr=""):
+        """
+        Execute text chunks (e.g. lines of a file) one statement at a time, without keeping the whole program
+        :param chunks: Iterable[String]
+        :param expr: String
+        """
+        # Clear memory
+        self.variables = dict()
+        self.optimizer.nodes_removed = 0
+        self.eliminator.statements_removed = 0
+        if self.profiler is not None:
+            self.profiler.reset()
+
+        # Tokenize and parse lazily, so each statement runs as soon as it is read
+        tokens = self.lexer.iter_tokens(chunks)
+        if self.hooks is not None:
+            tokens = self.hooks.iter_tokens(tokens)
+        self.evaluate_stream(self.parser.parse_stream(expr, tokens))
+
+    def execute_mapped(self, buffer, stream=False, expr=""):
+        """
+        Execute a bytes-like program (e.g. a memory-mapped file) without decoding it into a String. Tokens are scanned
+        from the buffer and only identifiers and string literals are decoded, so the source is never held twice
+        :param buffer: bytes-like, UTF-8 text
+        :param stream: Boolean, execute each statement as soon as it is read, keeping neither Tokens nor the AST
+        :param expr: String, expression of parser errors when streaming
+        """
+        # Clear memory
+        self.variables = dict()
+        self.optimizer.nodes_removed = 0
+        self.eliminator.statements_removed = 0
+        if self.profiler is not None:
+            self.profiler.reset()
+
+        if stream:
+            tokens = self.lexer.iter_buffer_tokens(buffer)
+            if self.hooks is not None:
+                tokens = self.hooks.iter_tokens(tokens)
+            self.evaluate_stream(self.parser.parse_stream(expr, tokens))
+            return
+
+        # Parallel parsing sends String chunks to worker processes, so the buffer is decoded once for them
+        if self.parallel is not None and not self.debug and self.profiler is None and self.hooks is None:
+            self.execute(token.decode_text(buffer[:]))
+            return
+
+        # Tokens are kept as offsets into the buffer, not cached by the ParseCache which is keyed by source String
+        self.evaluate(self.parse(buffer))
+
+    def evaluate_stream(self, statements):
+        """
+        Evaluate each statement of a stream and drop it. Printed lines are flushed once the stream ends,
+        or an error stops it, so they are buffered across statements
+        :param statements: Iterator[Node]
+        :return: Nothing
+        """
+        try:
+            for statement in statements:
+                # Optimize statement from the Variables it will run with,
+                # following statements are not read yet so none are eliminated
+                if self.optimize:
+                    statement = self.optimizer.optimize([statement], self.variables)[0]
+
+                if self.debug:
+                    print(self.parser.get_ast_tree(statement))
+
+                self.run(self.compile([statement]), flush=False)
+
+        # Output printed before an error is written out first
+        finally:
+            self.output.flush()
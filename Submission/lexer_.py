@@ -1,172 +1,279 @@
-import token_ as token
-
-
-class Lexer:
-    def __init__(self):
-        """
-        Create a new Lexer
-        """
-        self.expr = ""
-        self.text = ""
-        self.tokens = []
-
-    def convert_escape_chars(self):
-        """
-        Convert '\' Python reserved characters to token-able characters
-        :return: Nothing
-        """
-        text = self.text
-
-        # Counter to maintain same length when changing characters in-place
-        j = 0
-        for i in range(0, len(text), 1):
-            char = text[i]
-
-            # Character is a Backslash
-            if char == '\\' and i < (len(text) - 1):
-                # Check next character
-                next_char = text[i + 1]
-                replacement_char = ' '
-
-                # New Line (EOL)
-                if next_char == 'n':
-                    replacement_char = '\n'
-                # Tab
-                elif next_char == 't':
-                    replacement_char = '\t'
-
-                # If the '\' character combined with the next character is '\n' or '\t'
-                if replacement_char != ' ':
-                    # Remove the extra '\' in-place
-                    self.text = self.text[:i - j] + replacement_char + self.text[i + 2 - j:]
-                    j += 1
-
-    def get_next_identifier(self):
-        """
-        Get the next whole Token value from the rest of the expression
-        :return: String
-        """
-        # Set local variables for current Token
-        # Defined in token_.py
-        identifier_type = token.IdentifierType.Unknown
-        # Token value
-        next_identifier = ''
-        # Token end index
-        next_identifier_end = 0
-        # String identifier
-        is_string = False
-
-        # For each char in text
-        for char in self.text:
-            # If not currently is_string
-            if not is_string:
-                # Character denotes the start of a string
-                if char == '\"':
-                    # Start a new string
-                    is_string = True
-                    next_identifier_end += 1
-                    next_identifier += char
-                    continue
-
-            # Store entire string as a single Token
-            if is_string:
-                next_identifier_end += 1
-                next_identifier += char
-
-                # Character doesn't denote the end of a string
-                if char != '\"':
-                    continue
-                # Character denotes the end of a string
-                else:
-                    break
-
-            # Character is parenthesis
-            if char in '()':
-                # Only allow Token length of 1 for single parenthesis
-                if next_identifier_end == 0:
-                    next_identifier_end += 1
-                    next_identifier += char
-                break
-
-            # Ignore space and tab characters
-            if char not in ' \t':
-                # Character is line break and nothing else
-                if char == '\n' and len(next_identifier) == 0:
-                    next_identifier_end += 1
-                    next_identifier += char
-                    break
-
-                # Get IdentifierType from first character
-                current_identifier_type = token.IdentifierType.get_identifier_type(char)
-
-                # Start of identifier, assign to type of character
-                if identifier_type == token.IdentifierType.Unknown:
-                    identifier_type = current_identifier_type
-
-                # Not the start of identifier
-                else:
-                    # IdentifierType is number
-                    if identifier_type == token.IdentifierType.Numeric:
-                        # Current Token isn't empty and character isn't numeric, e.g. '0-4' becomes ['0', '-4']
-                        if len(next_identifier) > 0 and \
-                                (char == '-' or current_identifier_type != token.IdentifierType.Numeric):
-                            break
-
-                    # Prevent symbolic Tokens from merging with other Tokens
-                    if (identifier_type == token.IdentifierType.Symbolic and
-                        current_identifier_type != token.IdentifierType.Symbolic) or \
-                            (identifier_type != token.IdentifierType.Symbolic and
-                             (current_identifier_type == token.IdentifierType.Symbolic or char == '-')):
-                        break
-
-                # Add character to current Token
-                next_identifier += char
-
-            # If character is space or tab, and Token has characters already
-            elif len(next_identifier) > 0:
-                break
-
-            # Increment Token end index
-            next_identifier_end += 1
-
-        # Remove identified Token from self.text and return Token
-        self.text = self.text[next_identifier_end:]
-        return next_identifier
-
-    def tokenize(self, expr):
-        """
-        Tokenize the current expression
-        :param expr: String
-        :return: List[Token]
-        """
-        self.expr = expr
-        self.text = expr
-        self.tokens = []
-        self.convert_escape_chars()
-
-        # Iterate over each token in the text
-        while len(self.text) > 0:
-            next_identifier = self.get_next_identifier()
-
-            # Ignore None Tokens
-            if not next_identifier:
-                continue
-
-            # Append self.tokens with new Token
-            new_token = token.Token(next_identifier)
-            self.tokens.append(new_token)
-
-        # Append self.tokens with End of File (EOF) for the Parser
-        self.tokens.append(token.Token("EOF", token.TokenType.EOF))
-        return self.tokens
-
-    def print_tokens(self):
-        """
-        Print all Tokens from Lexer (token.value, token.type). Used for debugging
-        :return: Nothing
-        """
-        print(self.expr)
-        tka = [tk.value for tk in self.tokens]
-        print(tka)
-        for tkb in self.tokens:
-            print(tkb.value, "\t", tkb.type)
+import token_ as token
+
+
+class Lexer:
+    def __init__(self):
+        """
+        Create a new Lexer
+        """
+        self.expr = ""
+        self.text = ""
+        self.idx = 0
+        self.tokens = []
+        # Character closing a string literal, b'"' when scanning a bytes source
+        self.quote = '\"'
+
+    def set_text(self, text):
+        """
+        Set the text scanned from its start, a String or a bytes-like source (e.g. a memory-mapped file)
+        :param text: String or bytes-like
+        :return: Nothing
+        """
+        self.text = text
+        self.idx = 0
+        self.quote = '\"' if isinstance(text, str) else b'\"'
+
+    def convert_escape_chars(self, literal):
+        """
+        Convert '\' Python reserved characters to token-able characters within a string literal
+        :param literal: String
+        :return: String
+        """
+        return token.convert_escape_chars(literal)
+
+    def find_string_end(self, start):
+        """
+        Find the end of a whole string literal from its opening '"'
+        :param start: Integer
+        :return: Integer
+        """
+        # Find the matching '"' after the opening '"'
+        end = self.text.find(self.quote, start + 1)
+
+        # String is never closed, store the rest of the text as the string
+        if end == -1:
+            return len(self.text)
+        # Include the closing '"'
+        return end + 1
+
+    def scan_next_identifier(self):
+        """
+        Move the cursor past the next whole Token, without building its value
+        :return: Integer, start index of the Token (equal to the cursor if only whitespace was left)
+        """
+        text = self.text
+        text_len = len(text)
+        idx = self.idx
+
+        # Ignore space and tab characters before the Token
+        space_chars = token.SpaceCharacters
+        while idx < text_len and text[idx] in space_chars:
+            idx += 1
+
+        # Nothing left but whitespace
+        if idx == text_len:
+            self.idx = idx
+            return idx
+
+        # Token start index
+        start = idx
+        char = text[idx]
+
+        # Character is parenthesis or line break, only allow Token length of 1
+        if char in token.SingleCharacters:
+            idx += 1
+            # Except a '\r\n' line break of a bytes source
+            if char == token.CarriageReturn and idx < text_len and text[idx] == token.LineFeed:
+                idx += 1
+            self.idx = idx
+            return start
+
+        # Character denotes the start of a string
+        if char in token.QuoteCharacters:
+            self.idx = self.find_string_end(idx)
+            return start
+
+        # Get IdentifierType from first character, defined in token_.py
+        identifier_type = token.CharacterTypes.get(char, token.IdentifierType.Symbolic)
+        idx += 1
+
+        # Symbolic Tokens continue until an alpha, numeric, whitespace, parenthesis or string character
+        if identifier_type == token.IdentifierType.Symbolic:
+            stop_chars = token.SymbolicStopCharacters
+            while idx < text_len and text[idx] not in stop_chars:
+                idx += 1
+
+        # Alpha and numeric Tokens continue over their identifier characters, e.g. '0-4' becomes ['0', '-4']
+        else:
+            identifier_chars = token.IdentifierCharacters[identifier_type]
+            while idx < text_len and text[idx] in identifier_chars:
+                idx += 1
+
+        # Character denotes the start of a string, store entire string as part of the Token
+        if idx < text_len and text[idx] in token.QuoteCharacters:
+            idx = self.find_string_end(idx)
+
+        # Move the cursor past the identified Token
+        self.idx = idx
+        return start
+
+    def get_next_identifier(self):
+        """
+        Get the next whole Token value from the cursor position of the expression
+        :return: String
+        """
+        start = self.scan_next_identifier()
+        next_identifier = self.text[start:self.idx]
+
+        # Decode escape characters of string literals only
+        if '\"' in next_identifier:
+            next_identifier = self.convert_escape_chars(next_identifier)
+        return next_identifier
+
+    def tokenize(self, expr):
+        """
+        Tokenize the current expression in a single pass of the cursor
+        :param expr: String
+        :return: List[Token]
+        """
+        self.expr = expr
+        self.set_text(expr)
+        self.tokens = []
+        text_len = len(self.text)
+
+        # Iterate over each token in the text
+        while self.idx < text_len:
+            next_identifier = self.get_next_identifier()
+
+            # Ignore None Tokens
+            if not next_identifier:
+                continue
+
+            # Append self.tokens with new Token
+            new_token = token.Token(next_identifier)
+            self.tokens.append(new_token)
+
+        # Append self.tokens with End of File (EOF) for the Parser
+        self.tokens.append(token.Token("EOF", token.TokenType.EOF))
+        return self.tokens
+
+    def tokenize_buffer(self, expr):
+        """
+        Tokenize the current expression into a TokenBuffer of source offsets, without a Token per Token.
+        A bytes-like expression (e.g. a memory-mapped file) is scanned as bytes, its identifiers and string literals
+        are only decoded when the Parser reads them, and columns count bytes
+        :param expr: String or bytes-like
+        :return: TokenBuffer
+        """
+        self.expr = expr
+        self.set_text(expr)
+        text = self.text
+        text_len = len(text)
+        tokens = token.TokenBuffer(expr)
+        newline = '\n' if isinstance(text, str) else b'\n'
+        identify_type = token.identify_token_type if isinstance(text, str) else token.identify_bytes_type
+
+        # Line and column tracking, both starting from 1
+        line = 1
+        line_start = 0
+        prev_start = 0
+
+        # Iterate over each token in the text
+        while self.idx < text_len:
+            start = self.scan_next_identifier()
+
+            # Ignore None Tokens
+            if start == self.idx:
+                continue
+
+            # Count line breaks since the previous Token started, memory-mapped files can only find them
+            line_break = text.find(newline, prev_start, start)
+            while line_break != -1:
+                line += 1
+                line_start = line_break + 1
+                line_break = text.find(newline, line_start, start)
+            prev_start = start
+
+            # Append TokenBuffer with Token position, its value is only needed to identify TokenType
+            t_type = identify_type(text[start:self.idx])
+            tokens.append(t_type, start, self.idx, line, start - line_start + 1)
+
+        # Append TokenBuffer with End of File (EOF) for the Parser
+        line_break = text.find(newline, prev_start, text_len)
+        while line_break != -1:
+            line += 1
+            line_start = line_break + 1
+            line_break = text.find(newline, line_start, text_len)
+        tokens.append(token.TokenType.EOF, text_len, text_len, line, text_len - line_start + 1)
+        self.tokens = tokens
+        return tokens
+
+    def iter_buffer_tokens(self, buffer):
+        """
+        Tokenize a bytes-like source (e.g. a memory-mapped file) lazily, yielding each Token once it is scanned.
+        Only identifiers and string literals are decoded, reserved character(s) are shared Strings
+        :param buffer: bytes-like
+        :return: Iterator[Token]
+        """
+        self.expr = buffer
+        self.set_text(buffer)
+        self.tokens = []
+        text_len = len(buffer)
+
+        while self.idx < text_len:
+            start = self.scan_next_identifier()
+
+            # Ignore None Tokens
+            if start == self.idx:
+                continue
+
+            # Reserved character(s) are looked up once for both their value and TokenType
+            value = buffer[start:self.idx]
+            reserved = token.ReservedBytes.get(value)
+            if reserved is not None:
+                yield token.Token(reserved[1], reserved[0])
+            else:
+                yield token.Token(token.decode_token(value), token.identify_bytes_type(value))
+
+        # End of File (EOF) for the Parser
+        yield token.Token("EOF", token.TokenType.EOF)
+
+    def iter_tokens(self, chunks):
+        """
+        Tokenize text chunks (e.g. lines of a file) as they arrive, yielding each Token once it is complete
+        :param chunks: Iterable[String]
+        :return: Iterator[Token]
+        """
+        self.expr = ""
+        self.set_text("")
+        self.tokens = []
+
+        for chunk in chunks:
+            # Keep only the unfinished end of the previous chunk
+            self.text = self.text[self.idx:] + chunk
+            self.idx = 0
+            text_len = len(self.text)
+
+            while self.idx < text_len:
+                token_start = self.idx
+                next_identifier = self.get_next_identifier()
+
+                # Token reaches the end of the chunk and may continue into the next chunk
+                if self.idx == text_len and next_identifier not in ('(', ')', '\n'):
+                    self.idx = token_start
+                    break
+
+                # Ignore None Tokens
+                if next_identifier:
+                    yield token.Token(next_identifier)
+
+        # Tokenize whatever remains after the last chunk
+        text_len = len(self.text)
+        while self.idx < text_len:
+            next_identifier = self.get_next_identifier()
+            if next_identifier:
+                yield token.Token(next_identifier)
+
+        # End of File (EOF) for the Parser
+        yield token.Token("EOF", token.TokenType.EOF)
+
+    def print_tokens(self):
+        """
+        Print all Tokens from Lexer (token.value, token.type). Used for debugging
+        :return: Nothing
+        """
+        print(self.expr)
+        tka = [tk.value for tk in self.tokens]
+        print(tka)
+        for tkb in self.tokens:
+            print(tkb.value, "\t", tkb.type)
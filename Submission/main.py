@@ -1,22 +1,115 @@
-import interpreter_ as interpreter
-
-
-def eval_stage(stage_expressions):
-    for expression in stage_expressions:
-        prog_interpreter.execute(expression)
-
-
-if __name__ == "__main__":
-    prog_interpreter = interpreter.Interpreter(debug=False)
-    
-    try:
-        with open('program.txt', 'r') as file:
-            code = ["".join(file.readlines())]
-            eval_stage(code)
-            
-    except FileNotFoundError:
-        raise SystemExit(f"--- PROGRAM ERROR ---\n"
-                         f"FileError: Program file not found\n"
-                         f"in File: 'program.txt'\n"
-                         f"--- PROGRAM ERROR ---")
-    
+import argparse
+import contextlib
+import mmap
+import os
+import sys
+
+import cache_ as cache
+import interpreter_ as interpreter
+import parallel_ as parallel
+import sink_ as sink
+import watch_ as watch
+
+
+def map_program(file):
+    """
+    Map a program file into memory read-only, so it is tokenized from the OS page cache without reading it into
+    a String. Empty files cannot be mapped
+    :param file: File, opened in binary mode
+    :return: mmap, or a context of empty bytes
+    """
+    if os.fstat(file.fileno()).st_size == 0:
+        return contextlib.nullcontext(b"")
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Execute a program file")
+    arg_parser.add_argument('program', nargs='?', default='program.txt', help="Program file (default: program.txt)")
+    arg_parser.add_argument('--stream', action='store_true',
+                            help="Execute each statement as soon as it is read, in constant memory")
+    arg_parser.add_argument('--engine', default='tree', choices=interpreter.Engines,
+                            help="Execution engine (default: tree)")
+    arg_parser.add_argument('--disassemble', action='store_true',
+                            help="Print the program's Bytecode instead of executing it")
+    arg_parser.add_argument('--python-source', action='store_true',
+                            help="Print the program transpiled to Python instead of executing it")
+    arg_parser.add_argument('--optimize', action='store_true',
+                            help="Fold constants, simplify identities and eliminate dead statements before executing, "
+                                 "reporting the Nodes and statements removed on stderr")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help=f"Always parse the program, without loading or storing it in '{cache.CacheDirectory}'")
+    arg_parser.add_argument('--clear-cache', action='store_true',
+                            help=f"Remove every cached program in '{cache.CacheDirectory}' next to the program, "
+                                 f"without executing it")
+    arg_parser.add_argument('--jobs', type=int, default=1,
+                            help="Tokenize and parse large programs in chunks on this many processes (default: 1)")
+    arg_parser.add_argument('--output', help="Write the printed output to this file instead of stdout")
+    arg_parser.add_argument('--flush-size', type=int, default=sink.DefaultFlushSize,
+                            help=f"Characters of printed output buffered before writing them, 0 writes every line "
+                                 f"(default: {sink.DefaultFlushSize})")
+    arg_parser.add_argument('--watch', action='store_true',
+                            help="Execute the program again every time it is saved, parsing only the changed lines "
+                                 "and running from the first changed statement, until interrupted")
+    arg_parser.add_argument('--profile', action='store_true',
+                            help="Report the time of each stage, the hot lines taking the most time, and the Node "
+                                 "kinds, Operators and Value types evaluated on stderr")
+    arg_parser.add_argument('--profile-json', help="Write the profile report to this file as JSON")
+    args = arg_parser.parse_args()
+
+    # Parsed programs are cached next to the program file
+    prog_cache = cache.ProgramCache(os.path.join(os.path.dirname(os.path.abspath(args.program)), cache.CacheDirectory))
+    if args.clear_cache:
+        print(f"Cache: {prog_cache.clear()} cached programs removed", file=sys.stderr)
+        sys.exit()
+
+    # Programs are only parsed in parallel on more than one process
+    prog_parallel = parallel.ParallelParser(args.jobs) if args.jobs > 1 else None
+    prog_output = sink.StdoutSink(args.flush_size)
+    prog_interpreter = interpreter.Interpreter(debug=False, engine=args.engine, optimize=args.optimize,
+                                               cache=None if args.no_cache else prog_cache, parallel=prog_parallel,
+                                               output=prog_output,
+                                               profile=args.profile or args.profile_json is not None)
+    
+    try:
+        # Output file is created here, so a missing folder is reported like a missing program
+        if args.output:
+            prog_output = prog_interpreter.output = sink.FileSink(args.output, args.flush_size)
+
+        # Watching reports errors of each run and keeps watching, the program file may not exist yet
+        if args.watch:
+            watch.ProgramWatcher(prog_interpreter).watch(args.program)
+            sys.exit()
+
+        with open(args.program, 'rb') as file, map_program(file) as source:
+            if args.disassemble:
+                print(prog_interpreter.disassemble(source))
+            elif args.python_source:
+                print(prog_interpreter.transpile(source))
+            else:
+                prog_interpreter.execute_mapped(source, args.stream)
+            
+    except FileNotFoundError as error:
+        if args.output and error.filename == args.output:
+            raise SystemExit(f"--- PROGRAM ERROR ---\n"
+                             f"FileError: Output file folder not found\n"
+                             f"in File: '{args.output}'\n"
+                             f"--- PROGRAM ERROR ---")
+        raise SystemExit(f"--- PROGRAM ERROR ---\n"
+                         f"FileError: Program file not found\n"
+                         f"in File: '{args.program}'\n"
+                         f"--- PROGRAM ERROR ---")
+
+    finally:
+        prog_output.close()
+        if prog_parallel is not None:
+            prog_parallel.close()
+        if args.optimize:
+            print(f"Optimizer: {prog_interpreter.optimizer.nodes_removed} Nodes removed, "
+                  f"{prog_interpreter.eliminator.statements_removed} statements eliminated", file=sys.stderr)
+        if args.profile:
+            print(prog_interpreter.profiler.format_report(), file=sys.stderr)
+        if args.profile_json is not None:
+            with open(args.profile_json, 'w') as file:
+                file.write(prog_interpreter.profiler.to_json())
+    
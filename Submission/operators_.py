@@ -0,0 +1,129 @@
+import errors_ as errors
+import token_ as token
+import value_ as value
+
+# Binary and Unary Operations on resolved Values, each specialised to one Operator.
+# Used by engines that choose the Operator once, ahead of evaluation.
+
+NumericTypes = (token.TokenType.Integer, token.TokenType.Float)
+Boolean = token.TokenType.Boolean
+String = token.TokenType.String
+from_number = value.Value.from_number
+from_bool = value.Value.from_bool
+
+
+def divide(left_val, right_val):
+    """
+    Divide numbers, division by Zero is 0.0
+    :param left_val: Integer or Float
+    :param right_val: Integer or Float
+    :return: Float
+    """
+    if right_val == 0.0:
+        return 0.0
+    return left_val / right_val
+
+
+def modulus(left_val, right_val):
+    """
+    Modulus of numbers, modulus by Zero is 0.0
+    :param left_val: Integer or Float
+    :param right_val: Integer or Float
+    :return: Integer or Float
+    """
+    if right_val == 0.0:
+        return 0.0
+    return left_val % right_val
+
+
+def create_binary_operation(op_val, numeric=None, conditional=None, string=None):
+    """
+    Create a Binary Operation for a single Operator from its Numeric, Boolean and String operations.
+    Numeric and String operations return a Value, or are None if the Operator is not supported;
+    Boolean operations return a boolean, and unsupported Boolean operations are false
+    :param op_val: String
+    :param numeric: Function(Integer or Float, Integer or Float) -> Value
+    :param conditional: Function(Boolean, Boolean) -> Boolean
+    :param string: Function(String, String) -> Value
+    :return: Function(Value, Value) -> Value
+    """
+    def binary_operation(left, right):
+        # LeftValue and RightValue are Numeric
+        if left.type in NumericTypes and right.type in NumericTypes:
+            if numeric is not None:
+                return numeric(left.value, right.value)
+
+        # LeftValue and RightValue are Boolean
+        elif left.type == Boolean and right.type == Boolean:
+            if conditional is not None:
+                return from_bool(conditional(left.value, right.value))
+            return value.FalseValue
+
+        # LeftValue and RightValue are String
+        elif left.type == String and right.type == String:
+            if string is not None:
+                return string(left.value, right.value)
+
+        # Cannot perform action on non-matching LeftValue and RightValue TokenType
+        raise errors.binary_type_error(left, right, op_val)
+
+    return binary_operation
+
+
+def create_unary_operation(op_val):
+    """
+    Create a Unary Operation for a single Operator
+    :param op_val: String
+    :return: Function(Value) -> Value
+    """
+    negate = op_val == '-'
+    invert = op_val in ['!', 'not']
+
+    def unary_operation(sub_value):
+        # Value is Numeric, only '-' flips the sign
+        if sub_value.type in NumericTypes:
+            if negate:
+                return value.Value(-sub_value.value, sub_value.type)
+            return sub_value
+
+        # Value is Boolean, only '!' and 'not' flip the value
+        elif sub_value.type == Boolean:
+            if invert:
+                return from_bool(not sub_value.value)
+            return sub_value
+
+        # Cannot perform Unary operation on non-Numeric or non-Boolean TokenType
+        raise errors.unary_type_error(sub_value, op_val)
+
+    return unary_operation
+
+
+# Binary Operation of every Binary Operator
+BinaryOperations = {
+    '+': create_binary_operation('+', numeric=lambda a, b: from_number(a + b),
+                                 string=lambda a, b: value.Value(a + b, String)),
+    '-': create_binary_operation('-', numeric=lambda a, b: from_number(a - b)),
+    '*': create_binary_operation('*', numeric=lambda a, b: from_number(a * b)),
+    '/': create_binary_operation('/', numeric=lambda a, b: from_number(divide(a, b))),
+    '%': create_binary_operation('%', numeric=lambda a, b: from_number(modulus(a, b))),
+    '**': create_binary_operation('**', numeric=lambda a, b: from_number(a ** b)),
+    '==': create_binary_operation('==', numeric=lambda a, b: from_bool(a == b),
+                                  conditional=lambda a, b: a is b,
+                                  string=lambda a, b: from_bool(a == b)),
+    '!=': create_binary_operation('!=', numeric=lambda a, b: from_bool(a != b),
+                                  conditional=lambda a, b: a is not b,
+                                  string=lambda a, b: from_bool(a != b)),
+    '>': create_binary_operation('>', numeric=lambda a, b: from_bool(a > b)),
+    '<': create_binary_operation('<', numeric=lambda a, b: from_bool(a < b)),
+    '>=': create_binary_operation('>=', numeric=lambda a, b: from_bool(a >= b)),
+    '<=': create_binary_operation('<=', numeric=lambda a, b: from_bool(a <= b)),
+    'and': create_binary_operation('and', conditional=lambda a, b: a and b),
+    'or': create_binary_operation('or', conditional=lambda a, b: a or b),
+}
+
+# Unary Operation of every Unary Operator
+UnaryOperations = {op_val: create_unary_operation(op_val) for op_val in ['-', '!', 'not']}
+
+# Operators in a fixed order, so compiled code can refer to an Operation by its index
+BinaryOperators = list(BinaryOperations)
+UnaryOperators = list(UnaryOperations)
@@ -0,0 +1,415 @@
+import operators_ as operators
+import parser_ as parser
+import token_ as token
+
+Integer = token.TokenType.Integer
+Float = token.TokenType.Float
+Boolean = token.TokenType.Boolean
+String = token.TokenType.String
+Variable = token.TokenType.Variable
+NumericTypes = (Integer, Float)
+
+# Operators with a Boolean result for Numeric operands
+ComparisonOperators = ['==', '!=', '>', '<', '>=', '<=']
+
+# Largest Integer exponent folded, so folding never builds a huge number the program may not reach
+MaxFoldedExponent = 64
+
+
+def is_constant(node):
+    """
+    Is the Node a ValueNode of a literal or folded Value (not a Variable)?
+    :param node: Node
+    :return: Boolean
+    """
+    return isinstance(node, parser.ValueNode) and node.value.type != Variable
+
+
+def count_nodes(ast):
+    """
+    Count the Nodes of an AST
+    :param ast: Node
+    :return: Integer
+    """
+    count = 0
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        count += 1
+
+        if isinstance(node, parser.KeywordNode):
+            stack.append(node.node)
+        elif isinstance(node, parser.UnaryNode):
+            stack.append(node.node)
+        elif isinstance(node, parser.BinaryNode):
+            stack.append(node.left)
+            stack.append(node.right)
+        elif isinstance(node, parser.VariableNode):
+            stack.append(node.val_node)
+    return count
+
+
+def has_side_effects(ast):
+    """
+    Does an expression contain a statement (KeywordNode or VariableNode)?
+    The Parser may reuse an earlier statement as an operand
+    :param ast: Node
+    :return: Boolean
+    """
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (parser.KeywordNode, parser.VariableNode)):
+            return True
+        elif isinstance(node, parser.UnaryNode):
+            stack.append(node.node)
+        elif isinstance(node, parser.BinaryNode):
+            stack.append(node.left)
+            stack.append(node.right)
+    return False
+
+
+def binary_type(op_val, left_type, right_type, right):
+    """
+    TokenType of a Binary Operation's result, if it is certain
+    :param op_val: String
+    :param left_type: TokenType or None
+    :param right_type: TokenType or None
+    :param right: Node
+    :return: TokenType or None
+    """
+    # LeftValue and RightValue are Numeric
+    if left_type in NumericTypes and right_type in NumericTypes:
+        if op_val in ['+', '-', '*']:
+            return Integer if left_type == right_type == Integer else Float
+
+        # Division is always Float, including division by Zero
+        elif op_val == '/':
+            return Float
+
+        # Modulus of Integers is only Integer if not by Zero
+        elif op_val == '%':
+            if Float in (left_type, right_type):
+                return Float
+            if is_constant(right) and right.value.value != 0:
+                return Integer
+
+        elif op_val in ComparisonOperators:
+            return Boolean
+
+    # Every Boolean operation is Boolean, unsupported ones are false
+    elif left_type == right_type == Boolean:
+        return Boolean
+
+    # LeftValue and RightValue are String
+    elif left_type == right_type == String:
+        if op_val == '+':
+            return String
+        elif op_val in ['==', '!=']:
+            return Boolean
+
+    # Power may be complex, and everything else raises
+    return None
+
+
+def unary_type(sub_type):
+    """
+    TokenType of a Unary Operation's result, if it is certain
+    :param sub_type: TokenType or None
+    :return: TokenType or None
+    """
+    if sub_type in NumericTypes or sub_type == Boolean:
+        return sub_type
+    return None
+
+
+class Optimizer:
+    def __init__(self):
+        """
+        Create a new Optimizer, folding constant expressions and simplifying identities before evaluation.
+        Programs have no control flow, so a Variable holds its assigned Value until the next assignment or deletion
+        """
+        self.constants = dict()
+        self.types = dict()
+        self.nodes_removed = 0
+
+    def optimize(self, ast, variables=None):
+        """
+        Optimize a List of statements into a new List, the given Nodes are never modified
+        :param ast: List[Node]
+        :param variables: Dict[String, Value], Variables before the first statement
+        :return: List[Node]
+        """
+        # Variables are constant before the first statement
+        self.constants = dict()
+        self.types = dict()
+        for var_name, var_value in (variables or dict()).items():
+            if var_value is not None and var_value.type != Variable:
+                self.constants[var_name] = self.create_value_node(var_value)
+                self.types[var_name] = var_value.type
+
+        optimized = []
+        for statement in ast:
+            # Statements with nested statements may assign or delete anything, forget every Variable
+            if isinstance(statement, parser.KeywordNode):
+                expression = statement.node
+            elif isinstance(statement, parser.VariableNode):
+                expression = statement.val_node
+            else:
+                expression = statement
+
+            if has_side_effects(expression):
+                self.constants = dict()
+                self.types = dict()
+                optimized.append(statement)
+                continue
+
+            new_statement = self.optimize_statement(statement)
+            if new_statement is not statement:
+                self.nodes_removed += count_nodes(statement) - count_nodes(new_statement)
+            optimized.append(new_statement)
+
+        return optimized
+
+    def optimize_statement(self, statement):
+        """
+        Optimize a statement
+        :param statement: Node
+        :return: Node
+        """
+        # Keywords
+        if isinstance(statement, parser.KeywordNode):
+            # Printing resolves a single Variable, like an operand
+            if statement.kw_token.value == 'print':
+                node, _ = self.optimize_node(statement.node, resolve=True)
+                if node is not statement.node:
+                    return parser.KeywordNode(statement.kw_token, node)
+
+            # Deleted Variable is no longer known, Variables are deleted by any Token value
+            elif statement.kw_token.value == 'del' and isinstance(statement.node, parser.ValueNode):
+                self.constants.pop(statement.node.token.value, None)
+                self.types.pop(statement.node.token.value, None)
+
+            return statement
+
+        # Variable assignment, assigning a Variable stores the Variable itself, so it is not resolved
+        elif isinstance(statement, parser.VariableNode):
+            var_name = statement.var_token.value
+            val_node, val_type = self.optimize_node(statement.val_node, resolve=False)
+
+            if is_constant(val_node):
+                self.constants[var_name] = val_node
+                self.types[var_name] = val_node.value.type
+            else:
+                self.constants.pop(var_name, None)
+                if val_type is not None:
+                    self.types[var_name] = val_type
+                else:
+                    self.types.pop(var_name, None)
+
+            if val_node is not statement.val_node:
+                return parser.VariableNode(statement.var_token, val_node)
+            return statement
+
+        # Expression
+        node, _ = self.optimize_node(statement, resolve=False)
+        return node
+
+    def optimize_node(self, ast, resolve):
+        """
+        Optimize an expression Node, with a work stack so expressions of any depth are optimized
+        :param ast: Node
+        :param resolve: Boolean, a Variable is replaced by its Value (operands and printing)
+        :return: (Node, TokenType or None), the Node and the TokenType of its Value if it is certain
+        """
+        if not isinstance(ast, (parser.UnaryNode, parser.BinaryNode)):
+            return self.optimize_leaf(ast, resolve)
+
+        # (Node, TokenType) of each optimized operation by id. An operation stays on the stack until
+        # its operands are optimized, operands are always resolved
+        results = dict()
+        stack = [ast]
+        while stack:
+            node = stack[-1]
+            if id(node) in results:
+                stack.pop()
+                continue
+
+            operands = [node.node] if isinstance(node, parser.UnaryNode) else [node.left, node.right]
+            pending = [operand for operand in operands
+                       if isinstance(operand, (parser.UnaryNode, parser.BinaryNode)) and id(operand) not in results]
+            if pending:
+                stack.extend(reversed(pending))
+                continue
+
+            stack.pop()
+            optimized = [results[id(operand)] if id(operand) in results else self.optimize_leaf(operand, True)
+                         for operand in operands]
+            if isinstance(node, parser.UnaryNode):
+                results[id(node)] = self.optimize_unary_node(node, *optimized[0])
+            else:
+                results[id(node)] = self.optimize_binary_node(node, *optimized[0], *optimized[1])
+
+        return results[id(ast)]
+
+    def optimize_leaf(self, ast, resolve):
+        """
+        Optimize a Node without operands
+        :param ast: ValueNode or None
+        :param resolve: Boolean, a Variable is replaced by its Value
+        :return: (Node, TokenType or None)
+        """
+        if isinstance(ast, parser.ValueNode):
+            # Constant Variable is replaced by its Value
+            if ast.value.type == Variable:
+                if not resolve:
+                    return ast, None
+                return self.constants.get(ast.value.value, ast), self.types.get(ast.value.value)
+            return ast, ast.value.type
+
+        # None Node raises when evaluated
+        return ast, None
+
+    def optimize_unary_node(self, unary_node, node, sub_type):
+        """
+        Optimize a given UnaryNode from its optimized operand
+        :param unary_node: UnaryNode
+        :param node: Node, the optimized operand
+        :param sub_type: TokenType or None
+        :return: (Node, TokenType or None)
+        """
+        op_val = unary_node.op_token.value
+
+        # Fold constant, Operations that raise are left to raise when evaluated
+        if is_constant(node):
+            try:
+                return self.create_value_node(operators.UnaryOperations[op_val](node.value)), unary_type(sub_type)
+            except SystemExit:
+                pass
+
+        # 'not not b' is b, for any Node that is not a Variable (which '!' would resolve)
+        if op_val in ['!', 'not'] and isinstance(node, parser.UnaryNode) and node.op_token.value in ['!', 'not'] \
+                and unary_type(sub_type) is not None:
+            inner = node.node
+            if not (isinstance(inner, parser.ValueNode) and inner.value.type == Variable):
+                return inner, sub_type
+
+        if node is not unary_node.node:
+            return parser.UnaryNode(unary_node.op_token, node), unary_type(sub_type)
+        return unary_node, unary_type(sub_type)
+
+    def optimize_binary_node(self, binary_node, left, left_type, right, right_type):
+        """
+        Optimize a given BinaryNode from its optimized operands
+        :param binary_node: BinaryNode
+        :param left: Node, the optimized LeftNode
+        :param left_type: TokenType or None
+        :param right: Node, the optimized RightNode
+        :param right_type: TokenType or None
+        :return: (Node, TokenType or None)
+        """
+        op_val = binary_node.op_token.value
+        result_type = binary_type(op_val, left_type, right_type, right)
+
+        # Fold constants, Operations that raise are left to raise when evaluated
+        if is_constant(left) and is_constant(right) and self.is_foldable(op_val, right):
+            try:
+                result = operators.BinaryOperations[op_val](left.value, right.value)
+                return self.create_value_node(result), result.type if result.type != Variable else None
+            except (SystemExit, ArithmeticError, ValueError):
+                pass
+
+        # Identities, e.g. 'x * 1' and 'x + 0'
+        simplified = self.simplify_identity(op_val, left, left_type, right, right_type)
+        if simplified is not None:
+            return simplified
+
+        if left is not binary_node.left or right is not binary_node.right:
+            return parser.BinaryNode(left, binary_node.op_token, right), result_type
+        return binary_node, result_type
+
+    def is_foldable(self, op_val, right):
+        """
+        Is a constant Binary Operation cheap enough to fold?
+        :param op_val: String
+        :param right: ValueNode
+        :return: Boolean
+        """
+        if op_val == '**' and right.value.type == Integer:
+            return abs(right.value.value) <= MaxFoldedExponent
+        return True
+
+    def simplify_identity(self, op_val, left, left_type, right, right_type):
+        """
+        Simplify an identity Binary Operation to its operand. Only computed operands (BinaryNode or negation) are kept,
+        so the result has no source text, and only of a TokenType the identity keeps (e.g. -0.0 + 0 is 0.0)
+        :param op_val: String
+        :param left: Node
+        :param left_type: TokenType or None
+        :param right: Node
+        :param right_type: TokenType or None
+        :return: (Node, TokenType) or None
+        """
+        # x * 1 and 1 * x
+        if op_val == '*':
+            if self.is_one(right, left_type) and self.is_computed(left, left_type):
+                return left, left_type
+            if self.is_one(left, right_type) and self.is_computed(right, right_type):
+                return right, right_type
+
+        # x + 0 and 0 + x, Integers only
+        elif op_val == '+':
+            if self.is_zero(right) and left_type == Integer and self.is_computed(left, left_type):
+                return left, left_type
+            if self.is_zero(left) and right_type == Integer and self.is_computed(right, right_type):
+                return right, right_type
+
+        # x - 0
+        elif op_val == '-':
+            if self.is_zero(right) and self.is_computed(left, left_type):
+                return left, left_type
+
+        return None
+
+    def is_one(self, node, other_type):
+        """
+        Is the Node a constant 1 that keeps the TokenType of the other operand when multiplying?
+        :param node: Node
+        :param other_type: TokenType or None
+        :return: Boolean
+        """
+        if not is_constant(node) or node.value.value != 1:
+            return False
+        if node.value.type == Integer:
+            return other_type in NumericTypes
+        return node.value.type == Float and other_type == Float
+
+    def is_zero(self, node):
+        """
+        Is the Node a constant Integer 0?
+        :param node: Node
+        :return: Boolean
+        """
+        return is_constant(node) and node.value.type == Integer and node.value.value == 0
+
+    def is_computed(self, node, node_type):
+        """
+        Is the Node a Numeric expression evaluating to a new Value (without source text)?
+        :param node: Node
+        :param node_type: TokenType or None
+        :return: Boolean
+        """
+        if node_type not in NumericTypes:
+            return False
+        return isinstance(node, parser.BinaryNode) or \
+            (isinstance(node, parser.UnaryNode) and node.op_token.value == '-')
+
+    def create_value_node(self, val):
+        """
+        Create a ValueNode of a folded Value
+        :param val: Value
+        :return: ValueNode
+        """
+        return parser.ValueNode(token.Token(val.to_string(), val.type), val)
@@ -0,0 +1,163 @@
+import gc
+import marshal
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import cache_ as cache
+import lexer_ as lexer
+import parser_ as parser
+import token_ as token
+
+# Smallest part of a program lexed and parsed by a worker, smaller programs are parsed in this process
+MinChunkSize = 256 * 1024
+
+# Chunks per worker, so workers finishing early take more chunks while earlier ones are merged
+ChunksPerWorker = 4
+
+
+def parse_chunk(chunk):
+    """
+    Tokenize and parse a chunk of a program in a worker process, returning its statements encoded by cache.encode_ast.
+    Errors are not raised here, the whole program is parsed again to raise the first of them
+    :param chunk: String
+    :return: (bytes, Integer), the encoded statements and the operands looked up in previous expressions,
+    or None if the chunk has errors
+    """
+    chunk_parser = parser.Parser()
+    try:
+        ast = chunk_parser.parse(chunk, lexer.Lexer().tokenize(chunk))
+    except (SystemExit, Exception):
+        return None
+    return marshal.dumps(cache.encode_ast(ast)), chunk_parser.prev_expr_lookups
+
+
+def starts_statement(source, idx):
+    """
+    Does a new statement start at idx, after a line break outside String literals?
+    A symbolic Token before the line break continues over it, and a line starting with a Binary Operator
+    or RightParen continues the expression of the line before it
+    :param source: String
+    :param idx: Integer, start of a line
+    :return: Boolean
+    """
+    # Symbolic Tokens continue over line breaks
+    end = idx - 1
+    while end > 0 and source[end - 1] == '\n':
+        end -= 1
+    if end > 0 and source[end - 1] not in token.SymbolicStopCharacters:
+        return False
+
+    line_lexer = lexer.Lexer()
+    line_lexer.text = source
+    line_lexer.idx = idx
+    start = line_lexer.scan_next_identifier()
+    first = source[start:line_lexer.idx]
+    return first != ')' and first not in parser.BinaryPrecedence
+
+
+def split_source(source, chunks):
+    """
+    Split a program into about chunks parts of similar size, at line breaks outside String literals
+    where a new statement starts, so each part tokenizes and parses as it would within the whole program
+    :param source: String
+    :param chunks: Integer
+    :return: List[String]
+    """
+    parts = []
+    start = 0
+    # String literals have no escaped '"', so a line break is inside one after an odd number of '"'
+    quotes = 0
+    counted = 0
+    for part_idx in range(1, chunks):
+        idx = max(len(source) * part_idx // chunks, start)
+        while True:
+            idx = source.find('\n', idx)
+            if idx == -1:
+                break
+            idx += 1
+
+            quotes += source.count('"', counted, idx)
+            counted = idx
+            if quotes % 2 == 0 and starts_statement(source, idx):
+                break
+
+        # Rest of the source cannot be split
+        if idx == -1:
+            break
+        parts.append(source[start:idx])
+        start = idx
+
+    parts.append(source[start:])
+    return parts
+
+
+class ParallelParser:
+    def __init__(self, workers=None, min_chunk_size=MinChunkSize):
+        """
+        Create a new ParallelParser, tokenizing and parsing chunks of large programs on a pool of worker processes.
+        The statements of every chunk are merged in order, into the same AST as parsing the whole program
+        :param workers: Integer, worker processes (default: number of CPUs)
+        :param min_chunk_size: Integer, smallest chunk in characters
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk_size = min_chunk_size
+        self.executor = None
+        self.chunks = 0
+        # Chunks parsed again in this process, as their statements continue from previous chunks
+        self.chunks_reparsed = 0
+
+    def close(self):
+        """
+        Shut down the worker processes
+        :return: Nothing
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def parse(self, expr):
+        """
+        Tokenize and parse a given expression into an Abstract Syntax Tree (AST) in parallel.
+        Expressions too small to split and expressions with errors are left to a single Parser,
+        which raises their first error with its position
+        :param expr: String
+        :return: List[Node], or None if the expression is not parsed
+        """
+        chunks = min(self.workers * ChunksPerWorker, len(expr) // self.min_chunk_size)
+        if chunks < 2 or self.workers < 2:
+            return None
+        parts = split_source(expr, chunks)
+        if len(parts) == 1:
+            return None
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers)
+
+        ast = []
+        # Statements of previous chunks, the operands a later chunk may look up
+        prev_expr = deque()
+        # Merged programs are only ever freed as a whole, pause the cyclic GC while they are created
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for part, result in zip(parts, self.executor.map(parse_chunk, parts)):
+                if result is None:
+                    return None
+                self.chunks += 1
+
+                encoded, prev_expr_lookups = result
+                # Chunk looked up operands in previous expressions, which are in previous chunks
+                if prev_expr_lookups:
+                    self.chunks_reparsed += 1
+                    ast.extend(parser.Parser().parse(expr, lexer.Lexer().tokenize(part), prev_expr))
+                    continue
+
+                statements = cache.decode_ast(*marshal.loads(encoded))
+                ast.extend(statements)
+                prev_expr.extend(statements)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        return ast
@@ -0,0 +1,251 @@
+import json
+import time
+
+import token_ as token
+
+# Stages of executing a program, in the order they run
+Stages = ['lex', 'parse', 'optimize', 'compile', 'eval']
+
+# Source lines shown by Profiler.format_report
+HotLines = 20
+
+
+def get_line_text(tokens, idx):
+    """
+    Get the source line of the Token at idx of a TokenBuffer
+    :param tokens: TokenBuffer
+    :param idx: Integer
+    :return: String
+    """
+    source = tokens.source
+    line_start = tokens.starts[idx] - tokens.columns[idx] + 1
+    line_end = source.find('\n' if isinstance(source, str) else b'\n', line_start)
+    text = source[line_start:line_end if line_end != -1 else len(source)]
+    return (text if isinstance(text, str) else token.decode_text(text)).strip()
+
+
+class Profiler:
+    def __init__(self):
+        """
+        Create a new Profiler, recording where an Interpreter spends its time: the wall time of each stage,
+        of each source line's statements and of each Node kind, and the Operators and Value TokenTypes evaluated
+        """
+        # Seconds spent in each stage, and the stage being timed with the perf_counter it started at
+        self.stages = dict.fromkeys(Stages, 0.0)
+        self.stage = None
+        self.stage_start = 0.0
+        # Source line of each statement (or compiled statement) by id, and the text of each line
+        self.statement_lines = dict()
+        self.line_texts = dict()
+        # [runs, seconds] of the statements of each source line, None for statements of unknown lines
+        self.lines = dict()
+        # [evaluations, seconds] of each Node kind, excluding the time of its children
+        self.nodes = dict()
+        # Evaluations of each Operator, and the TokenType names of the Values they evaluated to
+        self.operators = dict()
+        self.value_types = dict()
+
+    def reset(self):
+        """
+        Forget everything recorded, before profiling another program. Cleared in place,
+        as the evaluators wrapped by the Profiler hold on to them
+        :return: Nothing
+        """
+        self.stages = dict.fromkeys(Stages, 0.0)
+        self.stage = None
+        for recorded in (self.statement_lines, self.line_texts, self.lines, self.nodes, self.operators,
+                         self.value_types):
+            recorded.clear()
+
+    def start_stage(self, stage):
+        """
+        Start timing a stage, until Profiler.stop_stage
+        :param stage: String, one of Stages
+        :return: Nothing
+        """
+        self.stage = stage
+        self.stage_start = time.perf_counter()
+
+    def stop_stage(self):
+        """
+        Stop timing the current stage, adding its time to the stage
+        :return: Nothing
+        """
+        if self.stage is not None:
+            self.stages[self.stage] += time.perf_counter() - self.stage_start
+            self.stage = None
+
+    def record_source(self, tokens, ast, starts):
+        """
+        Record the source line of each statement of a parsed program
+        :param tokens: TokenBuffer
+        :param ast: List[Node]
+        :param starts: List[Integer], index of the Token each statement starts at
+        :return: Nothing
+        """
+        lines = tokens.lines
+        for statement, idx in zip(ast, starts):
+            line = lines[idx]
+            self.statement_lines[id(statement)] = line
+            if line not in self.line_texts:
+                self.line_texts[line] = get_line_text(tokens, idx)
+
+    def map_statements(self, before, after):
+        """
+        Give each statement of a List the source line of the statement it was created from, at the same index
+        (e.g. an optimized or compiled statement)
+        :param before: List[Node]
+        :param after: List[Node or Function]
+        :return: Nothing
+        """
+        statement_lines = self.statement_lines
+        for old, new in zip(before, after):
+            line = statement_lines.get(id(old))
+            if line is not None:
+                statement_lines[id(new)] = line
+
+    def run_statements(self, statements, eval_statement):
+        """
+        Evaluate statements in order, adding the time of each to its source line
+        :param statements: List[Node or Function]
+        :param eval_statement: Function(statement) -> Value
+        :return: Nothing
+        """
+        clock = time.perf_counter
+        statement_lines = self.statement_lines
+        lines = self.lines
+
+        for statement in statements:
+            line = statement_lines.get(id(statement))
+            start = clock()
+            try:
+                eval_statement(statement)
+
+            # Statements stopped by an error are timed too
+            finally:
+                seconds = clock() - start
+                entry = lines.get(line)
+                if entry is None:
+                    lines[line] = [1, seconds]
+                else:
+                    entry[0] += 1
+                    entry[1] += seconds
+
+    def time_nodes(self, eval_ast):
+        """
+        Wrap a recursive Node evaluator (e.g. Interpreter.eval_ast) to time each Node kind. The time of a Node
+        excludes the time of the Nodes it evaluates, so the times of every kind add up to the evaluation time
+        :param eval_ast: Function(Node) -> Value
+        :return: Function(Node) -> Value
+        """
+        clock = time.perf_counter
+        nodes = self.nodes
+        # Seconds spent in the children of each Node being evaluated, the last one is the innermost Node
+        children = [0.0]
+
+        def eval_timed(node):
+            children.append(0.0)
+            start = clock()
+            try:
+                return eval_ast(node)
+            finally:
+                seconds = clock() - start
+                own_seconds = seconds - children.pop()
+                children[-1] += seconds
+
+                kind = type(node).__name__
+                entry = nodes.get(kind)
+                if entry is None:
+                    nodes[kind] = [1, own_seconds]
+                else:
+                    entry[0] += 1
+                    entry[1] += own_seconds
+
+        return eval_timed
+
+    def count_operations(self, eval_values):
+        """
+        Wrap the evaluation of a BinaryNode or UnaryNode from its Values (e.g. Interpreter.eval_binary_values)
+        to count its Operator and the TokenType of its result
+        :param eval_values: Function(Node, Value...) -> Value
+        :return: Function(Node, Value...) -> Value
+        """
+        operators = self.operators
+        value_types = self.value_types
+
+        def eval_counted(node, *values):
+            op_val = node.op_token.value
+            operators[op_val] = operators.get(op_val, 0) + 1
+            result = eval_values(node, *values)
+            type_name = result.type.value
+            value_types[type_name] = value_types.get(type_name, 0) + 1
+            return result
+
+        return eval_counted
+
+    def get_report(self):
+        """
+        Get everything recorded, lines sorted by time spent
+        :return: Dict
+        """
+        lines = sorted(self.lines.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            'stages': dict(self.stages),
+            'total': sum(self.stages.values()),
+            'lines': [{'line': line, 'runs': runs, 'seconds': seconds, 'source': self.line_texts.get(line)}
+                      for line, (runs, seconds) in lines],
+            'nodes': {kind: {'evaluations': evaluations, 'seconds': seconds}
+                      for kind, (evaluations, seconds) in sorted(self.nodes.items(), key=lambda item: -item[1][1])},
+            'operators': dict(sorted(self.operators.items(), key=lambda item: -item[1])),
+            'value_types': dict(sorted(self.value_types.items(), key=lambda item: -item[1])),
+        }
+
+    def to_json(self):
+        """
+        Get the report of Profiler.get_report as JSON
+        :return: String
+        """
+        return json.dumps(self.get_report(), indent=2)
+
+    def format_report(self, hot_lines=HotLines):
+        """
+        Get a readable report: the time of each stage, the hot lines taking the most time,
+        then the Node kinds, Operators and Value TokenTypes
+        :param hot_lines: Integer, lines shown
+        :return: String
+        """
+        report = self.get_report()
+        stages = ", ".join(f"{stage} {seconds * 1000:.3f} ms" for stage, seconds in report['stages'].items())
+        out = [f"Profile: {stages}, total {report['total'] * 1000:.3f} ms"]
+
+        # Statement times only cover engines that run one statement at a time
+        eval_seconds = report['stages']['eval'] or 1.0
+        if report['lines']:
+            out.append("")
+            out.append(f"{'line':>8} {'runs':>8} {'ms':>10} {'% eval':>7}  source")
+            for entry in report['lines'][:hot_lines]:
+                line = '?' if entry['line'] is None else entry['line']
+                out.append(f"{line:>8} {entry['runs']:>8} {entry['seconds'] * 1000:>10.3f} "
+                           f"{entry['seconds'] / eval_seconds:>7.1%}  {entry['source'] or ''}")
+            if len(report['lines']) > hot_lines:
+                out.append(f"{'...':>8} {len(report['lines']) - hot_lines} more lines")
+
+        if report['nodes']:
+            out.append("")
+            out.append(f"{'node':>14} {'evaluations':>12} {'ms':>10}")
+            for kind, entry in report['nodes'].items():
+                out.append(f"{kind:>14} {entry['evaluations']:>12} {entry['seconds'] * 1000:>10.3f}")
+
+        if report['operators']:
+            out.append("")
+            out.append(f"{'operator':>14} {'evaluations':>12}")
+            for op_val, count in report['operators'].items():
+                out.append(f"{op_val:>14} {count:>12}")
+
+        if report['value_types']:
+            out.append("")
+            out.append(f"{'value type':>14} {'results':>12}")
+            for type_name, count in report['value_types'].items():
+                out.append(f"{type_name:>14} {count:>12}")
+
+        return "\n".join(out)
@@ -0,0 +1,114 @@
+import parser_ as parser
+import token_ as token
+import value_ as value
+
+Variable = token.TokenType.Variable
+
+
+class EmptySlot:
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'Empty'
+
+
+# Marks the slot of a Variable that is not assigned, or was deleted
+Empty = EmptySlot()
+
+
+class SlotValue(value.Value):
+    __slots__ = ('slot',)
+
+    def __init__(self, var_value, slot):
+        """
+        Create a new SlotValue, a Variable Value of the AST resolved to the slot of its Variable
+        :param var_value: Value, of TokenType Variable
+        :param slot: Integer
+        """
+        super().__init__(var_value.value, var_value.type, var_value.text)
+        self.slot = slot
+
+
+class SlotProgram:
+    def __init__(self, statements, names):
+        """
+        Create a new SlotProgram, a List of statements whose Variables are resolved to slots
+        :param statements: List[Node]
+        :param names: List[String], the Variable of each slot
+        """
+        self.statements = statements
+        self.names = names
+        # Slot of each Variable, for Variable Values created while running (e.g. a Complex result)
+        self.slot_table = {var_name: slot for slot, var_name in enumerate(names)}
+
+    def __iter__(self):
+        return iter(self.statements)
+
+    def __len__(self):
+        return len(self.statements)
+
+
+class Resolver:
+    def __init__(self):
+        """
+        Create a new Resolver, assigning every Variable of a program an Integer slot before it runs,
+        so running it indexes an array of Values instead of hashing Variable names
+        """
+        # Slot of each Variable of the program being resolved
+        self.slots = dict()
+        self.names = []
+
+    def get_slot(self, var_name):
+        """
+        Get the slot of a Variable, assigning it the next slot when first seen
+        :param var_name: String
+        :return: Integer
+        """
+        slot = self.slots.get(var_name)
+        if slot is None:
+            slot = self.slots[var_name] = len(self.names)
+            self.names.append(var_name)
+        return slot
+
+    def resolve(self, ast):
+        """
+        Resolve every Variable of a List of statements to a slot, numbered in the order Variables are first seen.
+        Variable Values of ValueNodes become SlotValues and VariableNodes get the slot they assign, in place,
+        so resolving the same AST again gives the same slots. Nodes shared by several statements are resolved once
+        :param ast: List[Node]
+        :return: SlotProgram
+        """
+        self.slots = dict()
+        self.names = []
+        # Node ids already resolved
+        resolved = set()
+
+        for statement in ast:
+            # Walk with a work stack, ASTs may be deeper than the recursion limit
+            stack = [statement]
+            while stack:
+                node = stack.pop()
+                if node is None or id(node) in resolved:
+                    continue
+                resolved.add(id(node))
+                node_type = type(node)
+
+                if node_type is parser.ValueNode:
+                    if node.value.type == Variable:
+                        slot = self.get_slot(node.value.value)
+                        if not (isinstance(node.value, SlotValue) and node.value.slot == slot):
+                            node.value = SlotValue(node.value, slot)
+
+                # LeftNode is resolved first, so it is pushed last
+                elif node_type is parser.BinaryNode:
+                    stack.append(node.right)
+                    stack.append(node.left)
+
+                elif node_type is parser.VariableNode:
+                    node.slot = self.get_slot(node.var_token.value)
+                    stack.append(node.val_node)
+
+                elif node_type is parser.UnaryNode or node_type is parser.KeywordNode:
+                    stack.append(node.node)
+
+        return SlotProgram(list(ast), self.names)
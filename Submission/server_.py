@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+import traceback
+
+import cache_ as cache
+import errors_ as errors
+import interpreter_ as interpreter
+import sink_ as sink
+
+
+def request_error(reason):
+    """
+    Error for a request that is not a JSON object with a 'source' String
+    :param reason: String
+    :return: SystemExit
+    """
+    return SystemExit(f"--- SERVER ERROR ---\n"
+                      f"RequestError: {reason}\n"
+                      f"--- SERVER ERROR ---")
+
+
+def describe_error(message):
+    """
+    Split an error message, e.g. '--- INTERPRETER ERROR ---\\nValueError: ...\\nin Variable ...\\n--- ...',
+    into its stage, type, description and detail lines
+    :param message: String
+    :return: Dict[String, Any]
+    """
+    lines = message.split("\n")
+    error_type, _, description = lines[1].partition(": ") if len(lines) > 2 else ("", "", "")
+
+    # Not an error of the usual form, only its message is known
+    if not description or not lines[0].startswith("---"):
+        return {'stage': None, 'type': None, 'message': message, 'details': [], 'text': message}
+
+    return {'stage': lines[0].strip("- ").replace(" ERROR", ""), 'type': error_type, 'message': description,
+            'details': lines[2:-1], 'text': message}
+
+
+class InterpreterServer:
+    def __init__(self, engine="tree", optimize=False, parse_cache=None):
+        """
+        Create a new InterpreterServer, executing programs of JSON requests on warm Interpreters that share
+        a ParseCache. Each request runs in a fresh program memory, and its errors are returned in its response
+        instead of stopping the server
+        :param engine: String, engine of requests without one
+        :param optimize: Boolean, optimize programs of requests without 'optimize'
+        :param parse_cache: ParseCache (default: a new ParseCache)
+        """
+        if engine not in interpreter.Engines:
+            raise errors.engine_error(engine, interpreter.Engines)
+
+        self.engine = engine
+        self.optimize = optimize
+        self.parse_cache = parse_cache if parse_cache is not None else cache.ParseCache()
+        # Interpreter of each (engine, optimize)
+        self.interpreters = dict()
+        # Requests of concurrent connections run one at a time, Interpreters are not shared between threads
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failed = 0
+
+    def get_interpreter(self, engine, optimize):
+        """
+        Get the warm Interpreter of an engine and optimize option, creating it for the first request using them
+        :param engine: String
+        :param optimize: Boolean
+        :return: Interpreter
+        """
+        key = (engine, optimize)
+        if key not in self.interpreters:
+            self.interpreters[key] = interpreter.Interpreter(engine=engine, optimize=optimize,
+                                                             parse_cache=self.parse_cache)
+        return self.interpreters[key]
+
+    def handle_request(self, line):
+        """
+        Execute the program of a JSON request, e.g. {"id": 1, "source": "print 1", "engine": "vm"}.
+        Errors never propagate, so one request cannot stop the server
+        :param line: String, a JSON object with 'source' and optional 'id', 'engine' and 'optimize'
+        :return: Dict[String, Any], the response with the request's id, status (ok, error or exception),
+        printed output, error and seconds
+        """
+        output = sink.MemorySink()
+        request_id = None
+        status = 'ok'
+        error = None
+        start = time.perf_counter()
+
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as json_error:
+                raise request_error(f"Invalid JSON, {json_error}")
+            if not isinstance(request, dict):
+                raise request_error("Request must be a JSON object")
+            request_id = request.get('id')
+            if not isinstance(request.get('source'), str):
+                raise request_error("Request must have a 'source' String")
+
+            engine = request.get('engine', self.engine)
+            if engine not in interpreter.Engines:
+                raise errors.engine_error(engine, interpreter.Engines)
+            optimize = bool(request.get('optimize', self.optimize))
+
+            with self.lock:
+                prog_interpreter = self.get_interpreter(engine, optimize)
+                prog_interpreter.output = output
+                try:
+                    prog_interpreter.execute(request['source'])
+                # An Interpreter that raised an exception may be left in any state, the next request gets a new one
+                except Exception:
+                    self.interpreters.pop((engine, optimize), None)
+                    raise
+
+        # Interpreter and request errors
+        except SystemExit as exit_error:
+            status = 'error'
+            error = describe_error("" if exit_error.code is None else str(exit_error.code))
+
+        # Any other exception, with its traceback
+        except Exception as exception:
+            status = 'exception'
+            error = {'stage': None, 'type': type(exception).__name__, 'message': str(exception),
+                     'details': [], 'text': traceback.format_exc()}
+
+        with self.lock:
+            self.requests += 1
+            if status != 'ok':
+                self.failed += 1
+        return {'id': request_id, 'status': status, 'stdout': output.getvalue(), 'error': error,
+                'seconds': time.perf_counter() - start}
+
+    def serve_stream(self, requests_file, responses_file):
+        """
+        Answer every request line of a file in order, writing each response line as soon as it is known
+        :param requests_file: File
+        :param responses_file: File
+        :return: Nothing
+        """
+        for line in requests_file:
+            if not line.strip():
+                continue
+            responses_file.write(json.dumps(self.handle_request(line)) + "\n")
+            responses_file.flush()
+
+    def serve_socket(self, path):
+        """
+        Answer request lines of every connection to a Unix domain socket, until interrupted
+        :param path: String
+        :return: Nothing
+        """
+        if os.path.exists(path):
+            os.remove(path)
+
+        with ConnectionServer(path, self) as server:
+            try:
+                server.serve_forever()
+            finally:
+                os.remove(path)
+
+
+class ConnectionHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        """
+        Answer the request lines of a connection
+        :return: Nothing
+        """
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.interpreter_server.handle_request(line.decode('utf-8', 'replace'))
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class ConnectionServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, interpreter_server):
+        """
+        Create a new ConnectionServer, a thread per connection to a Unix domain socket
+        :param path: String
+        :param interpreter_server: InterpreterServer
+        """
+        self.interpreter_server = interpreter_server
+        super().__init__(path, ConnectionHandler)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Execute programs of JSON lines requests on warm Interpreters, "
+                                                     "answering each with a JSON line of its output and error")
+    arg_parser.add_argument('--socket', help="Serve a Unix domain socket at this path instead of stdin and stdout")
+    arg_parser.add_argument('--engine', default='tree', choices=interpreter.Engines,
+                            help="Execution engine of requests without 'engine' (default: tree)")
+    arg_parser.add_argument('--optimize', action='store_true',
+                            help="Optimize the programs of requests without 'optimize'")
+    args = arg_parser.parse_args()
+
+    prog_server = InterpreterServer(args.engine, args.optimize)
+    # Terminating stops the server like an interrupt, removing its socket
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        if args.socket:
+            prog_server.serve_socket(args.socket)
+        else:
+            prog_server.serve_stream(sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+
+    print(f"Server: {prog_server.requests} requests, {prog_server.failed} failed, "
+          f"{prog_server.parse_cache.hits} ParseCache hits", file=sys.stderr)
@@ -0,0 +1,143 @@
+import sys
+
+# Characters of printed text buffered before they are written out
+DefaultFlushSize = 64 * 1024
+
+
+class OutputSink:
+    def write_line(self, line):
+        """
+        Output a printed line, without its line break
+        :param line: String
+        :return: Nothing
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """
+        Write out every buffered line, the Interpreter flushes after every run or stream, including those stopped
+        by an error
+        :return: Nothing
+        """
+
+    def close(self):
+        """
+        Flush, and release what the sink opened
+        :return: Nothing
+        """
+        self.flush()
+
+
+class BufferedSink(OutputSink):
+    def __init__(self, flush_size=DefaultFlushSize):
+        """
+        Create a new BufferedSink, joining printed lines into one write per flush_size characters
+        :param flush_size: Integer, 0 writes out every line as it is printed
+        """
+        self.flush_size = flush_size
+        self.lines = []
+        self.size = 0
+
+    def write_line(self, line):
+        """
+        Buffer a printed line, writing out the buffer once it holds flush_size characters
+        :param line: String
+        :return: Nothing
+        """
+        self.lines.append(line)
+        self.size += len(line) + 1
+        if self.size >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write out every buffered line
+        :return: Nothing
+        """
+        file = self.get_file()
+        if self.lines:
+            file.write("\n".join(self.lines) + "\n")
+            self.lines = []
+            self.size = 0
+        file.flush()
+
+    def get_file(self):
+        """
+        Get the file buffered lines are written to
+        :return: File
+        """
+        raise NotImplementedError
+
+
+class StdoutSink(BufferedSink):
+    """
+    Buffered sink of the standard output. sys.stdout is looked up when flushing,
+    so output follows contextlib.redirect_stdout around a run
+    """
+
+    def get_file(self):
+        """
+        Get the current standard output
+        :return: File
+        """
+        return sys.stdout
+
+
+class FileSink(BufferedSink):
+    def __init__(self, file, flush_size=DefaultFlushSize):
+        """
+        Create a new FileSink, writing printed lines to a file
+        :param file: String, the path of a file to create, or a File opened for writing text
+        :param flush_size: Integer
+        """
+        super().__init__(flush_size)
+        # Files opened here are closed here
+        self.owned = isinstance(file, str)
+        self.file = open(file, 'w') if self.owned else file
+
+    def get_file(self):
+        """
+        Get the file printed lines are written to
+        :return: File
+        """
+        return self.file
+
+    def close(self):
+        """
+        Flush, and close the file if it was opened here
+        :return: Nothing
+        """
+        self.flush()
+        if self.owned:
+            self.file.close()
+
+
+class MemorySink(OutputSink):
+    def __init__(self, target=None):
+        """
+        Create a new MemorySink, capturing printed lines in memory
+        :param target: List, appended each line without its line break (default: a new List),
+        or io.StringIO (or any text File), written each line with its line break
+        """
+        self.target = [] if target is None else target
+
+        # Lines are appended to a List directly, without a method call per line
+        if isinstance(self.target, list):
+            self.write_line = self.target.append
+
+    def write_line(self, line):
+        """
+        Write a printed line to the text File
+        :param line: String
+        :return: Nothing
+        """
+        self.target.write(line + "\n")
+
+    def getvalue(self):
+        """
+        Get everything printed, one line per printed line
+        :return: String
+        """
+        if isinstance(self.target, list):
+            return "".join(line + "\n" for line in self.target)
+        return self.target.getvalue()
@@ -1,134 +1,385 @@
-from enum import Enum
-
-
-# Identify if character is alpha, numeric, or symbolic during tokenization
-class IdentifierType(Enum):
-    Alpha = 1
-    Numeric = 2
-    Symbolic = 3
-    Unknown = 4
-
-    @classmethod
-    def get_identifier_type(cls, char):
-        if ('A' <= char <= 'Z') or ('a' <= char <= 'z') or char == '_':
-            return cls.Alpha
-
-        elif ('0' <= char <= '9') or char in '.-':
-            return cls.Numeric
-
-        else:
-            return cls.Symbolic
-
-
-# Token type identifiers for tokenization and parsing
-class TokenType(Enum):
-    Integer = "Integer"
-    Float = "Float"
-    Boolean = "Boolean"
-    String = "String"
-    Variable = "Variable"
-    Equals = "Equals"
-    UnaryOperation = "UnaryOperation"
-    BinaryOperation = "BinaryOperation"
-    LeftParen = "LeftParen"
-    RightParen = "RightParen"
-    EOL = "EOL"
-    ReservedKeyword = "ReservedKeyword"
-    NoneType = "NoneType"
-    EOF = "EOF"
-    Invalid = "Invalid"
-
-
-# Specific reserved character(s) for each token type
-TokenTypes = {
-    'Boolean': ['true', 'false'],
-    'String': ['"', "'"],
-    'Equals': ['='],
-    'UnaryOperation': ['!', 'not'],
-    'BinaryOperation': ['+', '-', '*', '/', '%', '**', '==', '!=', '>', '<', '>=', '<=', 'and', 'or'],
-    'LeftParen': ['('],
-    'RightParen': [')'],
-    'ReservedKeyword': ['print', 'del'],
-    'NoneType': ['None'],
-    'EOL': ['\n', '\r'],
-    'EOF': ['EOF']
-}
-
-
-class Token:
-    def __init__(self, value, t_type=None):
-        """
-        Create a new Token
-        :param value: String
-        :param t_type: TokenType
-        """
-        self.value = value
-
-        # If self.type is pre-defined or not
-        if t_type is None:
-            self.type = self.identify_type()
-        else:
-            self.type = t_type
-
-    def identify_type(self):
-        """
-        Identify TokenType by self.value
-        :return: TokenType
-        """
-        # Is the token a Float?
-        if '.' in self.value:
-            try:
-                float(self.value)
-                return TokenType.Float
-            except ValueError:
-                pass
-        # Is the token an Integer?
-        else:
-            try:
-                int(self.value)
-                return TokenType.Integer
-            except ValueError:
-                pass
-
-        # If prefix and suffix are '" "', then TokenType is String
-        if (self.value[0] == '\"') and self.value[-1] == '\"':
-            return TokenType.String
-
-        # Is self.value in TokenTypes reserved character(s)?
-        for t_type in TokenTypes:
-            if self.value in TokenTypes[t_type]:
-                return TokenType(t_type)
-
-        # Default to Variable
-        return TokenType.Variable
-
-    def convert_from_string(self):
-        """
-        Convert Numeric and Boolean values to String counter-parts
-        :return: Integer, Float, or Boolean
-        """
-        if self.type == TokenType.Integer:
-            self.value = int(self.value)
-
-        elif self.type == TokenType.Float:
-            self.value = float(self.value)
-
-        elif self.type == TokenType.Boolean:
-            if self.value == 'true':
-                self.value = True
-            else:
-                self.value = False
-
-    def convert_to_string(self):
-        """
-        Convert String to Numeric and Boolean counter-parts
-        :return: String
-        """
-        if self.type in [TokenType.Integer, TokenType.Float]:
-            self.value = str(self.value)
-
-        elif self.type == TokenType.Boolean:
-            if self.value:
-                self.value = 'true'
-            else:
-                self.value = 'false'
+from array import array
+from enum import Enum
+
+
+# Identify if character is alpha, numeric, or symbolic during tokenization
+class IdentifierType(Enum):
+    Alpha = 1
+    Numeric = 2
+    Symbolic = 3
+    Unknown = 4
+
+    @classmethod
+    def get_identifier_type(cls, char):
+        # Characters outside CharacterTypes are always symbolic
+        return CharacterTypes.get(char, cls.Symbolic)
+
+
+def with_bytes(chars):
+    """
+    Get a set of characters which also holds their byte values, so the Lexer can scan a String source
+    or a bytes source (e.g. a memory-mapped file), where indexing gives an Integer, with the same sets
+    :param chars: String, ASCII characters
+    :return: frozenset[String or Integer]
+    """
+    return frozenset(chars) | frozenset(chars.encode())
+
+
+# Precomputed IdentifierType of every alpha and numeric character, and byte
+CharacterTypes = {
+    **{char: IdentifierType.Alpha for char in with_bytes('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_')},
+    **{char: IdentifierType.Numeric for char in with_bytes('0123456789.-')}
+}
+
+# Characters which continue an alpha or numeric identifier once started
+IdentifierCharacters = {
+    IdentifierType.Alpha: with_bytes('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_0123456789.'),
+    IdentifierType.Numeric: with_bytes('0123456789.')
+}
+
+# Characters which end a symbolic identifier, everything else is symbolic
+SymbolicStopCharacters = frozenset(CharacterTypes) | with_bytes(' \t()"')
+
+# Characters ignored before a Token, Tokens of a single character, and the character opening a string
+SpaceCharacters = with_bytes(' \t')
+SingleCharacters = with_bytes('()\n') | frozenset(b'\r')
+QuoteCharacters = with_bytes('"')
+
+# Bytes sources are not read with universal newlines, so '\r\n' and '\r' line breaks are translated by the Lexer
+CarriageReturn = ord('\r')
+LineFeed = ord('\n')
+
+
+# Token type identifiers for tokenization and parsing
+class TokenType(Enum):
+    Integer = "Integer"
+    Float = "Float"
+    Boolean = "Boolean"
+    String = "String"
+    Variable = "Variable"
+    Equals = "Equals"
+    UnaryOperation = "UnaryOperation"
+    BinaryOperation = "BinaryOperation"
+    LeftParen = "LeftParen"
+    RightParen = "RightParen"
+    EOL = "EOL"
+    ReservedKeyword = "ReservedKeyword"
+    NoneType = "NoneType"
+    EOF = "EOF"
+    Invalid = "Invalid"
+
+
+# Specific reserved character(s) for each token type
+TokenTypes = {
+    'Boolean': ['true', 'false'],
+    'String': ['"', "'"],
+    'Equals': ['='],
+    'UnaryOperation': ['!', 'not'],
+    'BinaryOperation': ['+', '-', '*', '/', '%', '**', '==', '!=', '>', '<', '>=', '<=', 'and', 'or'],
+    'LeftParen': ['('],
+    'RightParen': [')'],
+    'ReservedKeyword': ['print', 'del'],
+    'NoneType': ['None'],
+    'EOL': ['\n', '\r'],
+    'EOF': ['EOF']
+}
+
+# Single lookup of every reserved character(s), including multi-character operators such as '**', '>=' and '!='
+TokenTypeLookup = {value: TokenType(t_type) for t_type in TokenTypes for value in TokenTypes[t_type]}
+
+
+def identify_numeric_type(value):
+    """
+    Identify a numeric literal without converting it, e.g. '-4' is Integer and '.5' or '1.5e+20' is Float
+    :param value: String
+    :return: TokenType or None
+    """
+    # Ignore sign prefix
+    if value[:1] in ('-', '+'):
+        value = value[1:]
+
+    # No decimal point, must be digits only
+    whole, point, fraction = value.partition('.')
+    if not point:
+        return TokenType.Integer if value.isascii() and value.isdigit() else None
+
+    # Decimal point may be followed by an exponent, e.g. '1.5e+20'
+    fraction, exponent_char, exponent = fraction.replace('E', 'e').partition('e')
+    if exponent_char:
+        if exponent[:1] in ('-', '+'):
+            exponent = exponent[1:]
+        if not (exponent.isascii() and exponent.isdigit()):
+            return None
+
+    # At least one digit either side of the decimal point
+    digits = whole + fraction
+    return TokenType.Float if digits.isascii() and digits.isdigit() else None
+
+
+# Reserved character(s) as they appear in a bytes source, with their TokenType and shared String value
+ReservedBytes = {value.encode(): (t_type, value) for value, t_type in TokenTypeLookup.items()}
+ReservedBytes[b'\r'] = ReservedBytes[b'\r\n'] = (TokenType.EOL, '\n')
+
+# First byte of numeric literals, including a sign prefix
+NumericBytes = frozenset(b'0123456789.-+')
+
+
+def convert_escape_chars(literal):
+    """
+    Convert '\' Python reserved characters to token-able characters within a string literal
+    :param literal: String
+    :return: String
+    """
+    # Only pay for decoding when the literal contains a Backslash
+    if '\\' not in literal:
+        return literal
+
+    # New Line (EOL) and Tab
+    return literal.replace('\\n', '\n').replace('\\t', '\t')
+
+
+def identify_token_type(value):
+    """
+    Identify TokenType of a Token value
+    :param value: String
+    :return: TokenType
+    """
+    # Is value in TokenTypes reserved character(s)?
+    t_type = TokenTypeLookup.get(value)
+    if t_type is not None:
+        return t_type
+
+    # Is the token numeric?
+    if IdentifierType.get_identifier_type(value[:1]) == IdentifierType.Numeric or value[:1] == '+':
+        t_type = identify_numeric_type(value)
+        if t_type is not None:
+            return t_type
+
+    # If prefix and suffix are '" "', then TokenType is String
+    elif value[:1] == '\"' and value[-1] == '\"':
+        return TokenType.String
+
+    # Default to Variable
+    return TokenType.Variable
+
+
+def identify_bytes_type(value):
+    """
+    Identify TokenType of a Token value of a bytes source, without decoding identifiers and string literals
+    :param value: bytes
+    :return: TokenType
+    """
+    # Is value in TokenTypes reserved character(s)?
+    reserved = ReservedBytes.get(value)
+    if reserved is not None:
+        return reserved[0]
+
+    # Is the token numeric? Numeric literals are ASCII, anything else is not one
+    if value[0] in NumericBytes:
+        t_type = identify_numeric_type(value.decode('latin-1'))
+        if t_type is not None:
+            return t_type
+
+    # If prefix and suffix are '" "', then TokenType is String
+    elif value[:1] == b'"' and value[-1:] == b'"':
+        return TokenType.String
+
+    # Default to Variable
+    return TokenType.Variable
+
+
+def decode_text(text):
+    """
+    Decode UTF-8 text of a bytes source, translating its line breaks as reading a text file does
+    :param text: bytes
+    :return: String
+    """
+    if b'\r' in text:
+        text = text.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return text.decode('utf-8')
+
+
+def decode_token(value):
+    """
+    Decode a Token value of a bytes source, reserved character(s) are shared Strings instead of decoded
+    :param value: bytes
+    :return: String
+    """
+    reserved = ReservedBytes.get(value)
+    if reserved is not None:
+        return reserved[1]
+
+    value = decode_text(value)
+
+    # String literals have their escape characters decoded
+    if '\"' in value:
+        value = convert_escape_chars(value)
+    return value
+
+
+class Token:
+    def __init__(self, value, t_type=None):
+        """
+        Create a new Token
+        :param value: String
+        :param t_type: TokenType
+        """
+        self.value = value
+
+        # If self.type is pre-defined or not
+        if t_type is None:
+            self.type = self.identify_type()
+        else:
+            self.type = t_type
+
+    def identify_type(self):
+        """
+        Identify TokenType by self.value
+        :return: TokenType
+        """
+        return identify_token_type(self.value)
+
+    def convert_from_string(self):
+        """
+        Convert Numeric and Boolean values to String counter-parts
+        :return: Integer, Float, or Boolean
+        """
+        if self.type == TokenType.Integer:
+            self.value = int(self.value)
+
+        elif self.type == TokenType.Float:
+            self.value = float(self.value)
+
+        elif self.type == TokenType.Boolean:
+            if self.value == 'true':
+                self.value = True
+            else:
+                self.value = False
+
+    def convert_to_string(self):
+        """
+        Convert String to Numeric and Boolean counter-parts
+        :return: String
+        """
+        if self.type in [TokenType.Integer, TokenType.Float]:
+            self.value = str(self.value)
+
+        elif self.type == TokenType.Boolean:
+            if self.value:
+                self.value = 'true'
+            else:
+                self.value = 'false'
+
+
+# Compact integer code of each TokenType for TokenBuffer
+TokenTypeCodes = {t_type: code for code, t_type in enumerate(TokenType)}
+TokenTypesByCode = list(TokenType)
+
+
+class TokenBuffer:
+    def __init__(self, source):
+        """
+        Create a new TokenBuffer, storing Tokens as parallel arrays of
+        TokenType code, start offset and end offset into source, with line and column
+        :param source: String, or bytes-like (e.g. a memory-mapped file) whose Token values are decoded when read
+        """
+        self.source = source
+        self.decode = not isinstance(source, str)
+        self.types = array('B')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.lines = array('I')
+        self.columns = array('I')
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, idx):
+        """
+        Materialize the Token at idx
+        :param idx: Integer
+        :return: Token
+        """
+        return Token(self.get_value(idx), self.get_type(idx))
+
+    def __iter__(self):
+        # Materialize one Token at a time, reading the arrays in step instead of by index
+        source = self.source
+        decode = self.decode
+        eof_code = TokenTypeCodes[TokenType.EOF]
+
+        for code, start, end in zip(self.types, self.starts, self.ends):
+            # End of File (EOF) has no source characters
+            if code == eof_code:
+                yield Token("EOF", TokenType.EOF)
+                continue
+
+            value = source[start:end]
+
+            # Reserved character(s) of a bytes source are shared Strings, only identifiers and literals are decoded
+            if decode:
+                reserved = ReservedBytes.get(value)
+                if reserved is not None:
+                    yield Token(reserved[1], reserved[0])
+                    continue
+                value = decode_text(value)
+
+            # String literals have their escape characters decoded
+            if '\"' in value:
+                value = convert_escape_chars(value)
+            yield Token(value, TokenTypesByCode[code])
+
+    def append(self, t_type, start, end, line, column):
+        """
+        Add a Token by its position in source
+        :param t_type: TokenType
+        :param start: Integer
+        :param end: Integer
+        :param line: Integer
+        :param column: Integer
+        :return: Nothing
+        """
+        self.types.append(TokenTypeCodes[t_type])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def get_type(self, idx):
+        """
+        Get TokenType of the Token at idx
+        :param idx: Integer
+        :return: TokenType
+        """
+        return TokenTypesByCode[self.types[idx]]
+
+    def get_value(self, idx):
+        """
+        Get the value of the Token at idx from source
+        :param idx: Integer
+        :return: String
+        """
+        t_type = TokenTypesByCode[self.types[idx]]
+
+        # End of File (EOF) has no source characters
+        if t_type == TokenType.EOF:
+            return "EOF"
+
+        value = self.source[self.starts[idx]:self.ends[idx]]
+
+        # Only identifiers and literals of a bytes source are decoded
+        if self.decode:
+            return decode_token(value)
+
+        # String literals have their escape characters decoded
+        if '\"' in value:
+            value = convert_escape_chars(value)
+        return value
+
+    def get_position(self, idx):
+        """
+        Get line and column of the Token at idx, both starting from 1
+        :param idx: Integer
+        :return: (Integer, Integer)
+        """
+        return self.lines[idx], self.columns[idx]
@@ -0,0 +1,658 @@
+import ast as pyast
+import decimal
+
+import errors_ as errors
+import operators_ as operators
+import parser_ as parser
+import token_ as token
+import value_ as value
+
+# Static kinds of transpiled expressions. Numeric, Boolean and String expressions are native Python
+# int/float, bool and str objects, every other kind only exists as a known Value at transpile time
+Numeric = 'Numeric'
+Boolean = 'Boolean'
+String = 'String'
+NoneType = 'NoneType'
+Variable = 'Variable'
+Never = 'Never'          # Expression always raises an Interpreter error
+
+# Kind of each Value TokenType
+ValueKinds = {
+    token.TokenType.Integer: Numeric,
+    token.TokenType.Float: Numeric,
+    token.TokenType.Boolean: Boolean,
+    token.TokenType.String: String,
+    token.TokenType.NoneType: NoneType,
+    token.TokenType.Variable: Variable,
+}
+
+# Python operator of each native Binary Operation, by kind of both operands
+NumericOperators = {'+': pyast.Add(), '-': pyast.Sub(), '*': pyast.Mult()}
+NumericHelpers = {'/': 'divide', '%': 'modulus', '**': 'power'}
+Comparisons = {'==': pyast.Eq(), '!=': pyast.NotEq(), '>': pyast.Gt(), '<': pyast.Lt(), '>=': pyast.GtE(),
+               '<=': pyast.LtE()}
+ConditionalOperators = {'and': pyast.BitAnd(), 'or': pyast.BitOr()}
+
+# Generated code is only ever compiled from its AST, so nodes are located as they are created, several times faster
+# than pyast.fix_missing_locations. Nodes of each statement are on the line of its index plus one, so the line
+# a program raised at is the statement it stopped at, every other node is on the first line
+Location = {'lineno': 1, 'col_offset': 0, 'end_lineno': 1, 'end_col_offset': 0}
+LoadContext = pyast.Load()
+StoreContext = pyast.Store()
+
+
+class Deoptimize(Exception):
+    """
+    Raised by generated code when a result has no native kind (e.g. a complex power), the statement
+    it was raised in is then run by the tree walker instead
+    """
+
+
+class NotNative(Exception):
+    """
+    Raised at transpile time for Nodes without a native translation (e.g. a statement reused as an expression)
+    """
+
+
+def power(left_val, right_val):
+    """
+    Power of numbers, complex results deoptimize
+    :param left_val: Integer or Float
+    :param right_val: Integer or Float
+    :return: Integer or Float
+    """
+    result = left_val ** right_val
+    if type(result) is complex:
+        raise Deoptimize()
+    return result
+
+
+def number_string(number):
+    """
+    Printable String of a number, as Value.to_string
+    :param number: Integer or Float
+    :return: String
+    """
+    try:
+        return str(number)
+    # Integer is longer than the int to str digit limit, Decimal has no such limit
+    except ValueError:
+        return str(decimal.Decimal(number))
+
+
+def string_value(string):
+    """
+    String Value of a native str
+    :param string: String
+    :return: Value
+    """
+    return value.Value(string, token.TokenType.String)
+
+
+def fail(error):
+    """
+    Raise an Interpreter error from within an expression
+    :param error: SystemExit
+    :return: Nothing
+    """
+    raise error
+
+
+# Value of a native value stored in a Python local, by kind
+NativeValues = {Numeric: value.Value.from_number, Boolean: value.Value.from_bool, String: string_value}
+
+
+class Typed:
+    __slots__ = ('expr', 'kind', 'known')
+
+    def __init__(self, expr, kind, known=None):
+        """
+        Create a new Typed expression
+        :param expr: pyast.expr, or None if evaluating it has no effect
+        :param kind: String
+        :param known: Value, the Value of the expression if it is known at transpile time
+        """
+        self.expr = expr
+        self.kind = kind
+        self.known = known
+
+
+def get_variables(env, history, error, frame_locals):
+    """
+    Get the Variables the statement a transpiled program raised at started from
+    :param env: Dict[String, Typed], known Variables before the first statement
+    :param history: List[(Integer, String, Typed)], index of the statement, name and kind of every Variable
+    assigned, None for deleted Variables
+    :param error: BaseException, caught in the program's function
+    :param frame_locals: Dict[String, Object], locals of the program's function
+    :return: Dict[String, Value]
+    """
+    # Nodes of each statement are on the line of its index plus one
+    idx = error.__traceback__.tb_lineno - 1
+    env = dict(env)
+    for change_idx, var_name, typed in history:
+        if change_idx >= idx:
+            break
+        if typed is None:
+            del env[var_name]
+        else:
+            env[var_name] = typed
+
+    return {var_name: typed.known if typed.known is not None else
+            NativeValues[typed.kind](frame_locals[typed.expr.id]) for var_name, typed in env.items()}
+
+
+class PythonProgram:
+    def __init__(self, module, namespace, statements):
+        """
+        Create a new PythonProgram from a transpiled Python module.
+        Its 'program' function returns the index of the first statement it did not run and the Variables.
+        It is called with a Dict, updated with the Variables the statement it stopped at started from if it raises
+        :param module: pyast.Module
+        :param namespace: Dict, globals of the module
+        :param statements: List[Node], the statements that were transpiled
+        """
+        self.module = module
+        self.namespace = namespace
+        self.statements = statements
+        exec(compile(module, '<program>', 'exec'), namespace)
+        self.function = namespace['program']
+
+
+class Transpiler:
+    def __init__(self):
+        """
+        Create a new Transpiler, translating the AST into a Python module for CPython to run.
+        Programs have no control flow, so the kind of every expression and Variable is known ahead of running
+        """
+        self.namespace = dict()
+        self.constants = dict()
+        self.locals = dict()
+        self.env = dict()
+        self.history = []
+        self.idx = 0
+        self.location = Location
+        self.guarded = False
+
+    def transpile(self, ast, variables=None):
+        """
+        Transpile a List of statements into a PythonProgram
+        :param ast: List[Node]
+        :param variables: Dict[String, Value], Variables the program starts from
+        :return: PythonProgram
+        """
+        self.namespace = {
+            'errors': errors, 'Deoptimize': Deoptimize, 'fail': fail, 'number': value.Value.from_number,
+            'boolean': value.Value.from_bool, 'string': string_value, 'number_string': number_string,
+            'divide': operators.divide, 'modulus': operators.modulus, 'power': power,
+            # OutputSink of printed lines, set by the Interpreter for each run
+            'output': None,
+        }
+        self.constants = dict()
+        self.locals = dict()
+        self.history = []
+        self.location = Location
+
+        # Variables are known Values before the first statement
+        self.env = dict()
+        body = []
+        try:
+            for var_name, var_value in (variables or dict()).items():
+                self.env[var_name] = self.known(var_value)
+
+        # A Variable has no kind, the whole program runs on the tree walker from a copy of the Variables,
+        # so running the program again starts from the same Variables
+        except NotNative:
+            self.env = dict()
+            result = pyast.Tuple([pyast.Constant(0, **Location), self.call('dict', self.constant(variables))],
+                                 LoadContext, **Location)
+            body.append(pyast.Return(result, **Location))
+        # Variables of a raising program are rebuilt from the ones before the first statement and the history
+        env = dict(self.env)
+
+        for idx, statement in enumerate(ast if not body else []):
+            start_env = dict(self.env)
+            self.idx = idx
+            self.location = {'lineno': idx + 1, 'col_offset': 0, 'end_lineno': idx + 1, 'end_col_offset': 0}
+            self.guarded = False
+
+            # Statement cannot be transpiled, the rest of the program runs on the tree walker
+            try:
+                statement_body, raises = self.transpile_statement(statement)
+            except NotNative:
+                self.env = start_env
+                body.append(self.create_return(idx))
+                break
+
+            # Statement may deoptimize, so it restarts on the tree walker
+            if self.guarded:
+                handler = pyast.ExceptHandler(type=self.load('Deoptimize'), name=None,
+                                              body=[self.create_return(idx, start_env)], **self.location)
+                statement_body = [pyast.Try(body=statement_body, handlers=[handler], orelse=[], finalbody=[],
+                                            **self.location)]
+            body.extend(statement_body)
+
+            # Statement always raises, nothing after it runs
+            if raises:
+                break
+        else:
+            if not body or not isinstance(body[-1], pyast.Return):
+                body.append(self.create_return(len(ast)))
+
+        # A raising program updates the Dict it is called with: variables.update(variables_at(error, locals()))
+        self.location = Location
+        history = self.history
+        self.namespace['variables_at'] = lambda error, frame_locals: get_variables(env, history, error, frame_locals)
+        stopped = self.call('variables_at', self.load('error'), self.call('locals'))
+        update = pyast.Call(pyast.Attribute(self.load('variables'), 'update', LoadContext, **Location), [stopped], [],
+                            **Location)
+        handler = pyast.ExceptHandler(type=self.load('BaseException'), name='error',
+                                      body=[pyast.Expr(update, **Location), pyast.Raise(**Location)], **Location)
+        body = [pyast.Try(body=body, handlers=[handler], orelse=[], finalbody=[], **Location)]
+
+        arguments = pyast.arguments(posonlyargs=[], args=[pyast.arg('variables', **Location)], kwonlyargs=[],
+                                    kw_defaults=[], defaults=[])
+        function = pyast.FunctionDef(name='program', args=arguments, body=body, decorator_list=[], returns=None,
+                                     **Location)
+        module = pyast.Module(body=[function], type_ignores=[])
+        return PythonProgram(module, self.namespace, ast)
+
+    def get_source(self, program):
+        """
+        Get the Python source of a PythonProgram, with its constants listed first. Used for inspection
+        :param program: PythonProgram
+        :return: String
+        """
+        lines = []
+        for name, const in program.namespace.items():
+            if name.startswith('const_'):
+                if isinstance(const, value.Value):
+                    lines.append(f"# {name} = {const.to_string(), const.type}")
+                elif isinstance(const, token.Token):
+                    lines.append(f"# {name} = {const.value, const.type}")
+                else:
+                    lines.append(f"# {name} = {const}")
+        lines.append(pyast.unparse(program.module))
+        return "\n".join(lines)
+
+    def transpile_statement(self, statement):
+        """
+        Transpile a statement
+        :param statement: Node
+        :return: (List[pyast.stmt], Boolean), the statement and whether it always raises
+        """
+        # Keywords
+        if isinstance(statement, parser.KeywordNode):
+            if statement.kw_token.value == 'print':
+                return self.transpile_print(statement)
+            elif statement.kw_token.value == 'del':
+                return self.transpile_del(statement)
+            return [], False
+
+        # Variable assignment
+        elif isinstance(statement, parser.VariableNode):
+            return self.transpile_assignment(statement)
+
+        # Expression, evaluated for its errors only
+        typed = self.transpile_node(statement)
+        if typed.expr is None:
+            return [], False
+        return [pyast.Expr(typed.expr, **self.location)], typed.kind == Never
+
+    def transpile_print(self, kw_node):
+        """
+        Transpile a print KeywordNode
+        :param kw_node: KeywordNode
+        :return: (List[pyast.stmt], Boolean)
+        """
+        typed = self.transpile_node(kw_node.node)
+
+        # Printing a single Variable
+        if typed.kind == Variable:
+            # Variable does not exist
+            if typed.known.value not in self.env:
+                error = self.call_error('print_variable_error', pyast.Constant(typed.known.value, **self.location),
+                                        pyast.Constant(kw_node.kw_token.value, **self.location))
+                return [pyast.Expr(error, **self.location)], True
+            typed = self.env[typed.known.value]
+
+        elif typed.kind == Never:
+            return [pyast.Expr(typed.expr, **self.location)], True
+
+        # Lines are written to the OutputSink the Interpreter sets in the namespace for each run
+        write_line = pyast.Attribute(self.load('output'), 'write_line', LoadContext, **self.location)
+        write = pyast.Call(write_line, [self.to_string(typed)], [], **self.location)
+        return [pyast.Expr(write, **self.location)], False
+
+    def transpile_del(self, kw_node):
+        """
+        Transpile a del KeywordNode, Variables are only removed from the known Variables
+        :param kw_node: KeywordNode
+        :return: (List[pyast.stmt], Boolean)
+        """
+        node = kw_node.node
+        kw_val = pyast.Constant(kw_node.kw_token.value, **self.location)
+
+        # Attempt to delete Node
+        if not isinstance(node, parser.ValueNode):
+            error = self.call_error('delete_node_error', self.constant(node), kw_val)
+            return [pyast.Expr(error, **self.location)], True
+
+        # Does the Variable exist?
+        if node.token.value in self.env:
+            self.set_variable(node.token.value, None)
+            return [], False
+
+        # Attempt to delete a non-existent Variable or a non-Variable Token
+        if node.token.type == token.TokenType.Variable:
+            error = self.call_error('delete_variable_error', self.constant(node.token), kw_val)
+        else:
+            error = self.call_error('delete_token_error', self.constant(node.token), kw_val)
+        return [pyast.Expr(error, **self.location)], True
+
+    def transpile_assignment(self, var_node):
+        """
+        Transpile a VariableNode statement, known Values are not stored at all
+        :param var_node: VariableNode
+        :return: (List[pyast.stmt], Boolean)
+        """
+        var_name = var_node.var_token.value
+        typed = self.transpile_node(var_node.val_node)
+
+        if typed.kind == Never:
+            return [pyast.Expr(typed.expr, **self.location)], True
+
+        # Value is known, reads of the Variable use it directly
+        if typed.known is not None:
+            self.set_variable(var_name, Typed(None, typed.kind, typed.known))
+            return ([pyast.Expr(typed.expr, **self.location)] if typed.expr is not None else []), False
+
+        # Store native value in a Python local
+        local = self.get_local(var_name)
+        self.set_variable(var_name, Typed(pyast.Name(local, LoadContext, **self.location), typed.kind))
+        target = pyast.Name(local, StoreContext, **self.location)
+        return [pyast.Assign(targets=[target], value=typed.expr, **self.location)], False
+
+    def transpile_node(self, ast):
+        """
+        Transpile a given Abstract Syntax Tree (AST) expression, Variables are left unresolved
+        :param ast: Node
+        :return: Typed
+        """
+        # Transpile UnaryNode
+        if isinstance(ast, parser.UnaryNode):
+            return self.transpile_unary_node(ast)
+
+        # Transpile BinaryNode
+        elif isinstance(ast, parser.BinaryNode):
+            return self.transpile_binary_node(ast)
+
+        # Value from ValueNode
+        elif isinstance(ast, parser.ValueNode):
+            return self.known(ast.value)
+
+        # Statement reused as an expression
+        elif isinstance(ast, (parser.KeywordNode, parser.VariableNode)):
+            raise NotNative()
+
+        # Provided AST/Node not valid
+        return Typed(self.call_error('none_node_error'), Never)
+
+    def transpile_unary_node(self, unary_node):
+        """
+        Transpile a given UnaryNode
+        :param unary_node: UnaryNode
+        :return: Typed
+        """
+        op_val = unary_node.op_token.value
+        sub = self.transpile_node(unary_node.node)
+        if sub.kind == Never:
+            return sub
+
+        # Value is Variable
+        if sub.kind == Variable:
+            # Cannot unary non-existent Variable
+            if sub.known.value not in self.env:
+                return Typed(self.call_error('unary_variable_error', self.constant(sub.known),
+                                             pyast.Constant(op_val, **self.location)), Never)
+            sub = self.env[sub.known.value]
+
+        # Value is Numeric, only '-' flips the sign
+        if sub.kind == Numeric:
+            if op_val == '-':
+                return Typed(pyast.UnaryOp(pyast.USub(), self.load_value(sub), **self.location), Numeric)
+            return sub
+
+        # Value is Boolean, only '!' and 'not' flip the value
+        elif sub.kind == Boolean:
+            if op_val in ['!', 'not']:
+                return Typed(pyast.UnaryOp(pyast.Not(), self.load_value(sub), **self.location), Boolean)
+            return sub
+
+        # Cannot perform Unary operation on non-Numeric or non-Boolean TokenType
+        return Typed(self.call_error('unary_type_error', self.to_value(sub), pyast.Constant(op_val, **self.location)),
+                     Never)
+
+    def transpile_binary_node(self, binary_node):
+        """
+        Transpile a given BinaryNode
+        :param binary_node: BinaryNode
+        :return: Typed
+        """
+        op_val = binary_node.op_token.value
+
+        # Evaluate LeftNode and RightNode before resolving Variables
+        left = self.transpile_node(binary_node.left)
+        if left.kind == Never:
+            return left
+        right = self.transpile_node(binary_node.right)
+        if right.kind == Never:
+            return Typed(self.sequence(left, right.expr), Never)
+
+        # LeftValue is Variable
+        if left.kind == Variable:
+            if left.known.value not in self.env:
+                error = self.call_error('variable_assignment_error', pyast.Constant(left.known.value, **self.location))
+                return Typed(self.sequence(right, error), Never)
+            left = self.env[left.known.value]
+
+        # RightValue is Variable
+        if right.kind == Variable:
+            if right.known.value not in self.env:
+                error = self.call_error('variable_assignment_error', pyast.Constant(right.known.value, **self.location))
+                return Typed(self.sequence(left, error), Never)
+            right = self.env[right.known.value]
+
+        # LeftValue and RightValue are Numeric
+        if left.kind == Numeric and right.kind == Numeric:
+            if op_val in NumericOperators:
+                return Typed(pyast.BinOp(self.load_value(left), NumericOperators[op_val], self.load_value(right),
+                                         **self.location), Numeric)
+            elif op_val in NumericHelpers:
+                self.guarded = self.guarded or op_val == '**'
+                return Typed(self.call(NumericHelpers[op_val], self.load_value(left), self.load_value(right)), Numeric)
+            elif op_val in Comparisons:
+                return Typed(self.compare(left, op_val, right), Boolean)
+
+        # LeftValue and RightValue are Boolean
+        elif left.kind == Boolean and right.kind == Boolean:
+            if op_val in ConditionalOperators:
+                return Typed(pyast.BinOp(self.load_value(left), ConditionalOperators[op_val],
+                                         self.load_value(right), **self.location), Boolean)
+            elif op_val in ['==', '!=']:
+                return Typed(self.compare(left, op_val, right), Boolean)
+
+            # Any other Operator is false
+            return Typed(self.sequence(left, self.sequence(right, pyast.Constant(False, **self.location))), Boolean)
+
+        # LeftValue and RightValue are String
+        elif left.kind == String and right.kind == String:
+            if op_val == '+':
+                return Typed(pyast.BinOp(self.load_value(left), NumericOperators['+'], self.load_value(right),
+                                         **self.location), String)
+            elif op_val in ['==', '!=']:
+                return Typed(self.compare(left, op_val, right), Boolean)
+
+        # Cannot perform action on non-matching LeftValue and RightValue TokenType
+        return Typed(self.call_error('binary_type_error', self.to_value(left), self.to_value(right),
+                                     pyast.Constant(op_val, **self.location)), Never)
+
+    def known(self, known_value):
+        """
+        Typed expression of a known Value
+        :param known_value: Value or None
+        :return: Typed
+        """
+        # Python None is a statement's result and has no kind
+        if known_value is None:
+            raise NotNative()
+        return Typed(None, ValueKinds[known_value.type], known_value)
+
+    def load_value(self, typed):
+        """
+        Native value of a Numeric, Boolean or String expression
+        :param typed: Typed
+        :return: pyast.expr
+        """
+        if typed.known is not None:
+            return pyast.Constant(typed.known.value, **self.location)
+        return typed.expr
+
+    def to_value(self, typed):
+        """
+        Value of an expression, for error messages and Variables
+        :param typed: Typed
+        :return: pyast.expr
+        """
+        if typed.known is not None:
+            return self.constant(typed.known)
+        elif typed.kind == Numeric:
+            return self.call('number', typed.expr)
+        elif typed.kind == Boolean:
+            return self.call('boolean', typed.expr)
+        return self.call('string', typed.expr)
+
+    def to_string(self, typed):
+        """
+        Printable String of an expression, as Value.to_string
+        :param typed: Typed
+        :return: pyast.expr
+        """
+        if typed.known is not None:
+            return pyast.Constant(typed.known.to_string(), **self.location)
+        elif typed.kind == Numeric:
+            return self.call('number_string', typed.expr)
+        elif typed.kind == Boolean:
+            location = self.location
+            return pyast.IfExp(typed.expr, pyast.Constant('true', **location), pyast.Constant('false', **location),
+                               **location)
+        return typed.expr
+
+    def compare(self, left, op_val, right):
+        """
+        Comparison of two native values
+        :param left: Typed
+        :param op_val: String
+        :param right: Typed
+        :return: pyast.expr
+        """
+        return pyast.Compare(self.load_value(left), [Comparisons[op_val]], [self.load_value(right)], **self.location)
+
+    def sequence(self, first, last):
+        """
+        Evaluate an expression for its errors only, followed by an expression
+        :param first: Typed
+        :param last: pyast.expr
+        :return: pyast.expr
+        """
+        if first.expr is None:
+            return last
+        both = pyast.Tuple([first.expr, last], LoadContext, **self.location)
+        return pyast.Subscript(both, pyast.Constant(-1, **self.location), LoadContext, **self.location)
+
+    def load(self, name):
+        """
+        Load a name of the namespace
+        :param name: String
+        :return: pyast.Name
+        """
+        return pyast.Name(name, LoadContext, **self.location)
+
+    def call(self, name, *args):
+        """
+        Call a function of the namespace
+        :param name: String
+        :param args: pyast.expr
+        :return: pyast.Call
+        """
+        return pyast.Call(self.load(name), list(args), [], **self.location)
+
+    def call_error(self, name, *args):
+        """
+        Raise an Interpreter error from errors_.py
+        :param name: String
+        :param args: pyast.expr
+        :return: pyast.Call
+        """
+        function = pyast.Attribute(self.load('errors'), name, LoadContext, **self.location)
+        error = pyast.Call(function, list(args), [], **self.location)
+        return self.call('fail', error)
+
+    def constant(self, const):
+        """
+        Add a Value, Token or Node to the namespace
+        :param const: Object
+        :return: pyast.Name
+        """
+        if id(const) not in self.constants:
+            name = f"const_{len(self.constants)}"
+            self.constants[id(const)] = name
+            self.namespace[name] = const
+        return self.load(self.constants[id(const)])
+
+    def get_local(self, var_name):
+        """
+        Get the Python local of a Variable. Characters other than ASCII letters, digits and '_' are written as
+        '_x' and their hexadecimal code (e.g. '@' as '_x40'), so the source of the program always compiles
+        :param var_name: String
+        :return: String
+        """
+        if var_name not in self.locals:
+            name = 'var_' + "".join(char if char.isascii() and (char.isalnum() or char == '_') else f"_x{ord(char):02x}"
+                                    for char in var_name)
+            local = name
+            taken = set(self.locals.values())
+            suffix = 0
+            while local in taken:
+                suffix += 1
+                local = f"{name}_{suffix}"
+            self.locals[var_name] = local
+        return self.locals[var_name]
+
+    def set_variable(self, var_name, typed):
+        """
+        Set the kind of a Variable, recorded in the history of the statement being transpiled
+        :param var_name: String
+        :param typed: Typed, or None to delete the Variable
+        :return: Nothing
+        """
+        if typed is None:
+            del self.env[var_name]
+        else:
+            self.env[var_name] = typed
+        self.history.append((self.idx, var_name, typed))
+
+    def create_return(self, idx, env=None):
+        """
+        Return the index of the first statement not run, with the Variables as Values
+        :param idx: Integer
+        :param env: Dict[String, Typed], known Variables, defaults to the current ones
+        :return: pyast.Return
+        """
+        env = self.env if env is None else env
+        location = self.location
+        names = [pyast.Constant(var_name, **location) for var_name in env]
+        values = [self.to_value(typed) for typed in env.values()]
+        result = pyast.Tuple([pyast.Constant(idx, **location), pyast.Dict(names, values, **location)], LoadContext,
+                             **location)
+        return pyast.Return(result, **location)
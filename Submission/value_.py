@@ -0,0 +1,90 @@
+import decimal
+
+import token_ as token
+
+
+class Value:
+    __slots__ = ('value', 'type', 'text')
+
+    def __init__(self, value, v_type, text=None):
+        """
+        Create a new runtime Value holding a native Integer, Float, Boolean or String
+        :param value: Integer, Float, Boolean, String or None
+        :param v_type: TokenType
+        :param text: String, source text of a literal
+        """
+        self.value = value
+        self.type = v_type
+        self.text = text
+
+    @classmethod
+    def from_token(cls, tk):
+        """
+        Convert a primary Token to a Value, keeping its source text
+        :param tk: Token
+        :return: Value
+        """
+        if tk.type == token.TokenType.Integer:
+            return cls(int(tk.value), tk.type, tk.value)
+
+        elif tk.type == token.TokenType.Float:
+            return cls(float(tk.value), tk.type, tk.value)
+
+        elif tk.type == token.TokenType.Boolean:
+            return cls(tk.value == 'true', tk.type, tk.value)
+
+        elif tk.type == token.TokenType.NoneType:
+            return cls(None, tk.type, tk.value)
+
+        # String and Variable values are already native
+        return cls(tk.value, tk.type, tk.value)
+
+    @classmethod
+    def from_number(cls, number):
+        """
+        Create an Integer or Float Value from a numeric result
+        :param number: Integer, Float or Complex
+        :return: Value
+        """
+        if type(number) is int:
+            return cls(number, token.TokenType.Integer)
+
+        # Complex results (e.g. negative number ** 0.5) have no TokenType and are treated as a Variable name
+        elif type(number) is complex:
+            return cls(str(number), token.TokenType.Variable)
+
+        return cls(number, token.TokenType.Float)
+
+    @classmethod
+    def from_bool(cls, boolean):
+        """
+        Get the Boolean Value of a boolean result
+        :param boolean: Boolean
+        :return: Value
+        """
+        return TrueValue if boolean else FalseValue
+
+    def to_string(self):
+        """
+        Convert Value to its printable String, literals print as written in the source
+        :return: String
+        """
+        if self.text is not None:
+            return self.text
+
+        if self.type == token.TokenType.Boolean:
+            return 'true' if self.value else 'false'
+
+        if self.type == token.TokenType.Integer:
+            try:
+                return str(self.value)
+            # Integer is longer than the int to str digit limit, Decimal has no such limit
+            except ValueError:
+                return str(decimal.Decimal(self.value))
+
+        return str(self.value)
+
+
+# Shared Boolean results
+TrueValue = Value(True, token.TokenType.Boolean)
+FalseValue = Value(False, token.TokenType.Boolean)
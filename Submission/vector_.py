@@ -0,0 +1,638 @@
+# NumPy is only needed for batch evaluation
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import errors_ as errors
+import parser_ as parser
+import sink_ as sink
+import token_ as token
+import value_ as value
+
+Integer = token.TokenType.Integer
+Float = token.TokenType.Float
+Boolean = token.TokenType.Boolean
+String = token.TokenType.String
+Variable = token.TokenType.Variable
+NumericTypes = (Integer, Float)
+
+# Operators with a Numeric or Boolean result for Numeric operands
+NumericOperators = ['+', '-', '*', '/', '%', '**']
+ComparisonOperators = ['==', '!=', '>', '<', '>=', '<=']
+
+# Largest Integer magnitude numpy converts to Float exactly, as Python does
+MaxExactInteger = 2 ** 53
+
+# Largest Integer magnitude of an int64 operand or result, well within int64 so estimating it never overflows
+MaxSafeInteger = 2 ** 62
+
+# Largest Integer magnitude of an int64 column
+MaxColumnInteger = 2 ** 63
+
+# numpy dtype of the columns of each TokenType, every other TokenType is an object column
+ColumnTypes = {Integer: 'int64', Float: 'float64', Boolean: 'bool', String: 'object'}
+
+
+class FallbackError(Exception):
+    """
+    Raised when no row can be evaluated as a column, e.g. an error whose message holds each row's Value,
+    so every row is executed by the scalar Interpreter instead
+    """
+
+
+def is_column(val):
+    """
+    Does the Value hold one native value per row (a numpy array)?
+    :param val: Value
+    :return: Boolean
+    """
+    return isinstance(val.value, numpy.ndarray)
+
+
+def outside(number, limit):
+    """
+    Is a number (or each number of a column) at least limit in magnitude?
+    :param number: Integer, Float or numpy.ndarray
+    :param limit: Integer
+    :return: Boolean or numpy.ndarray
+    """
+    # abs() of the smallest int64 is negative
+    return (number >= limit) | (number <= -limit)
+
+
+def as_float(number):
+    """
+    Convert a number or column to Float like Python converts an Integer operand of a Float Operation
+    :param number: Integer, Float or numpy.ndarray
+    :return: numpy.ndarray
+    """
+    return numpy.asarray(number, dtype=numpy.float64)
+
+
+class VectorEvaluator:
+    def __init__(self, scalar_interpreter):
+        """
+        Create a new VectorEvaluator, evaluating one program over many rows of input Variables at once.
+        Each Value holds a numpy array of one native value per row (a column), or one native value shared by every row,
+        and every UnaryNode and BinaryNode is evaluated as one array operation. Rows whose result numpy cannot compute
+        exactly like the scalar Interpreter (e.g. Integers outside int64, or Modulus of Integers by Zero changing
+        the TokenType) fall back to executing the program one row at a time
+        :param scalar_interpreter: Interpreter, evaluates Operations on shared Values and the rows that fall back
+        """
+        if numpy is None:
+            raise errors.numpy_error()
+
+        self.scalar = scalar_interpreter
+        self.rows = 0
+        self.inputs = dict()
+        self.variables = dict()
+        # Rows executed by the scalar Interpreter instead
+        self.fallback = None
+        # Printed text of each print statement, a String shared by every row or a List[String] of one per row
+        self.printed = []
+
+    def evaluate(self, ast, columns):
+        """
+        Evaluate a List of statements over every row of input Variables
+        :param ast: List[Node]
+        :param columns: Dict[String, array-like], one column of values per Variable, of the same length
+        :return: (Dict[String, numpy.ndarray], List[String], List[String or None]), the Variables of each row,
+        what each row printed and the error that stopped each row
+        """
+        self.inputs = self.create_inputs(columns)
+        self.variables = dict(self.inputs)
+        self.fallback = numpy.zeros(self.rows, dtype=bool)
+        self.printed = []
+
+        # Errors raised here hold no row's Value, so every row stops with the same error
+        error = None
+        with numpy.errstate(all='ignore'):
+            try:
+                for statement in ast:
+                    self.eval_ast(statement)
+            except SystemExit as exit_error:
+                error = "" if exit_error.code is None else str(exit_error.code)
+            except FallbackError:
+                self.fallback[:] = True
+
+        variables = {var_name: self.create_result_column(var_value) for var_name, var_value in self.variables.items()}
+        outputs = self.get_outputs()
+        row_errors = [error] * self.rows
+
+        # Execute the rows that fall back one at a time, from their input Variables
+        fallback_rows = numpy.flatnonzero(self.fallback).tolist()
+        if fallback_rows:
+            inputs = {var_name: (var_value.type, var_value.value.tolist())
+                      for var_name, var_value in self.inputs.items()}
+            program = self.scalar.compile(ast)
+            for row in fallback_rows:
+                row_variables, outputs[row], row_errors[row] = self.execute_row(program, inputs, row)
+                self.set_result_row(variables, row_variables, row)
+
+        return variables, outputs, row_errors
+
+    def create_inputs(self, columns):
+        """
+        Create the input Variables, a column Value per Variable
+        :param columns: Dict[String, array-like]
+        :return: Dict[String, Value]
+        """
+        if not columns:
+            raise errors.batch_column_error(None, "No columns of input Variables")
+
+        inputs = dict()
+        self.rows = None
+        for var_name, column in columns.items():
+            array = numpy.asarray(column)
+            if array.ndim != 1:
+                raise errors.batch_column_error(var_name, "Column must have one dimension")
+            if self.rows is None:
+                self.rows = len(array)
+            elif len(array) != self.rows:
+                raise errors.batch_column_error(var_name, f"Column must have {self.rows} rows")
+
+            kind = array.dtype.kind
+            # Columns are always copied, so the given arrays are never modified
+            if kind == 'b':
+                inputs[var_name] = value.Value(array.astype(numpy.bool_), Boolean)
+            elif kind in 'iu':
+                if array.size and array.max() >= MaxColumnInteger:
+                    raise errors.batch_column_error(var_name, "Integers must fit in 64 bits")
+                inputs[var_name] = value.Value(array.astype(numpy.int64), Integer)
+            elif kind == 'f':
+                inputs[var_name] = value.Value(array.astype(numpy.float64), Float)
+            elif kind in 'UO' and all(type(item) is str for item in array.tolist()):
+                strings = numpy.empty(self.rows, dtype=object)
+                strings[:] = array.tolist()
+                inputs[var_name] = value.Value(strings, String)
+            else:
+                raise errors.batch_column_error(var_name, f"Unsupported column dtype '{array.dtype}'")
+        return inputs
+
+    def fall_back(self, rows):
+        """
+        Execute rows with the scalar Interpreter instead
+        :param rows: Boolean or numpy.ndarray, a Boolean per row
+        :return: Nothing
+        """
+        self.fallback |= rows
+
+    def eval_ast(self, ast):
+        """
+        Evaluate a given Abstract Syntax Tree (AST) like Interpreter.eval_ast, over every row
+        :param ast: Node
+        :return: Value
+        """
+        # Evaluate KeywordNode
+        if isinstance(ast, parser.KeywordNode):
+            self.eval_kw_node(ast)
+
+        # Evaluate UnaryNode
+        elif isinstance(ast, parser.UnaryNode):
+            return self.eval_unary_value(ast, self.eval_ast(ast.node))
+
+        # Evaluate BinaryNode, LeftNode before RightNode
+        elif isinstance(ast, parser.BinaryNode):
+            left = self.eval_ast(ast.left)
+            right = self.eval_ast(ast.right)
+            return self.eval_binary_values(ast, left, right)
+
+        elif isinstance(ast, parser.VariableNode):
+            val_value = self.eval_ast(ast.val_node)
+            self.variables[ast.var_token.value] = val_value
+            return val_value
+
+        # Provide Value from ValueNode, shared by every row
+        elif isinstance(ast, parser.ValueNode):
+            return ast.value
+
+        # Provided AST/Node not valid
+        else:
+            raise errors.none_node_error()
+
+    def eval_kw_node(self, kw_node):
+        """
+        Evaluate a given KeywordNode
+        :param kw_node: KeywordNode
+        :return: Nothing
+        """
+        # Printing an expression
+        if kw_node.kw_token.value == 'print':
+            self.print_value(kw_node, self.eval_ast(kw_node.node))
+
+        # Delete a Variable from every row, every row has the same Variables
+        elif kw_node.kw_token.value == 'del':
+            try:
+                self.variables.pop(kw_node.node.token.value)
+
+            # Variable does not exist
+            except KeyError:
+                if isinstance(kw_node.node, parser.ValueNode):
+                    if kw_node.node.token.type == Variable:
+                        raise errors.delete_variable_error(kw_node.node.token, kw_node.kw_token.value)
+                    else:
+                        raise errors.delete_token_error(kw_node.node.token, kw_node.kw_token.value)
+                else:
+                    raise errors.delete_variable_node_error(kw_node.node, kw_node.kw_token.value)
+
+            # Attempt to delete Node
+            except AttributeError:
+                raise errors.delete_node_error(kw_node.node, kw_node.kw_token.value)
+
+    def print_value(self, kw_node, to_print):
+        """
+        Print the evaluated Value of a print KeywordNode in every row
+        :param kw_node: KeywordNode
+        :param to_print: Value
+        :return: Nothing
+        """
+        # Printing a single Variable
+        if to_print.type == Variable:
+            try:
+                to_print = self.variables[to_print.value]
+            except KeyError:
+                raise errors.print_variable_error(to_print.value, kw_node.kw_token.value)
+
+        self.printed.append(self.to_strings(to_print))
+
+    def to_strings(self, val):
+        """
+        Convert a Value to its printable String in every row, like Value.to_string
+        :param val: Value
+        :return: String shared by every row, or List[String]
+        """
+        if not is_column(val):
+            return val.to_string()
+
+        if val.type == Boolean:
+            return numpy.where(val.value, 'true', 'false').tolist()
+
+        # str() of a Python Float is its shortest repr, as Value.to_string prints it
+        return list(map(str, val.value.tolist()))
+
+    def resolve(self, val, missing_error):
+        """
+        Resolve a Variable operand to its Value, a single time
+        :param val: Value
+        :param missing_error: SystemExit, raised if the Variable does not exist
+        :return: Value
+        """
+        if val.type != Variable:
+            return val
+        try:
+            return self.variables[val.value]
+        except KeyError:
+            raise missing_error
+
+    def type_error(self, error, *values):
+        """
+        Error for an Operation on unsupported TokenTypes. Its message holds the Values, so with a column operand
+        each row has its own message, which only the scalar Interpreter builds
+        :param error: Function, the errors_ function creating the SystemExit
+        :param values: Value, the operands of the Operation, then its Operator
+        :return: SystemExit
+        """
+        if any(is_column(val) for val in values[:-1]):
+            raise FallbackError()
+        return error(*values)
+
+    def eval_unary_value(self, unary_node, sub_node):
+        """
+        Evaluate a given UnaryNode from the Value of its Node
+        :param unary_node: UnaryNode
+        :param sub_node: Value
+        :return: Value
+        """
+        op_val = unary_node.op_token.value
+        if sub_node.type == Variable:
+            sub_node = self.resolve(sub_node, errors.unary_variable_error(sub_node, op_val))
+
+        # Value is Numeric
+        if sub_node.type in NumericTypes:
+            if not is_column(sub_node):
+                return self.scalar.eval_numeric_unary_expr(sub_node, op_val)
+
+            # Negating the smallest int64 overflows
+            if op_val == '-':
+                if sub_node.type == Integer:
+                    self.fall_back(outside(sub_node.value, MaxSafeInteger))
+                return value.Value(numpy.negative(sub_node.value), sub_node.type)
+            return sub_node
+
+        # Value is Boolean
+        elif sub_node.type == Boolean:
+            if not is_column(sub_node):
+                return self.scalar.eval_conditional_unary_expr(sub_node, op_val)
+
+            if op_val in ['!', 'not']:
+                return value.Value(numpy.logical_not(sub_node.value), Boolean)
+            return sub_node
+
+        raise self.type_error(errors.unary_type_error, sub_node, op_val)
+
+    def eval_binary_values(self, binary_node, left, right):
+        """
+        Evaluate a given BinaryNode from the Values of its LeftNode and RightNode
+        :param binary_node: BinaryNode
+        :param left: Value
+        :param right: Value
+        :return: Value
+        """
+        op_val = binary_node.op_token.value
+        result = None
+
+        # Variables are resolved once, LeftValue first
+        if left.type == Variable:
+            left = self.resolve(left, errors.variable_assignment_error(left.value))
+        if right.type == Variable:
+            right = self.resolve(right, errors.variable_assignment_error(right.value))
+
+        # LeftValue and RightValue are Numeric
+        if left.type in NumericTypes and right.type in NumericTypes:
+            if op_val in NumericOperators:
+                return self.eval_numeric_binary_expr(left, right, op_val)
+            elif op_val in ComparisonOperators:
+                return self.eval_boolean_binary_expr(left, right, op_val)
+
+        # LeftValue and RightValue are Boolean
+        elif left.type == right.type == Boolean:
+            return self.eval_conditional_binary_expr(left, right, op_val)
+
+        # LeftValue and RightValue are String
+        elif left.type == right.type == String:
+            result = self.eval_string_binary_expr(left, right, op_val)
+
+        if result is not None:
+            return result
+
+        raise self.type_error(errors.binary_type_error, left, right, op_val)
+
+    def get_operand(self, val):
+        """
+        Get the native value of a Numeric operand of an array operation
+        :param val: Value
+        :return: Integer, Float or numpy.ndarray
+        """
+        # Integer literals outside int64 are only computed by Python
+        if val.type == Integer and not is_column(val) and outside(val.value, MaxSafeInteger):
+            raise FallbackError()
+        return val.value
+
+    def eval_numeric_binary_expr(self, left_value, right_value, op_val):
+        """
+        Evaluate numeric BinaryNode expression over every row
+        :param left_value: Value
+        :param right_value: Value
+        :param op_val: String
+        :return: Value
+        """
+        if not (is_column(left_value) or is_column(right_value)):
+            return self.scalar.eval_numeric_binary_expr(left_value, right_value, op_val)
+
+        left_val = self.get_operand(left_value)
+        right_val = self.get_operand(right_value)
+        # Integer Operations are exact in int64 only while their operands and results stay small
+        integers = left_value.type == right_value.type == Integer
+        result_type = Integer if integers else Float
+
+        # Addition and Subtraction
+        if op_val in ['+', '-']:
+            if integers:
+                self.fall_back(outside(left_val, MaxSafeInteger) | outside(right_val, MaxSafeInteger))
+            result = numpy.add(left_val, right_val) if op_val == '+' else numpy.subtract(left_val, right_val)
+
+        # Multiplication
+        elif op_val == '*':
+            if integers:
+                self.fall_back(outside(as_float(left_val) * as_float(right_val), MaxSafeInteger))
+            result = numpy.multiply(left_val, right_val)
+
+        # Division, by Zero is 0.0. Python divides Integers exactly, like Floats only if they convert exactly
+        elif op_val == '/':
+            if integers:
+                self.fall_back(outside(left_val, MaxExactInteger) | outside(right_val, MaxExactInteger))
+            left_float = as_float(left_val)
+            right_float = as_float(right_val)
+            zero = right_float == 0.0
+            result = numpy.where(zero, 0.0, left_float / numpy.where(zero, 1.0, right_float))
+            result_type = Float
+
+        # Modulus, by Zero is 0.0
+        elif op_val == '%':
+            zero = right_val == 0
+            # Modulus of Integers by Zero is a Float
+            if integers:
+                self.fall_back(zero)
+                result = numpy.remainder(left_val, numpy.where(zero, 1, right_val))
+            else:
+                left_float = as_float(left_val)
+                right_float = as_float(right_val)
+                self.fall_back(~numpy.isfinite(left_float) | ~numpy.isfinite(right_float))
+                result = numpy.where(zero, 0.0, numpy.remainder(left_float, numpy.where(zero, 1.0, right_float)))
+
+        # Indices
+        else:
+            result = self.eval_power(left_val, right_val, integers)
+
+        return value.Value(numpy.asarray(result), result_type)
+
+    def eval_power(self, left_val, right_val, integers):
+        """
+        Evaluate Indices over every row. Negative Integer exponents are Float, and negative bases of fractional
+        exponents complex, in Python, so those rows fall back, like Python's errors (0 ** -1 and overflows)
+        :param left_val: Integer, Float or numpy.ndarray
+        :param right_val: Integer, Float or numpy.ndarray
+        :param integers: Boolean
+        :return: numpy.ndarray
+        """
+        left_float = as_float(left_val)
+        right_float = as_float(right_val)
+
+        if integers:
+            negative = right_val < 0
+            estimate = numpy.abs(left_float) ** numpy.where(negative, 0.0, right_float)
+            self.fall_back(negative | ~(estimate < MaxSafeInteger))
+            return numpy.power(left_val, numpy.where(negative, 0, right_val))
+
+        result = numpy.power(left_float, right_float)
+        self.fall_back(~numpy.isfinite(left_float) | ~numpy.isfinite(right_float) | ~numpy.isfinite(result) |
+                       ((left_float == 0.0) & (right_float < 0.0)) |
+                       ((left_float < 0.0) & (right_float != numpy.floor(right_float))))
+        return result
+
+    def eval_boolean_binary_expr(self, left_value, right_value, op_val):
+        """
+        Evaluate boolean BinaryNode expression over every row
+        :param left_value: Value
+        :param right_value: Value
+        :param op_val: String
+        :return: Value
+        """
+        if not (is_column(left_value) or is_column(right_value)):
+            return self.scalar.eval_boolean_binary_expr(left_value, right_value, op_val)
+
+        left_val = self.get_operand(left_value)
+        right_val = self.get_operand(right_value)
+
+        # Python compares an Integer and a Float exactly, numpy converts the Integer to Float first
+        if left_value.type != right_value.type:
+            integer_val = left_val if left_value.type == Integer else right_val
+            self.fall_back(outside(integer_val, MaxExactInteger))
+
+        if op_val == '==':
+            result = numpy.equal(left_val, right_val)
+        elif op_val == '!=':
+            result = numpy.not_equal(left_val, right_val)
+        elif op_val == '>':
+            result = numpy.greater(left_val, right_val)
+        elif op_val == '<':
+            result = numpy.less(left_val, right_val)
+        elif op_val == '>=':
+            result = numpy.greater_equal(left_val, right_val)
+        else:
+            result = numpy.less_equal(left_val, right_val)
+
+        return value.Value(numpy.asarray(result), Boolean)
+
+    def eval_conditional_binary_expr(self, left_value, right_value, op_val):
+        """
+        Evaluate conditional BinaryNode expression over every row
+        :param left_value: Value
+        :param right_value: Value
+        :param op_val: String
+        :return: Value
+        """
+        if not (is_column(left_value) or is_column(right_value)):
+            return self.scalar.eval_conditional_binary_expr(left_value, right_value, op_val)
+
+        left_val = left_value.value
+        right_val = right_value.value
+
+        # And
+        if op_val == 'and':
+            result = numpy.logical_and(left_val, right_val)
+
+        # Or
+        elif op_val == 'or':
+            result = numpy.logical_or(left_val, right_val)
+
+        # Equal to, Booleans are equal when they are the same
+        elif op_val == '==':
+            result = numpy.equal(left_val, right_val)
+
+        # Not equal to
+        elif op_val == '!=':
+            result = numpy.not_equal(left_val, right_val)
+
+        # Any other Operator is false
+        else:
+            return value.FalseValue
+
+        return value.Value(numpy.asarray(result), Boolean)
+
+    def eval_string_binary_expr(self, left_value, right_value, op_val):
+        """
+        Evaluate string BinaryNode expression over every row, on object columns of Python Strings
+        :param left_value: Value
+        :param right_value: Value
+        :param op_val: String
+        :return: Value, or None if Operator is not supported for Strings
+        """
+        if not (is_column(left_value) or is_column(right_value)):
+            return self.scalar.eval_string_binary_expr(left_value, right_value, op_val)
+
+        left_val = self.to_objects(left_value)
+        right_val = self.to_objects(right_value)
+
+        # Concatenate
+        if op_val == '+':
+            return value.Value(numpy.add(left_val, right_val), String)
+
+        # Equal to
+        elif op_val == '==':
+            return value.Value(numpy.equal(left_val, right_val).astype(numpy.bool_), Boolean)
+
+        # Not equal to
+        elif op_val == '!=':
+            return value.Value(numpy.not_equal(left_val, right_val).astype(numpy.bool_), Boolean)
+
+        return None
+
+    def to_objects(self, val):
+        """
+        Get an object column of a String Value, so numpy operates on Python Strings
+        :param val: Value
+        :return: numpy.ndarray
+        """
+        if is_column(val):
+            return val.value
+        return numpy.full(self.rows, val.value, dtype=object)
+
+    def create_result_column(self, val):
+        """
+        Create the column of a Variable's Value in every row. Variables holding a Variable hold its name,
+        in an object column
+        :param val: Value
+        :return: numpy.ndarray
+        """
+        if is_column(val):
+            return val.value.copy()
+
+        dtype = ColumnTypes.get(val.type, 'object')
+        if val.type == Integer and outside(val.value, MaxColumnInteger):
+            dtype = 'object'
+        return numpy.full(self.rows, val.value, dtype=dtype)
+
+    def get_outputs(self):
+        """
+        Get what each row printed
+        :return: List[String]
+        """
+        if not self.printed:
+            return [""] * self.rows
+
+        columns = [[text] * self.rows if isinstance(text, str) else text for text in self.printed]
+        return ["\n".join(lines) + "\n" for lines in zip(*columns)]
+
+    def execute_row(self, program, inputs, row):
+        """
+        Execute a compiled program for a single row with the scalar Interpreter
+        :param program: SlotProgram, compiled by the scalar Interpreter
+        :param inputs: Dict[String, (TokenType, List)], the TokenType and native values of each input column
+        :param row: Integer
+        :return: (Dict[String, Value], String, String or None), the Variables, what was printed and the error
+        """
+        self.scalar.variables = {var_name: value.Value(values[row], var_type)
+                                 for var_name, (var_type, values) in inputs.items()}
+        self.scalar.output = output = sink.MemorySink()
+        error = None
+        try:
+            self.scalar.run(program)
+        except SystemExit as exit_error:
+            error = "" if exit_error.code is None else str(exit_error.code)
+        return self.scalar.variables, output.getvalue(), error
+
+    def set_result_row(self, variables, row_variables, row):
+        """
+        Set a row of the Variable columns to the Variables of its scalar execution. Columns that cannot hold
+        the row's Value become object columns, holding None in rows without the Variable
+        :param variables: Dict[String, numpy.ndarray]
+        :param row_variables: Dict[String, Value]
+        :param row: Integer
+        :return: Nothing
+        """
+        for var_name in set(variables) | set(row_variables):
+            column = variables.get(var_name)
+            if column is None:
+                column = variables[var_name] = numpy.full(self.rows, None, dtype=object)
+
+            row_value = row_variables.get(var_name)
+            native = None if row_value is None else row_value.value
+            if column.dtype != object:
+                fits = row_value is not None and ColumnTypes.get(row_value.type) == column.dtype.name
+                if fits and row_value.type == Integer:
+                    fits = not outside(native, MaxColumnInteger)
+                if not fits:
+                    column = variables[var_name] = column.astype(object)
+            column[row] = native
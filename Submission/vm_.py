@@ -0,0 +1,134 @@
+import compiler_ as compiler
+import errors_ as errors
+import operators_ as operators
+import token_ as token
+
+Variable = token.TokenType.Variable
+
+# Operations by the index used in Bytecode arguments
+BinaryOperationTable = [operators.BinaryOperations[op_val] for op_val in operators.BinaryOperators]
+UnaryOperationTable = [operators.UnaryOperations[op_val] for op_val in operators.UnaryOperators]
+
+
+class VirtualMachine:
+    def __init__(self):
+        """
+        Create a new VirtualMachine, running Bytecode on a stack of Values
+        """
+        self.stack = []
+
+    def run(self, code, variables, output):
+        """
+        Run Bytecode instructions in order, there are no jumps so every instruction runs once
+        :param code: Bytecode
+        :param variables: Dict[String, Value]
+        :param output: OutputSink
+        :return: Nothing
+        """
+        # Bind everything the loop touches to locals
+        constants = code.constants
+        binary_operations = BinaryOperationTable
+        unary_operations = UnaryOperationTable
+        self.stack = stack = []
+        push = stack.append
+        pop = stack.pop
+        write_line = output.write_line
+
+        load_const = compiler.LOAD_CONST
+        binary_op = compiler.BINARY_OP
+        unary_op = compiler.UNARY_OP
+        store_name = compiler.STORE_NAME
+        pop_top = compiler.POP_TOP
+        print_value = compiler.PRINT
+        delete_name = compiler.DELETE_NAME
+        delete_node = compiler.DELETE_NODE
+
+        for opcode, arg in zip(code.opcodes, code.args):
+            # Push constant
+            if opcode == load_const:
+                push(constants[arg])
+
+            # Binary Operation, both Values are evaluated before resolving Variables
+            elif opcode == binary_op:
+                right = pop()
+                left = pop()
+
+                # LeftValue is Variable
+                if left.type == Variable:
+                    try:
+                        left = variables[left.value]
+                    except KeyError:
+                        raise errors.variable_assignment_error(left.value)
+
+                # RightValue is Variable
+                if right.type == Variable:
+                    try:
+                        right = variables[right.value]
+                    except KeyError:
+                        raise errors.variable_assignment_error(right.value)
+
+                push(binary_operations[arg](left, right))
+
+            # Assign Variable, the assigned Value is also the Value of the expression
+            elif opcode == store_name:
+                variables[constants[arg]] = stack[-1]
+
+            # Discard Value of an expression statement
+            elif opcode == pop_top:
+                pop()
+
+            # Printing an expression
+            elif opcode == print_value:
+                to_print = pop()
+
+                # Printing a single Variable
+                if to_print.type == Variable:
+                    # Does the Variable exist?
+                    try:
+                        write_line(variables[to_print.value].to_string())
+
+                    # Variable does not exist
+                    except KeyError:
+                        raise errors.print_variable_error(to_print.value, 'print')
+
+                # Print entire valid expression
+                else:
+                    write_line(to_print.to_string())
+
+            # Unary Operation
+            elif opcode == unary_op:
+                sub_value = pop()
+
+                # Value is Variable
+                if sub_value.type == Variable:
+                    # Does the Variable exist?
+                    try:
+                        sub_value = variables[sub_value.value]
+
+                    # Cannot unary non-existent Variable
+                    except KeyError:
+                        raise errors.unary_variable_error(sub_value, operators.UnaryOperators[arg])
+
+                push(unary_operations[arg](sub_value))
+
+            # Delete a Variable from the program memory
+            elif opcode == delete_name:
+                tk = constants[arg]
+
+                # Does the Variable exist?
+                try:
+                    variables.pop(tk.value)
+
+                # Attempt to delete a non-existent Variable or a non-Variable Token
+                except KeyError:
+                    if tk.type == Variable:
+                        raise errors.delete_variable_error(tk, 'del')
+                    raise errors.delete_token_error(tk, 'del')
+
+            # Attempt to delete Node
+            elif opcode == delete_node:
+                raise errors.delete_node_error(constants[arg], 'del')
+
+            # Provided AST/Node not valid
+            else:
+                raise errors.none_node_error()
@@ -0,0 +1,439 @@
+import os
+import sys
+import time
+from collections import deque
+
+import lexer_ as lexer
+import parallel_ as parallel
+import parser_ as parser
+import sink_ as sink
+
+# Statements run between checkpoints of the Variables, an edit re-runs at most this many statements before it
+CheckpointInterval = 64
+
+# Seconds between checks of the watched program file for changes
+PollInterval = 0.25
+
+
+def starts_segment(source, idx):
+    """
+    Can a segment start at idx? Segments start at the start of a line where a new statement starts,
+    except empty lines, which stay with the segment before them
+    :param source: String
+    :param idx: Integer
+    :return: Boolean
+    """
+    if idx == 0 or idx == len(source):
+        return True
+    return source[idx - 1] == '\n' and source[idx] != '\n' and parallel.starts_statement(source, idx)
+
+
+def split_segments(source, start, end):
+    """
+    Split part of a program, starting at a segment start, into segments at every line where a new statement starts
+    outside String literals, so each segment tokenizes and parses as it would within the whole program
+    :param source: String
+    :param start: Integer
+    :param end: Integer, a segment start or the end of source
+    :return: List[String]
+    """
+    texts = []
+    # String literals have no escaped '"', so a line break is inside one after an odd number of '"'
+    quotes = 0
+    counted = segment_start = idx = start
+    while True:
+        idx = source.find('\n', idx, end)
+        if idx == -1:
+            break
+        idx += 1
+
+        quotes += source.count('"', counted, idx)
+        counted = idx
+        if idx < end and quotes % 2 == 0 and starts_segment(source, idx):
+            texts.append(source[segment_start:idx])
+            segment_start = idx
+
+    if segment_start < end:
+        texts.append(source[segment_start:end])
+    return texts
+
+
+def same_variables(variables, other):
+    """
+    Do two program memories hold the same Variables, of the same TokenType and native value?
+    Values are compared by their repr, so -0.0 and 0.0 (which print differently) are not the same
+    :param variables: Dict[String, Value]
+    :param other: Dict[String, Value]
+    :return: Boolean
+    """
+    if variables.keys() != other.keys():
+        return False
+    for var_name, var_value in variables.items():
+        other_value = other[var_name]
+        if var_value is not other_value and (var_value.type != other_value.type or
+                                             var_value.text != other_value.text or
+                                             repr(var_value.value) != repr(other_value.value)):
+            return False
+    return True
+
+
+class Checkpoint:
+    def __init__(self, variables):
+        """
+        Create a new Checkpoint of the Variables before a block of statements, and the lines the block printed
+        :param variables: Dict[String, Value], a copy of the program memory
+        """
+        self.variables = variables
+        self.lines = []
+
+
+class Segment:
+    def __init__(self, text):
+        """
+        Create a new Segment, lines of a program tokenized and parsed on their own
+        :param text: String
+        """
+        self.text = text
+        # Statements of the lines, or None until parsed
+        self.statements = None
+        # Operands looked up in previous expressions, from statements of this or earlier Segments
+        self.prev_expr_lookups = 0
+        # Length of the Parser's previous expressions after this Segment
+        self.prev_expr_count = 0
+        # Checkpoint of the block of statements starting at this Segment
+        self.checkpoint = None
+
+
+class ProgramWatcher:
+    def __init__(self, prog_interpreter, checkpoint_interval=CheckpointInterval):
+        """
+        Create a new ProgramWatcher, executing a program again after each edit with the work proportional to
+        the edit. Lines are tokenized and parsed in Segments, and only changed Segments are parsed again.
+        The Variables are checkpointed every checkpoint_interval statements, so a run resumes at the checkpoint
+        before the first changed Segment, replaying what the statements before it printed. Once the Variables
+        after the edit match the last run and the rest of the program is unchanged, the rest of its output
+        is replayed instead of run. Statements are run with the Interpreter's engine, without optimizing them
+        :param prog_interpreter: Interpreter, printing to its output
+        :param checkpoint_interval: Integer
+        """
+        self.interpreter = prog_interpreter
+        self.checkpoint_interval = checkpoint_interval
+        self.lexer = lexer.Lexer()
+        self.parser = parser.Parser()
+        self.segments = []
+        # Variables and error of the last run, once it stopped
+        self.variables = dict()
+        self.error = None
+        # Work done by the last update
+        self.segments_parsed = 0
+        self.statements_run = 0
+        self.lines_replayed = 0
+
+    def reset(self):
+        """
+        Forget the last run, so the next update parses and runs the whole program
+        :return: Nothing
+        """
+        self.segments = []
+        self.variables = dict()
+        self.error = None
+
+    def match_segments(self, source):
+        """
+        Find the Segments of the last run unchanged at the start and at the end of a new source
+        :param source: String
+        :return: (Integer, Integer, Integer, Integer), Segments unchanged at the start and the offset in source
+        after them, and the first Segment unchanged through to the end and its offset in source
+        """
+        old = self.segments
+
+        # Segments unchanged from the start, the last one is only kept if a new statement starts after it.
+        # The last Segment of a program may end inside a String literal, which lines added after it continue
+        start = offset = 0
+        while start < len(old) and source.startswith(old[start].text, offset) and old[start].text.count('"') % 2 == 0:
+            offset += len(old[start].text)
+            start += 1
+        while not starts_segment(source, offset):
+            start -= 1
+            offset -= len(old[start].text)
+
+        # Segments unchanged through to the end, not overlapping those at the start
+        stop = len(old)
+        end = len(source)
+        while stop > start and end - len(old[stop - 1].text) >= offset and \
+                source.startswith(old[stop - 1].text, end - len(old[stop - 1].text)):
+            stop -= 1
+            end -= len(old[stop].text)
+
+        # Changed lines must end where a new statement starts, outside String literals
+        while stop < len(old) and not (source.count('"', offset, end) % 2 == 0 and starts_segment(source, end)):
+            end += len(old[stop].text)
+            stop += 1
+
+        return start, offset, stop, end
+
+    def get_prev_expr(self, segments, idx, count):
+        """
+        Get the Parser's previous expressions before a Segment, the last count statements of the Segments before it
+        :param segments: List[Segment]
+        :param idx: Integer
+        :param count: Integer
+        :return: deque[Node]
+        """
+        prev_expr = deque()
+        while len(prev_expr) < count:
+            idx -= 1
+            prev_expr.extendleft(reversed(segments[idx].statements))
+        while len(prev_expr) > count:
+            prev_expr.popleft()
+        return prev_expr
+
+    def parse_segments(self, segments, first):
+        """
+        Tokenize and parse every Segment from first which is not parsed, or which looks up previous expressions
+        that may have changed. Segments parsed again are replaced by new Segments
+        :param segments: List[Segment]
+        :param first: Integer
+        :return: Nothing
+        """
+        prev_expr_count = segments[first - 1].prev_expr_count if first else 0
+
+        for idx in range(first, len(segments)):
+            segment = segments[idx]
+
+            if segment.statements is None or segment.prev_expr_lookups:
+                segment = segments[idx] = Segment(segment.text)
+                segment.statements = self.parser.parse(segment.text, self.lexer.tokenize(segment.text))
+                segment.prev_expr_lookups = self.parser.prev_expr_lookups
+                self.segments_parsed += 1
+
+                # Operands were looked up in previous expressions, parse again with those of the Segments before
+                if segment.prev_expr_lookups and prev_expr_count:
+                    prev_expr = self.get_prev_expr(segments, idx, prev_expr_count)
+                    segment.statements = self.parser.parse(segment.text, self.lexer.tokenize(segment.text), prev_expr)
+                    prev_expr_count = len(prev_expr)
+                else:
+                    prev_expr_count += len(self.parser.prev_expr)
+
+            # Statements of Segments without lookups are all left in previous expressions
+            else:
+                prev_expr_count += len(segment.statements)
+            segment.prev_expr_count = prev_expr_count
+
+    def update(self, source):
+        """
+        Execute a program again after it changed, from the checkpoint before its first changed Segment
+        :param source: String
+        :return: Nothing
+        """
+        self.segments_parsed = 0
+        self.statements_run = 0
+        self.lines_replayed = 0
+
+        old = self.segments
+        start, offset, stop, end = self.match_segments(source)
+        segments = old[:start] + [Segment(text) for text in split_segments(source, offset, end)] + old[stop:]
+
+        try:
+            self.parse_segments(segments, start)
+
+        # Raise the first error of the whole program with its position, the next update runs it all again
+        except (SystemExit, Exception):
+            self.reset()
+            self.interpreter.variables = dict()
+            self.parser.parse(source, self.lexer.tokenize_buffer(source))
+            raise
+
+        self.segments = segments
+        # Segments from reused on are the Segments of the last run through to the end
+        reused = len(segments)
+        shift = len(old) - len(segments)
+        while reused > 0 and reused + shift > 0 and segments[reused - 1] is old[reused - 1 + shift]:
+            reused -= 1
+
+        # Variables before the first changed Segment, if the last run reached it with a checkpoint there
+        if start < len(old):
+            variables = old[start].checkpoint.variables if old[start].checkpoint is not None else None
+        else:
+            variables = self.variables if self.error is None else None
+
+        self.run_segments(start, reused, variables)
+
+    def run_segments(self, first, reused, variables):
+        """
+        Run the statements of the Segments from the first changed Segment, or the last checkpoint before it,
+        printing what the statements before it printed in the last run first
+        :param first: Integer, first changed Segment
+        :param reused: Integer, first of the Segments of the last run through to the end
+        :param variables: Dict[String, Value], the Variables before the first changed Segment, or None if unknown
+        :return: Nothing
+        """
+        prog_interpreter = self.interpreter
+        segments = self.segments
+
+        # Resume from the last checkpoint before the first changed Segment
+        resume = first
+        if variables is None:
+            resume -= 1
+            while resume > 0 and segments[resume].checkpoint is None:
+                resume -= 1
+            resume = max(resume, 0)
+            if resume < first and segments[resume].checkpoint is not None:
+                variables = segments[resume].checkpoint.variables
+            else:
+                variables = dict()
+
+        # Replay the output of the blocks before it
+        for segment in segments[:resume]:
+            if segment.checkpoint is not None:
+                self.write_lines(segment.checkpoint.lines)
+        prog_interpreter.variables = dict(variables)
+
+        converged = self.run_blocks(resume, reused)
+        if converged is None:
+            self.variables = dict(prog_interpreter.variables)
+            self.error = None
+            return
+
+        # Replay the output, Variables and error of the last run from where it converged
+        for segment in segments[converged:]:
+            if segment.checkpoint is not None:
+                self.write_lines(segment.checkpoint.lines)
+        prog_interpreter.variables = dict(self.variables)
+        if self.error is not None:
+            raise self.error
+
+    def run_blocks(self, resume, reused):
+        """
+        Run the statements of the Segments from resume in blocks, checkpointing the Variables before each block.
+        Blocks start at every block of the last run, and once a block holds checkpoint_interval statements
+        :param resume: Integer
+        :param reused: Integer, first of the Segments of the last run through to the end
+        :return: Integer, the Segment from which the rest of the program runs as in the last run, or None if
+        every statement was run
+        """
+        prog_interpreter = self.interpreter
+        segments = self.segments
+
+        block = []
+        block_start = resume
+        checkpoint = None
+        try:
+            for idx in range(resume, len(segments)):
+                segment = segments[idx]
+
+                if checkpoint is None or segment.checkpoint is not None or len(block) >= self.checkpoint_interval:
+                    if checkpoint is not None:
+                        self.run_block(block, checkpoint)
+
+                    # Rest of the program is unchanged, and runs from the same Variables as in the last run
+                    if idx >= reused and segment.checkpoint is not None and \
+                            same_variables(prog_interpreter.variables, segment.checkpoint.variables):
+                        return idx
+
+                    block = []
+                    block_start = idx
+                    checkpoint = segment.checkpoint = Checkpoint(dict(prog_interpreter.variables))
+                block.extend(segment.statements)
+
+            if checkpoint is not None:
+                self.run_block(block, checkpoint)
+
+        # Checkpoints after the error are not reached
+        except SystemExit as error:
+            for segment in segments[block_start + 1:]:
+                segment.checkpoint = None
+            self.variables = dict(prog_interpreter.variables)
+            self.error = error
+            raise
+
+        # Anything else (e.g. an interrupt) leaves no run to resume from
+        except BaseException:
+            self.reset()
+            raise
+
+        return None
+
+    def run_block(self, statements, checkpoint):
+        """
+        Run a block of statements, keeping the lines it prints in its checkpoint
+        :param statements: List[Node]
+        :param checkpoint: Checkpoint
+        :return: Nothing
+        """
+        prog_interpreter = self.interpreter
+        output = prog_interpreter.output
+        prog_interpreter.output = sink.MemorySink(checkpoint.lines)
+        try:
+            if statements:
+                self.statements_run += len(statements)
+                prog_interpreter.run(prog_interpreter.compile(statements))
+
+        # Lines printed before an error are written out too
+        finally:
+            prog_interpreter.output = output
+            for line in checkpoint.lines:
+                output.write_line(line)
+
+    def write_lines(self, lines):
+        """
+        Write lines printed by the last run to the Interpreter's output
+        :param lines: List[String]
+        :return: Nothing
+        """
+        write_line = self.interpreter.output.write_line
+        for line in lines:
+            write_line(line)
+        self.lines_replayed += len(lines)
+
+    def execute_file(self, path):
+        """
+        Execute a program file again, reporting the work it took on stderr. Errors are reported instead of raised
+        :param path: String
+        :return: Nothing
+        """
+        start = time.perf_counter()
+        try:
+            with open(path, 'r') as file:
+                self.update(file.read())
+        except FileNotFoundError:
+            print(f"--- PROGRAM ERROR ---\n"
+                  f"FileError: Program file not found\n"
+                  f"in File: '{path}'\n"
+                  f"--- PROGRAM ERROR ---", file=sys.stderr)
+        # Output printed before the error is written out first
+        except SystemExit as error:
+            self.interpreter.output.flush()
+            print(error.code, file=sys.stderr)
+        self.interpreter.output.flush()
+
+        statements = sum(len(segment.statements) for segment in self.segments)
+        print(f"Watch: {self.segments_parsed} of {len(self.segments)} segments parsed, "
+              f"{self.statements_run} of {statements} statements run, {self.lines_replayed} lines replayed "
+              f"in {time.perf_counter() - start:.3f} seconds", file=sys.stderr)
+
+    def watch(self, path, interval=PollInterval):
+        """
+        Execute a program file, and again every time it is saved, until interrupted
+        :param path: String
+        :param interval: Float, seconds between checks of the file for changes
+        :return: Nothing
+        """
+        last_state = None
+        try:
+            while True:
+                # Saving a file changes its modification time or its size
+                try:
+                    stat = os.stat(path)
+                    state = (stat.st_mtime_ns, stat.st_size)
+                except FileNotFoundError:
+                    state = None
+
+                if state != last_state:
+                    last_state = state
+                    self.execute_file(path)
+                time.sleep(interval)
+
+        # Interrupting (Ctrl+C) stops watching
+        except KeyboardInterrupt:
+            pass
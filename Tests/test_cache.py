@@ -0,0 +1,60 @@
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import cache_ as cache
+import operators_ as operators
+
+
+def imported_modules(module, found=None):
+    """
+    Find the modules of the Submission folder a module imports, directly or through other modules
+    :param module: Module
+    :param found: Set[Module], modules found so far
+    :return: Set[Module]
+    """
+    found = set() if found is None else found
+    folder = os.path.dirname(os.path.abspath(cache.__file__))
+    for attr in vars(module).values():
+        if isinstance(attr, types.ModuleType) and attr not in found and \
+                os.path.dirname(os.path.abspath(getattr(attr, '__file__', None) or '')) == folder:
+            found.add(attr)
+            imported_modules(attr, found)
+    return found
+
+
+class CacheVersionTest(unittest.TestCase):
+    def test_folded_operator_changes_version(self):
+        # Edit the division of a copy of operators_, as a changed Interpreter would fold 'print 1 / 0'
+        version = cache.get_version()
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, 'operators_.py')
+        shutil.copy(operators.__file__, path)
+        with open(path, 'a') as file:
+            file.write("\n\ndef divide(left_value, right_value):\n    return from_number(99.0)\n")
+
+        original = operators.__file__
+        operators.__file__ = path
+        try:
+            self.assertNotEqual(cache.get_version(), version)
+        finally:
+            operators.__file__ = original
+            shutil.rmtree(folder)
+        self.assertEqual(cache.get_version(), version)
+
+    def test_source_modules_cover_every_import(self):
+        # Everything the Lexer, Parser, Optimizer and Eliminator run can end up in a cached AST
+        used = set()
+        for module in (cache.lexer, cache.parser, cache.optimizer, cache.eliminator):
+            used.add(module)
+            imported_modules(module, used)
+        self.assertEqual(sorted(module.__name__ for module in used - set(cache.SourceModules)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
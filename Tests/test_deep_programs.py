@@ -0,0 +1,68 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import eliminator_ as eliminator
+import interpreter_ as interpreter
+import optimizer_ as optimizer
+import parser_ as parser
+import sink_ as sink
+
+# Operands of the long chains, deeper than the default recursion limit
+ChainLength = 5000
+
+
+def chain(operand, op_val, length=ChainLength):
+    """
+    Expression of an Operator applied left to right over the same operand
+    :param operand: String
+    :param op_val: String
+    :param length: Integer, number of operands
+    :return: String
+    """
+    return f" {op_val} ".join([operand] * length)
+
+
+class DeepProgramTest(unittest.TestCase):
+    def execute(self, source, **kwargs):
+        """
+        Execute a source and get its printed lines
+        :param source: String
+        :param kwargs: Interpreter arguments
+        :return: String
+        """
+        output = sink.MemorySink()
+        interpreter.Interpreter(output=output, **kwargs).execute(source)
+        return output.getvalue()
+
+    def test_optimize_long_chain(self):
+        source = f"print {chain('1', '+')}\nx = true\nprint {chain('x', 'and')}\n"
+        self.assertEqual(self.execute(source, engine='stack', optimize=True), f"{ChainLength}\ntrue\n")
+
+    def test_recursive_engines_report_depth(self):
+        source = f"x = 1\nprint {chain('x', '+')}\n"
+        for engine in interpreter.Engines:
+            with self.subTest(engine=engine):
+                if engine == 'stack':
+                    self.assertEqual(self.execute(source, engine=engine), f"{ChainLength}\n")
+                    continue
+                with self.assertRaises(SystemExit) as raised:
+                    self.execute(source, engine=engine)
+                self.assertIn("'--engine stack'", str(raised.exception.code))
+
+    def test_optimizer_folds_long_chain(self):
+        ast = interpreter.Interpreter().parse(f"y = {chain('2', '*', 60)} + {chain('1', '+')}")
+        statement = optimizer.Optimizer().optimize(ast)[0]
+        self.assertIsInstance(statement.val_node, parser.ValueNode)
+        self.assertEqual(statement.val_node.value.value, 2 ** 60 + ChainLength)
+
+    def test_eliminator_types_long_chain(self):
+        # The first assignment cannot raise and is overwritten, the last may raise as 'q' does not exist
+        ast = interpreter.Interpreter().parse(f"x = {chain('1', '+')}\nx = 2\ny = {chain('1', '-')} - q\nprint x")
+        self.assertEqual(eliminator.Eliminator().eliminate(ast), ast[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
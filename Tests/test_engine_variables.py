@@ -0,0 +1,76 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import sink_ as sink
+
+# Programs stopped by a runtime error, after changing Variables in every way an engine stores them
+FailingPrograms = [
+    "x = 5\nprint x\nprint q",
+    "print q\nx = 5",
+    "x = 1\ny = x * 2\nz = \"a\" + y",
+    "x = 1\nx = x + 1\ndel x\ny = 3\nprint 1 + \"a\"",
+    "x = 2 != 2\ny = x or true\nz = \"s\" + \"u\"\nz = z + \"t\"\nprint z - 1",
+    "x = 3.5\ny = (x - 1) * 2\ndel y\ny = x > 1\nx = \"a\"\ndel q",
+    "x = -8\ny = x ** 0.5\nz = 1\nprint z + \"a\"",
+    "x = 1\ny = x + 1\nprint del x\nz = 3\nprint q",
+]
+
+# Programs overwriting Variables, so optimizing eliminates assignments, and leaving Variables at the end
+OverwritingPrograms = [
+    "c = -1\nc = 0.0\nd = 5\nprint d",
+    "x = 1\nx = 2\ndel x",
+    "x = 1\ndel x\nx = 2\ny = x + 1\ny = 3",
+    "x = 1\nx = 2\nprint x + \"a\"\nx = 3",
+    "x = 1\nx = 2\ndel q\nx = 3",
+]
+
+
+class EngineVariablesTest(unittest.TestCase):
+    def get_variables(self, engine, sources, optimize=False, raises=True):
+        """
+        Execute sources in order on one Interpreter, each stopped by an error, and get its Variables
+        :param engine: String
+        :param sources: List[String]
+        :param optimize: Boolean
+        :param raises: Boolean, whether every source is stopped by an error
+        :return: Dict[String, (Object, TokenType)]
+        """
+        prog_interpreter = interpreter.Interpreter(engine=engine, output=sink.MemorySink(), optimize=optimize)
+        for source in sources:
+            try:
+                prog_interpreter.execute(source)
+            except SystemExit:
+                continue
+            self.assertFalse(raises)
+        return {var_name: (var_value.value, var_value.type) for var_name, var_value in
+                prog_interpreter.variables.items()}
+
+    def test_variables_after_error(self):
+        for source in FailingPrograms:
+            expected = self.get_variables('tree', [source])
+            for engine in interpreter.Engines:
+                with self.subTest(source=source, engine=engine):
+                    self.assertEqual(self.get_variables(engine, [source]), expected)
+
+    def test_variables_after_errors_in_a_row(self):
+        # Every program starts from the Variables the one before it stopped with
+        expected = self.get_variables('tree', FailingPrograms)
+        for engine in interpreter.Engines:
+            with self.subTest(engine=engine):
+                self.assertEqual(self.get_variables(engine, FailingPrograms), expected)
+
+    def test_optimized_variables(self):
+        # Eliminating dead statements keeps the Variables left when the program ends or raises
+        for source in FailingPrograms + OverwritingPrograms:
+            expected = self.get_variables('tree', [source], raises=False)
+            for engine in interpreter.Engines:
+                with self.subTest(source=source, engine=engine):
+                    self.assertEqual(self.get_variables(engine, [source], optimize=True, raises=False), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import sink_ as sink
+
+# Variable names that are not Python identifiers, or that map to the same characters
+VariableNames = ['@', 'a.b', 'a_x2eb', '$', 'é', 'x_1', 'x']
+
+
+class PythonSourceTest(unittest.TestCase):
+    def test_source_compiles(self):
+        # Assigning computed Values makes every Variable a Python local
+        source = "\n".join(f"{var_name} = 1 < {idx}" for idx, var_name in enumerate(VariableNames))
+        prog_interpreter = interpreter.Interpreter(engine='python', output=sink.MemorySink())
+        code = compile(prog_interpreter.transpile(source), '<source>', 'exec')
+
+        # Every Variable has its own local
+        function = [const for const in code.co_consts if hasattr(const, 'co_varnames')][0]
+        self.assertEqual(len(set(function.co_varnames) - {'variables', 'error'}), len(VariableNames))
+
+    def test_source_runs_as_transpiled(self):
+        source = "\n".join(f"{var_name} = 2 * {idx} - 1" for idx, var_name in enumerate(VariableNames))
+        prog_interpreter = interpreter.Interpreter(engine='python', output=sink.MemorySink())
+        namespace = prog_interpreter.compile(prog_interpreter.parse(source)).namespace
+        exec(prog_interpreter.transpile(source), namespace)
+        idx, variables = namespace['program'](dict())
+
+        prog_interpreter.execute(source)
+        self.assertEqual(idx, len(VariableNames))
+        self.assertEqual({var_name: var_value.value for var_name, var_value in variables.items()},
+                         {var_name: var_value.value for var_name, var_value in prog_interpreter.variables.items()})
+
+
+if __name__ == "__main__":
+    unittest.main()
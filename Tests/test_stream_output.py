@@ -0,0 +1,83 @@
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Submission'))
+
+import interpreter_ as interpreter
+import sink_ as sink
+
+
+class CountingFile(io.StringIO):
+    def __init__(self):
+        """
+        Create a new CountingFile, a String file counting the calls written out through it
+        """
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class CountingSink(sink.BufferedSink):
+    def __init__(self, flush_size=sink.DefaultFlushSize):
+        """
+        Create a new CountingSink, a BufferedSink writing to a CountingFile
+        :param flush_size: Integer
+        """
+        super().__init__(flush_size)
+        self.file = CountingFile()
+
+    def get_file(self):
+        return self.file
+
+
+class StreamOutputTest(unittest.TestCase):
+    def execute_stream(self, engine, source, output):
+        """
+        Execute a source one statement at a time, as main.py --stream does
+        :param engine: String
+        :param source: String
+        :param output: OutputSink
+        :return: Interpreter
+        """
+        prog_interpreter = interpreter.Interpreter(engine=engine, output=output)
+        prog_interpreter.execute_stream(source.splitlines(True))
+        return prog_interpreter
+
+    def test_stream_flushes_once(self):
+        source = "".join(f"print {idx}\n" for idx in range(1000))
+        for engine in interpreter.Engines:
+            with self.subTest(engine=engine):
+                output = CountingSink()
+                self.execute_stream(engine, source, output)
+                self.assertEqual((output.file.writes, output.file.flushes), (1, 1))
+                self.assertEqual(output.file.getvalue(), "".join(f"{idx}\n" for idx in range(1000)))
+
+    def test_stream_flush_size(self):
+        # 1000 lines of 4 characters, a write every 400 characters
+        source = "".join(f"print {idx % 10}00\n" for idx in range(1000))
+        output = CountingSink(flush_size=400)
+        self.execute_stream('tree', source, output)
+        self.assertEqual(output.file.writes, 10)
+
+    def test_stream_error_flushes_printed_lines(self):
+        for engine in interpreter.Engines:
+            with self.subTest(engine=engine):
+                output = CountingSink()
+                with self.assertRaises(SystemExit):
+                    self.execute_stream(engine, "x = 5\nprint x\nprint 2\nprint q\nprint 3\n", output)
+                self.assertEqual(output.file.getvalue(), "5\n2\n")
+                self.assertEqual((output.file.writes, output.file.flushes), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()